@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""向聴数・和了判定・待ち牌の一括評価の計測スクリプト
+
+無作為な手牌（13枚・14枚）について、1枚ずつの計算（ShantenCalculator）と
+NumPyによる一括評価（logic/batch.py）の1秒あたりの評価件数を比較します。
+どちらもキャッシュを温めた2回目の計測値を表示します。
+
+実行方法（NumPyが必要）:
+poetry run python scripts/bench_batch.py [手牌の数] [テーブルファイル]
+（テーブルファイルがなければ生成して書き出します）
+"""
+
+import random
+import sys
+import time
+
+from mahjong_ai.logic.batch import BatchEvaluator
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.logic.table_file import open_table_file
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import TILE_KIND_COUNT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def make_rows(count: int, seed: int = 0) -> list:
+    """54枚の山牌から無作為に13枚・14枚を選んだ枚数ベクトルを作成"""
+    rng = random.Random(seed)
+    pool = [tile_id for tile_id in range(9) for _ in range(6)]
+    rows = []
+    for index in range(count):
+        row = [0] * TILE_KIND_COUNT
+        for tile_id in rng.sample(pool, 13 + index % 2):
+            row[tile_id] += 1
+        rows.append(row)
+    return rows
+
+
+def run_scalar(calculator: ShantenCalculator, hands: list) -> None:
+    """1枚ずつ向聴数・和了判定・待ち牌を計算"""
+    for hand in hands:
+        calculator.calculate_shanten(hand)
+        calculator.winning_checker.is_winning_hand(hand)
+        if hand.size % 3 == 1:
+            calculator.shanten_after_each_draw(hand)
+
+
+def main() -> None:
+    """1枚ずつの計算と一括評価の速度を比較"""
+    if np is None:
+        print("NumPyがインストールされていません（poetry install --extras web）")
+        return
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    table_file = open_table_file(sys.argv[2] if len(sys.argv) > 2 else None, regenerate=True)
+
+    rows = make_rows(count)
+    hands = [Hand.from_counts(row) for row in rows]
+    matrix = np.array(rows, dtype=np.uint8)
+
+    calculator = ShantenCalculator()
+    evaluator = BatchEvaluator(table_file, calculator)
+
+    print(f"=== 一括評価（{count}手） ===")
+    for label, run in [
+        ("1枚ずつ（ShantenCalculator）", lambda: run_scalar(calculator, hands)),
+        ("一括（BatchEvaluator）", lambda: evaluator.evaluate(matrix)),
+    ]:
+        run()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{label}: {elapsed:.3f}秒 ({count / elapsed:,.0f}手/秒)")
+
+
+if __name__ == "__main__":
+    main()
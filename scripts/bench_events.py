@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""構造化イベントファイルの書き込み・読み込み計測スクリプト
+
+ツモ・打牌を模したイベントをJSONL形式とバイナリ形式で書き込み、
+ファイルサイズと1秒あたりの書き込み・読み込み件数を表示します。
+
+実行方法:
+poetry run python scripts/bench_events.py [イベント数]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mahjong_ai.game.events import BinaryEventSink, EventType, GameEvent, JsonlEventSink, read_events
+
+
+def main() -> None:
+    """形式ごとのサイズと書き込み・読み込み速度を表示"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(0)
+    events = [
+        GameEvent(EventType.DRAW if i % 2 == 0 else EventType.DISCARD, i // 2 % 50 + 1, (rng.randrange(9),))
+        for i in range(count)
+    ]
+
+    print(f"=== イベントファイル（{count}件） ===")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, sink_class, name in [("JSONL", JsonlEventSink, "events.jsonl"), ("バイナリ", BinaryEventSink, "events.bin")]:
+            path = Path(tmp_dir) / name
+
+            start = time.perf_counter()
+            with sink_class(path) as sink:
+                for event in events:
+                    sink.write(event)
+            write_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            read_count = sum(1 for _ in read_events(path))
+            read_time = time.perf_counter() - start
+
+            size = path.stat().st_size
+            print(
+                f"{label}: {size / count:.1f} バイト/件, 書き込み {count / write_time:,.0f} 件/秒, "
+                f"読み込み {read_count / read_time:,.0f} 件/秒"
+            )
+
+
+if __name__ == "__main__":
+    main()
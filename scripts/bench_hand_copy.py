@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""手牌の複製・一括作成の計測スクリプト
+
+14枚の手牌について、1秒あたりの複製・作成回数を方法ごとに表示します。
+「1枚ずつ追加」は牌を1枚ずつ add_tile する従来の作成方法です。
+
+実行方法:
+poetry run python scripts/bench_hand_copy.py [回数]
+"""
+
+import sys
+import timeit
+
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import Tile
+
+
+def add_one_by_one(tiles: list) -> Hand:
+    """牌を1枚ずつ追加して手牌を作成（従来の方法）"""
+    hand = Hand()
+    for tile in tiles:
+        hand.add_tile(tile)
+    return hand
+
+
+def per_second(func, number: int) -> float:
+    """funcの1秒あたりの実行回数（5回計測した最速値）"""
+    return number / min(timeit.repeat(func, number=number, repeat=5))
+
+
+def main() -> None:
+    """方法ごとに1秒あたりの複製・作成回数を表示"""
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    hand = Hand.from_sorted([Tile(suit="sou", value=value) for value in [1, 1, 1, 2, 3, 4, 5, 5, 6, 7, 8, 9, 9, 9]])
+    tiles = hand.tiles
+    counts = hand.counts_view().tobytes()
+
+    cases = [
+        ("1枚ずつ追加", lambda: add_one_by_one(tiles)),
+        ("copy()", hand.copy),
+        ("Hand(tiles)", lambda: Hand(tiles)),
+        ("Hand.from_counts", lambda: Hand.from_counts(counts)),
+        ("Hand.from_sorted", lambda: Hand.from_sorted(tiles)),
+    ]
+    print(f"14枚の手牌, {number}回")
+    for name, func in cases:
+        print(f"  {name:<18} {per_second(func, number):>12,.0f} 回/秒")
+
+
+if __name__ == "__main__":
+    main()
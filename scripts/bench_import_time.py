@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""起動時間（importの所要時間）の計測スクリプト
+
+`python -c "import mahjong_ai.game.game_engine"` を空の作業ディレクトリで
+繰り返し実行し、インタプリタ起動のみの場合との差をimportの所要時間として表示します。
+あわせて、importだけでログディレクトリなどのファイルが作成されないことを確認します。
+
+実行方法:
+poetry run python scripts/bench_import_time.py [実行回数] [モジュール名]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def measure(code: str, runs: int, cwd: str) -> List[float]:
+    """python -c code をruns回実行し、各回の秒数を返す"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env, check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    """インタプリタ起動のみとモジュールのimportの所要時間を比較"""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    module = sys.argv[2] if len(sys.argv) > 2 else "mahjong_ai.game.game_engine"
+
+    with tempfile.TemporaryDirectory() as cwd:
+        # 1回目はバイトコードのキャッシュ作成を含むため計測から除く
+        measure(f"import {module}", 1, cwd)
+        baseline = measure("pass", runs, cwd)
+        imported = measure(f"import {module}", runs, cwd)
+        created = sorted(os.listdir(cwd))
+
+    baseline_ms = statistics.median(baseline) * 1000
+    imported_ms = statistics.median(imported) * 1000
+    print(f"実行回数: {runs}")
+    print(f"  起動のみ:           中央値 {baseline_ms:7.1f} ms")
+    print(f"  import {module}: 中央値 {imported_ms:7.1f} ms（最小 {min(imported) * 1000:.1f} ms）")
+    print(f"  importの所要時間:   {imported_ms - baseline_ms:7.1f} ms")
+    print(f"  作成されたファイル: {created if created else 'なし'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""ログ出力のスループット計測スクリプト
+
+同じ書式のログレコードを連続で出力し、1秒あたりのレコード数を
+同期書き込み（logging.FileHandler）と非同期出力（AsyncLogBackend）で比較します。
+呼び出し側の時間（ゲームループが待たされる時間）と、ファイルへ全て書き終えるまでの
+時間を分けて表示します。
+
+実行方法:
+poetry run python scripts/bench_log_throughput.py [レコード数]
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Tuple
+
+from mahjong_ai.utils.async_logging import OVERFLOW_BLOCK, AsyncLogBackend
+
+FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+
+
+def emit_records(logger: logging.Logger, records: int) -> float:
+    """records件のログを出力し、呼び出し側でかかった秒数を返す"""
+    start = time.perf_counter()
+    for i in range(records):
+        logger.info("アクション: 打牌 - 牌: %s, ターン: %d", "5s", i)
+    return time.perf_counter() - start
+
+
+def measure_sync(log_file: Path, records: int) -> Tuple[float, float]:
+    """同期書き込みの(呼び出し側の秒数, 書き終えるまでの秒数)を計測"""
+    logger = logging.getLogger("bench_sync")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handler = logging.FileHandler(log_file, encoding="utf-8")
+    handler.setFormatter(logging.Formatter(FORMAT))
+    logger.addHandler(handler)
+
+    caller = emit_records(logger, records)
+    handler.close()
+    logger.removeHandler(handler)
+    return caller, caller
+
+
+def measure_async(log_file: Path, records: int, overflow: str, batch_size: int) -> Tuple[float, float]:
+    """非同期出力の(呼び出し側の秒数, 書き終えるまでの秒数)を計測"""
+    logger = logging.getLogger(f"bench_async_{overflow}_{batch_size}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    backend = AsyncLogBackend(
+        log_file, formatter=logging.Formatter(FORMAT), max_queue_size=records, overflow=overflow, batch_size=batch_size
+    )
+    logger.addHandler(backend.queue_handler)
+    backend.start()
+
+    start = time.perf_counter()
+    caller = emit_records(logger, records)
+    backend.stop()
+    total = time.perf_counter() - start
+    logger.removeHandler(backend.queue_handler)
+    return caller, total
+
+
+def main() -> None:
+    """出力方式ごとのスループットを表示"""
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print(f"=== ログ出力のスループット（{records}レコード） ===")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cases = [
+            ("同期 FileHandler", lambda path: measure_sync(path, records)),
+            ("非同期 バッチ1", lambda path: measure_async(path, records, OVERFLOW_BLOCK, 1)),
+            ("非同期 バッチ256", lambda path: measure_async(path, records, OVERFLOW_BLOCK, 256)),
+        ]
+        for index, (label, measure) in enumerate(cases):
+            caller, total = measure(Path(tmp_dir) / f"bench_{index}.log")
+            print(f"{label}: 呼び出し側 {records / caller:,.0f} 件/秒, 書き込み完了まで {records / total:,.0f} 件/秒")
+
+
+if __name__ == "__main__":
+    main()
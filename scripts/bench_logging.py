@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""ログ出力のオーバーヘッド計測スクリプト
+
+GameEngineでツモ・打牌（ツモ切り）を繰り返し、1ターンあたりの処理時間を
+ログ設定ごとに計測します。画面出力は捨てています。
+
+実行方法:
+poetry run python scripts/bench_logging.py [ターン数]
+"""
+
+import contextlib
+import io
+import logging
+import sys
+import time
+
+from mahjong_ai.game.game_engine import GameEngine
+from mahjong_ai.utils.logger import game_logger
+
+
+def measure_turns(engine: GameEngine, turns: int) -> float:
+    """ツモ切りをturns回行い、1ターンあたりの秒数を返す"""
+    elapsed = 0.0
+    done = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        while done < turns:
+            engine.reset_game()
+            engine.start_game()
+            start = time.perf_counter()
+            while done < turns and engine.can_draw():
+                drawn_tile = engine.draw_tile()
+                engine.discard_tile(drawn_tile)
+                done += 1
+            elapsed += time.perf_counter() - start
+    return elapsed / turns
+
+
+def main() -> None:
+    """ログ設定ごとに1ターンあたりの処理時間を表示"""
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    engine = GameEngine()
+
+    # 向聴数テーブルを温めてから計測
+    measure_turns(engine, 200)
+
+    cases = [
+        ("全ログ出力（DEBUG）", logging.DEBUG, False),
+        ("INFOを抑制（WARNING）", logging.WARNING, False),
+        ("性能モード", logging.DEBUG, True),
+    ]
+
+    print(f"=== ログ出力のオーバーヘッド（{turns}ターン） ===")
+    for label, level, performance_mode in cases:
+        game_logger.set_level(level)
+        game_logger.set_performance_mode(performance_mode)
+        per_turn = measure_turns(engine, turns)
+        print(f"{label}: {per_turn * 1e6:.1f} µs/ターン")
+
+    game_logger.set_level(logging.DEBUG)
+    game_logger.set_performance_mode(False)
+
+
+if __name__ == "__main__":
+    main()
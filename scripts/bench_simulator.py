@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""自己対局シミュレーターの処理速度の計測スクリプト
+
+打牌方針ごとに1プロセス（1コア）で自己対局を行い、1秒あたりの対局数が
+目標値（TARGET_RATES）以上であることを確認します。山牌プールの生成（シャッフル）も
+計測に含めます（ParallelRunner のバッチと同じ条件）。キャッシュを温めた2回目の計測値を使います。
+
+目標値は「1コアあたり毎秒数万局」から、CPythonで1局ごとに54枚をシャッフルする
+条件で達成できる値に下げたものです（README のシミュレーターの節を参照）。
+
+実行方法:
+poetry run python scripts/bench_simulator.py [対局数] [テーブルファイル]
+（テーブルファイルがなければ生成して書き出します。目標値を下回った方針があれば終了コード1）
+"""
+
+import random
+import sys
+import time
+
+from mahjong_ai.game.wall_tiles import DealPool, WallTiles
+from mahjong_ai.logic.table_file import load_table_file
+from mahjong_ai.sim.policies import create_policy
+from mahjong_ai.sim.simulator import Simulator
+
+# 打牌方針ごとの1コアあたりの目標値（局/秒、テーブルファイルを読み込んだ場合）
+TARGET_RATES = {
+    "tsumogiri": 5000,
+    "random": 2500,
+    "shanten": 2500,
+    "ukeire": 1200,
+}
+
+
+def measure(policy_name: str, games: int, seed: int) -> float:
+    """山牌プールの生成を含めてgames局を対局し、1秒あたりの対局数を返す"""
+    simulator = Simulator(policy=create_policy(policy_name, random.Random(seed)))
+    # キャッシュを温める
+    simulator.wall = WallTiles(deal_pool=DealPool(games, seed=seed))
+    simulator.run(games)
+
+    start = time.perf_counter()
+    simulator.wall = WallTiles(deal_pool=DealPool(games, seed=seed + 1))
+    simulator.run(games)
+    return games / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """打牌方針ごとの処理速度を表示し、目標値と比較"""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    load_table_file(sys.argv[2] if len(sys.argv) > 2 else None, regenerate=True)
+
+    print(f"=== 自己対局の処理速度（1コア, {games}局） ===")
+    failed = []
+    for policy_name, target in TARGET_RATES.items():
+        rate = measure(policy_name, games, seed=1)
+        status = "OK" if rate >= target else "NG"
+        print(f"{policy_name}: {rate:,.0f} 局/秒（目標 {target:,} 局/秒以上） {status}")
+        if rate < target:
+            failed.append(policy_name)
+
+    if failed:
+        print(f"目標値を下回りました: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
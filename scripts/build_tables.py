@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""スート分解テーブルのファイルを生成するスクリプト
+
+ShantenTable の向聴数と WinningChecker の完全形集合を事前計算して
+テーブルファイルに書き出し、生成時間とファイルからの読み込み時間を表示します。
+
+実行方法:
+poetry run python scripts/build_tables.py [出力ファイル]
+（省略時は環境変数 MAHJONG_AI_TABLE_FILE、なければ ~/.cache/mahjong_ai/ 以下）
+"""
+
+import sys
+import time
+
+from mahjong_ai.logic.shanten_table import ShantenTable
+from mahjong_ai.logic.table_file import SuitTableFile, build_table_file, default_table_path
+
+
+def main() -> None:
+    """テーブルファイルを生成して読み込み時間を表示"""
+    path = sys.argv[1] if len(sys.argv) > 1 else default_table_path()
+
+    start = time.perf_counter()
+    path = build_table_file(path)
+    build_time = time.perf_counter() - start
+    print(f"生成: {path} ({path.stat().st_size / 1e6:.1f}MB, {build_time:.2f}秒)")
+
+    start = time.perf_counter()
+    table_file = SuitTableFile(path)
+    table = ShantenTable()
+    table.attach_values(table_file.shanten_values, table_file.overflow_values)
+    suits = table_file.complete_suits()
+    load_time = time.perf_counter() - start
+    print(f"読み込み（mmap + チェックサム検証 + 完全形集合）: {load_time * 1000:.1f}ミリ秒")
+    print(f"完全形: 面子のみ {len(suits[0])}, 雀頭付き {len(suits[1])}")
+
+    table.attach_values(None)
+    table_file.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""構造化ゲームイベントと出力先（JSONL・バイナリ）"""
+
+import json
+import struct
+from abc import ABC, abstractmethod
+from enum import IntEnum
+from pathlib import Path
+from typing import IO, Iterator, List, NamedTuple, Optional, Sequence, Union
+
+# バイナリ形式のファイル先頭（識別子 + 形式バージョン）
+BINARY_MAGIC = b"MJEV"
+BINARY_VERSION = 1
+BINARY_HEADER = BINARY_MAGIC + bytes([BINARY_VERSION])
+
+# バイナリ形式の各レコードの長さ（本体のバイト数、リトルエンディアン16bit）
+_LENGTH = struct.Struct("<H")
+
+# バイナリ形式のレコード本体の固定部（イベント種別, ターン数）
+_FIXED = struct.Struct("<BH")
+
+# 読み込み時のバッファサイズ
+READ_BUFFER_SIZE = 1 << 20
+
+
+class EventType(IntEnum):
+    """ゲームイベントの種別（値はバイナリ形式の種別番号）"""
+
+    DEAL = 0  # 配牌（tiles: 配牌13枚）
+    DRAW = 1  # ツモ（tiles: ツモ牌）
+    DISCARD = 2  # 打牌（tiles: 打牌）
+    RIICHI = 3  # リーチ宣言打牌（tiles: 打牌）
+    KAN = 4  # 暗槓（tiles: 暗槓した牌, 嶺上牌）
+    WIN = 5  # ツモ和了（tiles: 和了牌）
+    RYUUKYOKU = 6  # 流局（tiles: なし）
+
+
+# JSONL形式での種別名（小文字）と種別の対応表
+_TYPE_BY_NAME = {event_type.name.lower(): event_type for event_type in EventType}
+
+
+class GameEvent(NamedTuple):
+    """1件のゲームイベント
+
+    大量のイベントを生成・読み込みするため、タプルとして軽量に扱います。
+
+    Attributes:
+        type: イベントの種別
+        turn: イベント発生時のターン数
+        tiles: 関係する牌のtile_id
+    """
+
+    type: EventType
+    turn: int
+    tiles: Sequence[int] = ()
+
+    def to_dict(self) -> dict:
+        """JSONL形式の1行分の辞書を取得
+
+        Returns:
+            {"type": 種別名, "turn": ターン数, "tiles": tile_idのリスト}
+        """
+        return {"type": self.type.name.lower(), "turn": self.turn, "tiles": list(self.tiles)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameEvent":
+        """JSONL形式の辞書からイベントを復元
+
+        Args:
+            data: to_dict() 形式の辞書
+
+        Returns:
+            復元したイベント
+
+        Raises:
+            ValueError: 未知の種別の場合
+        """
+        event_type = _TYPE_BY_NAME.get(data["type"])
+        if event_type is None:
+            raise ValueError(f"未知のイベント種別です: {data['type']}")
+        return cls(event_type, data["turn"], tuple(data.get("tiles", ())))
+
+
+class EventSink(ABC):
+    """ゲームイベントの出力先の基底クラス
+
+    GameEngine.add_event_sink() で登録すると、イベント発生ごとに write が
+    呼び出されます。with文で使用すると終了時に close されます。
+    """
+
+    @abstractmethod
+    def write(self, event: GameEvent) -> None:
+        """イベントを1件出力
+
+        Args:
+            event: 出力するイベント
+        """
+
+    def flush(self) -> None:
+        """バッファ中のイベントを書き出す"""
+
+    def close(self) -> None:
+        """出力を終了"""
+
+    def __enter__(self) -> "EventSink":
+        """with文の開始時に出力先自身を返す"""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """with文の終了時に出力を終了"""
+        self.close()
+
+
+class MemoryEventSink(EventSink):
+    """イベントをメモリ上のリストに保持する出力先
+
+    Attributes:
+        events: 受け取ったイベントのリスト
+    """
+
+    def __init__(self) -> None:
+        """出力先を初期化"""
+        self.events: List[GameEvent] = []
+
+    def write(self, event: GameEvent) -> None:
+        """イベントをリストに追加"""
+        self.events.append(event)
+
+
+class JsonlEventSink(EventSink):
+    """イベントを1行1件のJSONで書き込む出力先"""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """ファイルを開く（既存の内容は上書き）
+
+        Args:
+            path: 出力するファイル
+        """
+        self.path = Path(path)
+        self._file: IO[str] = open(self.path, "w", encoding="utf-8")
+
+    def write(self, event: GameEvent) -> None:
+        """イベントを1行書き込む"""
+        self._file.write(json.dumps(event.to_dict(), separators=(",", ":")) + "\n")
+
+    def flush(self) -> None:
+        """バッファ中のイベントを書き出す"""
+        self._file.flush()
+
+    def close(self) -> None:
+        """ファイルを閉じる"""
+        self._file.close()
+
+
+class BinaryEventSink(EventSink):
+    """イベントを長さ付きのバイナリレコードで書き込む出力先
+
+    ファイルは BINARY_HEADER で始まり、続いて各イベントが
+    「本体の長さ(16bit) + 種別(8bit) + ターン数(16bit) + tile_id列(各8bit)」で並びます。
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """ファイルを開いてヘッダーを書き込む（既存の内容は上書き）
+
+        Args:
+            path: 出力するファイル
+        """
+        self.path = Path(path)
+        self._file: IO[bytes] = open(self.path, "wb")
+        self._file.write(BINARY_HEADER)
+
+    def write(self, event: GameEvent) -> None:
+        """イベントを1レコード書き込む"""
+        body = _FIXED.pack(event.type, event.turn) + bytes(event.tiles)
+        self._file.write(_LENGTH.pack(len(body)) + body)
+
+    def flush(self) -> None:
+        """バッファ中のイベントを書き出す"""
+        self._file.flush()
+
+    def close(self) -> None:
+        """ファイルを閉じる"""
+        self._file.close()
+
+
+def _read_binary(stream: IO[bytes]) -> Iterator[GameEvent]:
+    """バイナリ形式のレコードを順に読み込む（ヘッダーは読み込み済み）"""
+    read = stream.read
+    unpack_length = _LENGTH.unpack
+    unpack_fixed = _FIXED.unpack_from
+    fixed_size = _FIXED.size
+    types = list(EventType)
+
+    while True:
+        prefix = read(_LENGTH.size)
+        if not prefix:
+            return
+        if len(prefix) < _LENGTH.size:
+            raise ValueError("イベントファイルが途中で切れています")
+        (length,) = unpack_length(prefix)
+        body = read(length)
+        if len(body) < length:
+            raise ValueError("イベントファイルが途中で切れています")
+        type_value, turn = unpack_fixed(body)
+        yield GameEvent(types[type_value], turn, tuple(body[fixed_size:]))
+
+
+def _read_jsonl(stream: IO[bytes]) -> Iterator[GameEvent]:
+    """JSONL形式の行を順に読み込む"""
+    for line in stream:
+        if line.strip():
+            yield GameEvent.from_dict(json.loads(line))
+
+
+def read_events(path: Union[str, Path]) -> Iterator[GameEvent]:
+    """イベントファイルを先頭から1件ずつ読み込む
+
+    ファイル全体は読み込まず、バッファ単位で読みながらイベントを返すため、
+    大量のイベントを含むファイルでもメモリ使用量は一定です。
+    形式（バイナリ・JSONL）はファイル先頭から自動で判別します。
+
+    Args:
+        path: 読み込むファイル
+
+    Yields:
+        ファイルに記録された順のイベント
+
+    Raises:
+        ValueError: 非対応のバージョン、またはファイルが途中で切れている場合
+    """
+    with open(path, "rb", buffering=READ_BUFFER_SIZE) as stream:
+        head = stream.peek(len(BINARY_HEADER))[: len(BINARY_HEADER)]
+        if head.startswith(BINARY_MAGIC):
+            stream.read(len(BINARY_HEADER))
+            if head[len(BINARY_MAGIC):] != bytes([BINARY_VERSION]):
+                raise ValueError(f"非対応のイベントファイルのバージョンです: {head[len(BINARY_MAGIC):]!r}")
+            yield from _read_binary(stream)
+        else:
+            yield from _read_jsonl(stream)
+
+
+def open_event_sink(path: Union[str, Path], binary: Optional[bool] = None) -> EventSink:
+    """ファイル名から出力先を作成
+
+    Args:
+        path: 出力するファイル
+        binary: バイナリ形式にするかどうか（Noneの場合は拡張子 .jsonl ならJSONL、それ以外はバイナリ）
+
+    Returns:
+        ファイルの出力先
+    """
+    if binary is None:
+        binary = Path(path).suffix != ".jsonl"
+    return BinaryEventSink(path) if binary else JsonlEventSink(path)
@@ -1,14 +1,27 @@
 """ゲームエンジン - 麻雀ゲームの進行を制御"""
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from mahjong_ai.game.events import EventSink, EventType, GameEvent
+from mahjong_ai.game.journal import (
+    ACTION_DEAL,
+    ACTION_DISCARD,
+    ACTION_DRAW,
+    ACTION_KAN,
+    ACTION_RYUUKYOKU,
+    ACTION_WIN,
+    ActionJournal,
+    JournalEntry,
+    ScalarState,
+)
 from mahjong_ai.game.wall_tiles import WallTiles
 from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.logic.waits import WaitCalculator, WaitResult
 from mahjong_ai.logic.winning_checker import WinningChecker
 from mahjong_ai.models.hand import Hand
 from mahjong_ai.models.tile import Tile
-from mahjong_ai.utils.logger import get_logger, log_action, log_error, log_game_state
+from mahjong_ai.utils.logger import get_logger, is_state_logging_enabled, log_action, log_error, log_game_state
 
 
 class GameState(Enum):
@@ -21,6 +34,78 @@ class GameState(Enum):
     GAME_OVER = "game_over"  # ゲーム終了
 
 
+class EngineSnapshot:
+    """GameEngineの局面のスナップショット
+
+    手牌は枚数ベクトル、山牌・捨て牌・暗槓はtile_id列のバイト列で保持する
+    不変のオブジェクトです。同じスナップショットから何度でも復元でき、
+    複数の局面で共有できます。
+
+    Attributes:
+        hand_counts: 手牌のtile_idごとの枚数
+        wall_ids: 山牌のtile_id列（先頭rinshan_count枚が嶺上牌）
+        rinshan_count: 嶺上牌の残り枚数
+        wall_seed: 山牌のシード
+        game_state: ゲーム状態
+        turn_count: ターン数
+        is_riichi: リーチしているかどうか
+        discarded_ids: 捨て牌のtile_id列（打牌順）
+        kan_ids: 暗槓した牌のtile_id列（暗槓順）
+        is_winner: 和了したかどうか
+        winning_tile: 和了牌
+        last_drawn_tile: 最後にツモした牌
+    """
+
+    __slots__ = (
+        "hand_counts",
+        "wall_ids",
+        "rinshan_count",
+        "wall_seed",
+        "game_state",
+        "turn_count",
+        "is_riichi",
+        "discarded_ids",
+        "kan_ids",
+        "is_winner",
+        "winning_tile",
+        "last_drawn_tile",
+    )
+
+    def __init__(self, engine: "GameEngine") -> None:
+        """エンジンの現在の局面を記録
+
+        Args:
+            engine: 記録するゲームエンジン
+        """
+        wall = engine.wall
+        self.hand_counts = engine.current_hand.counts_view().tobytes()
+        self.wall_ids = wall.wall_ids()
+        self.rinshan_count = wall.rinshan_count
+        self.wall_seed = wall.seed
+        self.game_state = engine.game_state
+        self.turn_count = engine.turn_count
+        self.is_riichi = engine.is_riichi
+        self.discarded_ids = bytes(tile.tile_id for tile in engine.discarded_tiles)
+        self.kan_ids = bytes(kan[0].tile_id for kan in engine.kan_tiles)
+        self.is_winner = engine.is_winner
+        self.winning_tile = engine.winning_tile
+        self.last_drawn_tile = engine.last_drawn_tile
+
+    def _key(self) -> Tuple[Any, ...]:
+        """比較・ハッシュに使う全フィールドのタプル"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        """同じ局面かどうか"""
+        if not isinstance(other, EngineSnapshot):
+            return False
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        """局面に基づくハッシュ値"""
+        return hash(self._key())
+
+
 class GameEngine:
     """麻雀ゲームの進行を制御するエンジンクラス
 
@@ -30,12 +115,11 @@ class GameEngine:
 
     def __init__(self) -> None:
         """ゲームエンジンを初期化"""
-        self.logger = get_logger()
-        
         self.current_hand = Hand()
         self.wall = WallTiles()
         self.winning_checker = WinningChecker()
-        self.shanten_calculator = ShantenCalculator()
+        self.shanten_calculator = ShantenCalculator(winning_checker=self.winning_checker)
+        self.wait_calculator = WaitCalculator()
 
         self.game_state = GameState.NOT_STARTED
         self.turn_count = 0
@@ -52,7 +136,18 @@ class GameEngine:
         # 暗槓した牌のリスト
         self.kan_tiles: List[List[Tile]] = []
         
-        self.logger.info("GameEngine初期化完了")
+        # 向聴数・ツモ後/打牌後向聴数表のキャッシュ（手牌の枚数ベクトル, 値）
+        self._shanten_cache: Optional[Tuple[bytes, int]] = None
+        self._draw_table: Optional[Tuple[bytes, Dict[int, int]]] = None
+        self._discard_table: Optional[Tuple[bytes, Dict[int, int]]] = None
+        
+        # 構造化イベントの出力先
+        self.event_sinks: List[EventSink] = []
+        
+        # 操作履歴（enable_journal()で有効化）
+        self.journal: Optional[ActionJournal] = None
+        
+        get_logger().info("GameEngine初期化完了")
         log_game_state(self)
 
     def start_game(self) -> None:
@@ -71,6 +166,8 @@ class GameEngine:
             log_error(error, "start_game")
             raise error
 
+        before = self._scalar_state() if self.journal is not None else None
+
         # 初期手牌を配る（13枚）
         initial_tiles = self.wall.draw_multiple_tiles(13)
         self.current_hand = Hand(initial_tiles)
@@ -78,11 +175,11 @@ class GameEngine:
         # ゲーム状態を更新
         self.game_state = GameState.PLAYER_TURN
         self.turn_count = 1
+        self._emit_event(EventType.DEAL, [tile.tile_id for tile in initial_tiles])
+        if before is not None:
+            self._record_action(ACTION_DEAL, tuple(initial_tiles), before)
 
-        print(f"ゲーム開始！ 初期手牌: {self.current_hand}")
-        print(f"向聴数: {self.calculate_shanten()}")
-        
-        log_action("start_game", f"初期手牌配布完了: {self.current_hand}")
+        log_action("start_game", "初期手牌配布完了: %s", self.current_hand)
         log_game_state(self)
 
     def draw_tile(self) -> Tile:
@@ -104,45 +201,56 @@ class GameEngine:
 
         if self.wall.is_empty():
             # 流局処理
+            before = self._scalar_state() if self.journal is not None else None
             self.game_state = GameState.GAME_OVER
+            self._emit_event(EventType.RYUUKYOKU)
+            if before is not None:
+                self._record_action(ACTION_RYUUKYOKU, (), before)
             error = ValueError("山牌が空です（流局）")
             log_error(error, "draw_tile")
             raise error
 
         # ツモ前の状態をログ
-        self.logger.info(f"ツモ前状態: 手牌枚数={self.current_hand.size}, 状態={self.game_state}, リーチ={self.is_riichi}")
+        state_logging = is_state_logging_enabled()
+        if state_logging:
+            get_logger().info(
+                "ツモ前状態: 手牌枚数=%d, 状態=%s, リーチ=%s", self.current_hand.size, self.game_state, self.is_riichi
+            )
+
+        before = self._scalar_state() if self.journal is not None else None
 
         # 牌をツモ
         drawn_tile = self.wall.draw_tile()
+        draw_shanten = self._shanten_after_draw(drawn_tile)
         
         try:
             self.current_hand.add_tile(drawn_tile)
-            self.logger.info(f"ツモ成功: {drawn_tile}, 手牌枚数={self.current_hand.size}")
+            self._track_shanten(draw_shanten)
+            if state_logging:
+                get_logger().info("ツモ成功: %s, 手牌枚数=%d", drawn_tile, self.current_hand.size)
         except Exception as e:
-            self.logger.error(f"add_tile失敗: {e}")
+            get_logger().error("add_tile失敗: %s", e)
             log_error(e, f"draw_tile - ツモ牌: {drawn_tile}")
             raise
 
         # 最後にツモした牌を記録
         self.last_drawn_tile = drawn_tile
+        self._emit_event(EventType.DRAW, (drawn_tile.tile_id,))
 
         # 状態を更新（リーチ中の場合はリーチ状態を維持）
         old_state = self.game_state
         if not self.is_riichi:
             self.game_state = GameState.AFTER_DRAW
         
-        self.logger.info(f"状態変更: {old_state} -> {self.game_state}")
-
-        print(f"ツモ: {drawn_tile}")
-        print(f"現在の手牌: {self.current_hand}")
+        if state_logging:
+            get_logger().info("状態変更: %s -> %s", old_state, self.game_state)
+        if before is not None:
+            self._record_action(ACTION_DRAW, (drawn_tile,), before)
 
-        # 和了可能かチェック（自動和了はしない）
-        if self.check_winning_hand():
-            print(f"ツモ和了可能！ 和了牌: {drawn_tile}")
-            log_action("draw_tile", f"ツモ和了可能: {drawn_tile}")
-        
-        print(f"向聴数: {self.calculate_shanten()}")
-        log_action("draw_tile", f"ツモ完了: {drawn_tile}")
+        # 和了可能かをログに記録（自動和了はしない）
+        if state_logging and self.check_winning_hand():
+            log_action("draw_tile", "ツモ和了可能: %s", drawn_tile)
+        log_action("draw_tile", "ツモ完了: %s", drawn_tile)
 
         log_game_state(self)
         return drawn_tile
@@ -157,7 +265,7 @@ class GameEngine:
         Raises:
             ValueError: 打牌できる状態でない場合、または指定牌が手牌にない場合
         """
-        log_action("discard_tile", f"打牌要求: {tile}, リーチ宣言: {declare_riichi}")
+        log_action("discard_tile", "打牌要求: %s, リーチ宣言: %s", tile, declare_riichi)
         log_game_state(self)
         
         if self.game_state not in [GameState.AFTER_DRAW, GameState.RIICHI]:
@@ -165,7 +273,7 @@ class GameEngine:
             log_error(error, "discard_tile")
             raise error
 
-        if tile not in self.current_hand.tiles:
+        if not self.current_hand.has_tile(tile):
             error = ValueError("指定された牌が手牌にありません")
             log_error(error, "discard_tile")
             raise error
@@ -178,9 +286,7 @@ class GameEngine:
                 raise error
             
             # リーチ条件チェック（打牌後に13枚で聴牌状態になるか）
-            temp_hand = self.current_hand.copy()
-            temp_hand.remove_tile(tile)
-            temp_shanten = self.shanten_calculator.calculate_shanten(temp_hand)
+            temp_shanten = self.get_discard_shanten_table()[tile.tile_id]
             
             if temp_shanten != 0:
                 error = ValueError("リーチできません（打牌後に聴牌になりません）")
@@ -194,15 +300,19 @@ class GameEngine:
                 log_error(error, f"discard_tile - 要求牌: {tile}, ツモ牌: {self.last_drawn_tile}")
                 raise error
 
+        before = self._scalar_state() if self.journal is not None else None
+
         # 牌を手牌から除去
+        discard_shanten = self.get_discard_shanten_table()[tile.tile_id]
         self.current_hand.remove_tile(tile)
+        self._track_shanten(discard_shanten)
         self.discarded_tiles.append(tile)
+        self._emit_event(EventType.RIICHI if declare_riichi else EventType.DISCARD, (tile.tile_id,))
 
         # リーチ宣言の処理
         if declare_riichi:
             self.is_riichi = True
             self.game_state = GameState.RIICHI
-            print("リーチ宣言！")
             log_action("discard_tile", "リーチ宣言実行")
         elif self.game_state != GameState.RIICHI:
             # 通常の打牌後はプレイヤーターンに戻る
@@ -215,14 +325,233 @@ class GameEngine:
         self.last_drawn_tile = None
         
         self.turn_count += 1
+        if before is not None:
+            self._record_action(ACTION_DISCARD, (tile,), before)
 
-        print(f"打牌: {tile}")
-        print(f"現在の手牌: {self.current_hand}")
-        print(f"向聴数: {self.calculate_shanten()}")
-        
-        log_action("discard_tile", f"打牌完了: {tile}")
+        log_action("discard_tile", "打牌完了: %s", tile)
         log_game_state(self)
 
+    def snapshot(self) -> EngineSnapshot:
+        """現在の局面のスナップショットを作成
+
+        Returns:
+            局面のスナップショット
+        """
+        return EngineSnapshot(self)
+
+    def restore(self, snapshot: EngineSnapshot) -> None:
+        """スナップショットの局面に戻す
+
+        イベントの出力先や計算器の設定は変更しません。
+
+        Args:
+            snapshot: snapshot() で作成したスナップショット
+        """
+        self.current_hand = Hand.from_counts(snapshot.hand_counts)
+        self.wall.load(snapshot.wall_ids, snapshot.wall_seed, snapshot.rinshan_count)
+
+        self.game_state = snapshot.game_state
+        self.turn_count = snapshot.turn_count
+        self.is_riichi = snapshot.is_riichi
+        self.discarded_tiles = [Tile.from_id(tile_id) for tile_id in snapshot.discarded_ids]
+        self.kan_tiles = [[Tile.from_id(tile_id)] * 4 for tile_id in snapshot.kan_ids]
+        self.is_winner = snapshot.is_winner
+        self.winning_tile = snapshot.winning_tile
+        self.last_drawn_tile = snapshot.last_drawn_tile
+        if self.journal is not None:
+            self.journal.clear()
+
+    def fork(self) -> "GameEngine":
+        """現在の局面から分岐した独立のゲームエンジンを作成
+
+        探索用に、初期化処理（山牌のシャッフルやログ出力）を行わずに複製します。
+        牌は不変のフライウェイトなので共有し、変更されるリスト・手牌だけを複製します。
+        計算器と向聴数表のキャッシュは共有し、イベントの出力先は引き継ぎません。
+
+        Returns:
+            同じ局面を持つ新しいゲームエンジン
+        """
+        engine = GameEngine.__new__(GameEngine)
+        engine.current_hand = self.current_hand.copy()
+        engine.wall = self.wall.copy()
+        engine.winning_checker = self.winning_checker
+        engine.shanten_calculator = self.shanten_calculator
+        engine.wait_calculator = self.wait_calculator
+
+        engine.game_state = self.game_state
+        engine.turn_count = self.turn_count
+        engine.is_riichi = self.is_riichi
+        engine.discarded_tiles = self.discarded_tiles.copy()
+        engine.is_winner = self.is_winner
+        engine.winning_tile = self.winning_tile
+        engine.last_drawn_tile = self.last_drawn_tile
+        engine.kan_tiles = [kan.copy() for kan in self.kan_tiles]
+
+        # キャッシュは手牌の枚数ベクトルで検証されるため共有しても安全
+        engine._shanten_cache = self._shanten_cache
+        engine._draw_table = self._draw_table
+        engine._discard_table = self._discard_table
+        engine.event_sinks = []
+        engine.journal = None
+        return engine
+
+    def enable_journal(self) -> ActionJournal:
+        """操作履歴の記録を開始
+
+        以降のツモ・打牌・暗槓・和了・流局・配牌の差分を記録し、
+        undo() / redo() で局面を前後に移動できるようにします。
+
+        Returns:
+            記録先の操作履歴（既に有効な場合は既存の履歴）
+        """
+        if self.journal is None:
+            self.journal = ActionJournal()
+        return self.journal
+
+    def disable_journal(self) -> None:
+        """操作履歴の記録を終了して履歴を破棄"""
+        self.journal = None
+
+    def undo(self) -> JournalEntry:
+        """最後の操作を元に戻す
+
+        記録した差分だけを逆に適用するため、画面出力・ログ出力・イベント出力は行いません。
+
+        Returns:
+            元に戻した操作
+
+        Raises:
+            ValueError: 操作履歴が無効、または元に戻せる操作がない場合
+        """
+        if self.journal is None:
+            raise ValueError("操作履歴が有効になっていません")
+
+        entry = self.journal.pop_undo()
+        hand = self.current_hand
+        action = entry.action
+
+        if action == ACTION_DRAW:
+            hand.remove_tile(entry.tiles[0])
+            self.wall.put_back_tile(entry.tiles[0])
+        elif action == ACTION_DISCARD:
+            self.discarded_tiles.pop()
+            hand.add_tile(entry.tiles[0])
+        elif action == ACTION_KAN:
+            kan_tile, rinshan_tile = entry.tiles
+            hand.remove_tile(rinshan_tile)
+            self.wall.put_back_rinshan_tile(rinshan_tile)
+            self.kan_tiles.pop()
+            for _ in range(4):
+                hand.add_tile(kan_tile)
+        elif action == ACTION_DEAL:
+            # 配牌は末尾から順にツモされたので、逆順に戻す
+            for tile in reversed(entry.tiles):
+                hand.remove_tile(tile)
+                self.wall.put_back_tile(tile)
+
+        self._set_scalar_state(entry.before)
+        return entry
+
+    def redo(self) -> JournalEntry:
+        """最後に元に戻した操作をやり直す
+
+        Returns:
+            やり直した操作
+
+        Raises:
+            ValueError: 操作履歴が無効、またはやり直せる操作がない場合
+        """
+        if self.journal is None:
+            raise ValueError("操作履歴が有効になっていません")
+
+        entry = self.journal.pop_redo()
+        hand = self.current_hand
+        action = entry.action
+
+        if action == ACTION_DRAW:
+            hand.add_tile(self.wall.draw_tile())
+        elif action == ACTION_DISCARD:
+            hand.remove_tile(entry.tiles[0])
+            self.discarded_tiles.append(entry.tiles[0])
+        elif action == ACTION_KAN:
+            kan_tile = entry.tiles[0]
+            for _ in range(4):
+                hand.remove_tile(kan_tile)
+            self.kan_tiles.append([kan_tile] * 4)
+            hand.add_tile(self.wall.draw_rinshan_tile())
+        elif action == ACTION_DEAL:
+            for tile in self.wall.draw_multiple_tiles(len(entry.tiles)):
+                hand.add_tile(tile)
+
+        self._set_scalar_state(entry.after)
+        return entry
+
+    def _scalar_state(self) -> ScalarState:
+        """操作で変化する牌以外の状態を取得"""
+        return (
+            self.game_state,
+            self.turn_count,
+            self.is_riichi,
+            self.last_drawn_tile,
+            self.is_winner,
+            self.winning_tile,
+        )
+
+    def _set_scalar_state(self, state: ScalarState) -> None:
+        """操作で変化する牌以外の状態を設定"""
+        (
+            self.game_state,
+            self.turn_count,
+            self.is_riichi,
+            self.last_drawn_tile,
+            self.is_winner,
+            self.winning_tile,
+        ) = state
+
+    def _record_action(self, action: str, tiles: Tuple[Tile, ...], before: ScalarState) -> None:
+        """操作の差分を操作履歴に記録
+
+        Args:
+            action: 操作の種類
+            tiles: 移動した牌
+            before: 操作前の状態
+        """
+        if self.journal is not None:
+            self.journal.record(JournalEntry(action, tiles, before, self._scalar_state()))
+
+    def add_event_sink(self, sink: EventSink) -> None:
+        """構造化イベントの出力先を登録
+
+        配牌・ツモ・打牌・リーチ・暗槓・和了・流局のたびにイベントが出力されます。
+        エンジン自体は画面に出力しないため、画面表示が必要な場合は
+        表示用の出力先（CUIInterface の ConsoleEventSink など）を登録します。
+
+        Args:
+            sink: イベントの出力先
+        """
+        self.event_sinks.append(sink)
+
+    def remove_event_sink(self, sink: EventSink) -> None:
+        """構造化イベントの出力先の登録を解除
+
+        Args:
+            sink: 登録済みの出力先
+        """
+        self.event_sinks.remove(sink)
+
+    def _emit_event(self, event_type: EventType, tiles: Sequence[int] = ()) -> None:
+        """登録済みの出力先にイベントを出力（出力先がなければ何もしない）
+
+        Args:
+            event_type: イベントの種別
+            tiles: 関係する牌のtile_id
+        """
+        if not self.event_sinks:
+            return
+        event = GameEvent(event_type, self.turn_count, tuple(tiles))
+        for sink in self.event_sinks:
+            sink.write(event)
+
     def check_winning_hand(self) -> bool:
         """現在の手牌が和了形かどうかを判定
         
@@ -235,13 +564,13 @@ class GameEngine:
         if self.kan_tiles:
             # 暗槓は既に完成した面子として扱う
             # 残りの手牌が1雀頭+面子の形になっていれば和了
-            # 暗槓の数 × 3 = 除外する牌数
-            required_tiles = 14 - (len(self.kan_tiles) * 4)
+            # 暗槓1つにつき手牌は3枚減る（4枚除去して嶺上牌を1枚ツモ）
+            required_tiles = 14 - (len(self.kan_tiles) * 3)
             
             # 手牌が必要枚数と一致する場合のみ判定
             if self.current_hand.size == required_tiles:
                 # 暗槓を除いた残りの手牌で判定
-                # 例: 1暗槓の場合、10枚で3面子1雀頭の判定が必要
+                # 例: 1暗槓の場合、11枚で3面子1雀頭の判定が必要
                 return self._check_winning_with_kan(self.current_hand, len(self.kan_tiles))
         
         # 通常の和了判定
@@ -250,6 +579,9 @@ class GameEngine:
     def _check_winning_with_kan(self, hand: Hand, kan_count: int) -> bool:
         """暗槓がある場合の和了判定
         
+        待ち牌（waits）と同じ完全形集合で判定するため、待ち牌をツモした手牌は
+        必ず和了形と判定されます。
+        
         Args:
             hand: 暗槓を除いた手牌
             kan_count: 暗槓の数
@@ -258,27 +590,14 @@ class GameEngine:
             和了形の場合True
         """
         # 暗槓は完成した面子なので、残りの手牌で必要な面子数は減る
-        # 例: 1暗槓 → 3面子1雀頭が必要
-        #     2暗槓 → 2面子1雀頭が必要
-        
-        # 簡易実装: 牌数で判定
-        # 14枚 - (暗槓数 × 4) = 必要枚数
-        expected_size = 14 - (kan_count * 4)
+        # 例: 1暗槓 → 3面子1雀頭（11枚）が必要
+        #     2暗槓 → 2面子1雀頭（8枚）が必要
+        expected_size = 14 - (kan_count * 3)
         if hand.size != expected_size:
             return False
         
-        # TODO: より詳細な和了判定の実装が必要
-        # 現状は手牌枚数のチェックのみで、実際の面子構成は確認していない
-        # Phase 1では簡易実装とし、将来的に改善する
-        
-        # 暫定的に通常の和了判定を流用（完全ではない）
-        if expected_size == 2:
-            # 2枚の場合は対子のみ
-            tiles = hand.tiles
-            return len(tiles) == 2 and tiles[0] == tiles[1]
-        
-        # それ以外は簡易チェック（向聴数で判定）
-        return self.shanten_calculator.calculate_shanten(hand) == -1
+        # 暗槓があると七対子は成立しないので、n面子1雀頭の形だけを判定
+        return self.winning_checker.is_complete_hand(hand)
 
     def calculate_shanten(self) -> int:
         """現在の手牌の向聴数を計算
@@ -286,8 +605,72 @@ class GameEngine:
         Returns:
             向聴数（-1: 和了, 0: 聴牌, 1以上: n向聴）
         """
-        return self.shanten_calculator.calculate_shanten(self.current_hand)
+        return self.shanten
 
+    @property
+    def shanten(self) -> int:
+        """現在の手牌の向聴数
+
+        手牌の枚数ベクトルが変わるまで同じ値を返します。ツモ後の値はツモした種類の
+        差分だけ、打牌後の値は打牌後向聴数表から求めて引き継ぐため、再計算しません。
+
+        Returns:
+            向聴数（-1: 和了, 0: 聴牌, 1以上: n向聴）
+        """
+        signature = self.current_hand.counts_view().tobytes()
+        cached = self._shanten_cache
+        if cached is None or cached[0] != signature:
+            cached = (signature, self.shanten_calculator.calculate_shanten(self.current_hand))
+            self._shanten_cache = cached
+        return cached[1]
+
+    @property
+    def waits(self) -> List[Tile]:
+        """現在の手牌（3n+1枚）の待ち牌の種類
+
+        山牌の残りは考慮しません。待ち牌は手牌の枚数ベクトルごとにキャッシュされます。
+
+        Returns:
+            ツモで和了形になる牌のリスト（牌順、3n+1枚でなければ空）
+        """
+        if self.current_hand.size % 3 != 1:
+            return []
+        return [Tile.from_id(tile_id) for tile_id in self.wait_calculator.wait_ids(self.current_hand)]
+
+    def get_waits(self) -> WaitResult:
+        """現在の手牌（3n+1枚）の待ち牌と山牌の残り枚数を取得
+
+        Returns:
+            待ち牌の計算結果（3n+1枚でなければ空）
+        """
+        remaining = {tile: self.wall.count_tile(tile) for tile in self.waits}
+        return self.wait_calculator.calculate(self.current_hand, remaining)
+
+    def _shanten_after_draw(self, tile: Tile) -> int:
+        """現在の手牌に1枚ツモした後の向聴数を求める
+
+        ツモ後向聴数表が用意済みならその値を使い、なければツモした種類だけを計算します。
+
+        Args:
+            tile: ツモする牌
+
+        Returns:
+            ツモ後の向聴数
+        """
+        counts = self.current_hand.counts_view()
+        cached = self._draw_table
+        if cached is not None and cached[0] == counts.tobytes():
+            return cached[1][tile.tile_id]
+        table = self.shanten_calculator.draw_shanten_from_counts(counts, self.current_hand.size, (tile.tile_id,))
+        return table[tile.tile_id]
+
+    def _track_shanten(self, shanten: int) -> None:
+        """1枚のツモ・打牌の後の向聴数を記録し、再計算せずに引き継ぐ
+
+        Args:
+            shanten: 変更後の手牌の向聴数
+        """
+        self._shanten_cache = (self.current_hand.counts_view().tobytes(), shanten)
 
     def get_possible_discards(self) -> List[Tile]:
         """打牌可能な牌のリストを取得
@@ -318,26 +701,9 @@ class GameEngine:
         # 14枚の状態では聴牌判定はしない（打牌が必要）
         if self.current_hand.size != 13:
             return []
-            
-        if self.calculate_shanten() != 0:
-            return []
-
-        winning_tiles = []
-
-        # 各種類の牌を試して和了判定
-        for value in range(1, 10):
-            test_tile = Tile(suit="sou", value=value)
-
-            # 山牌にその牌が残っているかチェック
-            if self.wall.has_tile(test_tile):
-                # 一時的に牌を追加して和了判定
-                test_hand = self.current_hand.copy()
-                test_hand.add_tile(test_tile)
 
-                if self.winning_checker.is_winning_hand(test_hand):
-                    winning_tiles.append(test_tile)
-
-        return winning_tiles
+        # 待ち牌のうち山牌に残っている牌を抽出
+        return [tile for tile in self.waits if self.wall.has_tile(tile)]
 
     def get_game_info(self) -> Dict[str, Any]:
         """現在のゲーム状態の情報を取得
@@ -352,7 +718,7 @@ class GameEngine:
             "wall_remaining": self.wall.remaining_count,
             "turn_count": self.turn_count,
             "is_riichi": self.is_riichi,
-            "shanten": self.calculate_shanten(),
+            "shanten": self.shanten,
             "discarded_tiles": [str(tile) for tile in self.discarded_tiles],
             "is_winner": self.is_winner,
             "winning_tile": str(self.winning_tile) if self.winning_tile else None,
@@ -372,8 +738,8 @@ class GameEngine:
         self.winning_tile = None
         self.last_drawn_tile = None
         self.kan_tiles.clear()
-
-        print("ゲームをリセットしました")
+        if self.journal is not None:
+            self.journal.clear()
 
     def is_game_over(self) -> bool:
         """ゲームが終了しているかどうかを判定
@@ -417,15 +783,19 @@ class GameEngine:
         Args:
             winning_tile: 和了牌
         """
-        log_action("execute_win", f"ツモ和了実行: {winning_tile}")
+        log_action("execute_win", "ツモ和了実行: %s", winning_tile)
         log_game_state(self)
         
+        before = self._scalar_state() if self.journal is not None else None
+        
         self.is_winner = True
         self.winning_tile = winning_tile
         self.game_state = GameState.GAME_OVER
+        self._emit_event(EventType.WIN, (winning_tile.tile_id,))
+        if before is not None:
+            self._record_action(ACTION_WIN, (), before)
         
-        print(f"ツモ和了！ 和了牌: {winning_tile}")
-        log_action("execute_win", f"ツモ和了完了: {winning_tile}")
+        log_action("execute_win", "ツモ和了完了: %s", winning_tile)
 
     def can_riichi(self) -> bool:
         """リーチ可能かどうかを判定
@@ -440,13 +810,7 @@ class GameEngine:
             return False
         
         # 各牌を捨てた時に聴牌になるかチェック
-        for tile in self.current_hand.tiles:
-            temp_hand = self.current_hand.copy()
-            temp_hand.remove_tile(tile)
-            if self.shanten_calculator.calculate_shanten(temp_hand) == 0:
-                return True
-        
-        return False
+        return 0 in self.get_discard_shanten_table().values()
     
     def can_discard_for_riichi(self, tile: Tile) -> bool:
         """特定の牌をリーチ宣言して打牌できるかどうかを判定
@@ -457,12 +821,10 @@ class GameEngine:
         Returns:
             その牌を打牌してテンパイになる場合True
         """
-        if self.current_hand.size != 14 or tile not in self.current_hand.tiles:
+        if self.current_hand.size != 14 or not self.current_hand.has_tile(tile):
             return False
         
-        temp_hand = self.current_hand.copy()
-        temp_hand.remove_tile(tile)
-        return self.shanten_calculator.calculate_shanten(temp_hand) == 0
+        return self.get_discard_shanten_table()[tile.tile_id] == 0
     
     def get_riichi_discardable_tiles(self) -> List[Tile]:
         """リーチ宣言時に打牌可能な牌のリストを取得
@@ -473,13 +835,42 @@ class GameEngine:
         if not self.can_riichi():
             return []
         
+        discard_table = self.get_discard_shanten_table()
         riichi_tiles = []
         for tile in self.current_hand.tiles:
-            if self.can_discard_for_riichi(tile):
+            if discard_table[tile.tile_id] == 0:
                 riichi_tiles.append(tile)
         
         return riichi_tiles
     
+    def get_discard_shanten_table(self) -> Dict[int, int]:
+        """現在の手牌から各牌を打牌した後の向聴数表を取得
+        
+        手牌が変わらない間は同じ表を再利用します。
+        
+        Returns:
+            打牌する牌のtile_idをキー、打牌後の向聴数を値とする辞書
+        """
+        signature = self.current_hand.counts_view().tobytes()
+        if self._discard_table is None or self._discard_table[0] != signature:
+            table = self.shanten_calculator.shanten_after_each_discard(self.current_hand)
+            self._discard_table = (signature, table)
+        return self._discard_table[1]
+    
+    def get_draw_shanten_table(self) -> Dict[int, int]:
+        """現在の手牌に各牌をツモした後の向聴数表を取得
+
+        手牌が変わらない間は同じ表を再利用します。
+
+        Returns:
+            ツモする牌のtile_idをキー、ツモ後の向聴数を値とする辞書
+        """
+        signature = self.current_hand.counts_view().tobytes()
+        if self._draw_table is None or self._draw_table[0] != signature:
+            table = self.shanten_calculator.shanten_after_each_draw(self.current_hand)
+            self._draw_table = (signature, table)
+        return self._draw_table[1]
+
     def get_kan_possible_tiles(self) -> List[Tile]:
         """暗槓可能な牌のリストを取得
         
@@ -492,11 +883,10 @@ class GameEngine:
             return []
         
         kan_tiles = []
-        tile_counts = self.current_hand.get_tile_counts()
         
-        for tile, count in tile_counts.items():
+        for tile_id, count in enumerate(self.current_hand.counts_view()):
             if count == 4:
-                kan_tiles.append(tile)
+                kan_tiles.append(Tile.from_id(tile_id))
         
         return kan_tiles
     
@@ -525,7 +915,7 @@ class GameEngine:
         Raises:
             ValueError: 暗槓できない状態、または指定牌で暗槓できない場合
         """
-        log_action("execute_kan", f"暗槓要求: {tile}")
+        log_action("execute_kan", "暗槓要求: %s", tile)
         log_game_state(self)
         
         if not self.can_kan():
@@ -534,12 +924,14 @@ class GameEngine:
             raise error
         
         # 手牌に4枚あるかチェック
-        tile_count = self.current_hand.tiles.count(tile)
+        tile_count = self.current_hand.count_tile(tile)
         if tile_count != 4:
             error = ValueError(f"{tile}が4枚ありません（現在{tile_count}枚）")
             log_error(error, "execute_kan")
             raise error
         
+        before = self._scalar_state() if self.journal is not None else None
+
         # 手牌から4枚除去
         for _ in range(4):
             self.current_hand.remove_tile(tile)
@@ -547,27 +939,23 @@ class GameEngine:
         # 暗槓リストに追加
         self.kan_tiles.append([tile, tile, tile, tile])
         
-        print(f"暗槓: {tile} × 4")
-        
         # 嶺上牌をツモ
         rinshan_tile = self.wall.draw_rinshan_tile()
         self.current_hand.add_tile(rinshan_tile)
         
         # 嶺上牌も最後にツモした牌として記録
         self.last_drawn_tile = rinshan_tile
+        self._emit_event(EventType.KAN, (tile.tile_id, rinshan_tile.tile_id))
         
-        print(f"嶺上ツモ: {rinshan_tile}")
-        print(f"現在の手牌: {self.current_hand}")
-        
-        # 和了可能かチェック（嶺上開花）
-        if self.check_winning_hand():
-            print(f"嶺上開花可能！ 和了牌: {rinshan_tile}")
-            log_action("execute_kan", f"嶺上開花可能: {rinshan_tile}")
+        # 和了可能かをログに記録（嶺上開花）
+        if is_state_logging_enabled() and self.check_winning_hand():
+            log_action("execute_kan", "嶺上開花可能: %s", rinshan_tile)
         
         # 暗槓後も打牌が必要
         self.game_state = GameState.AFTER_DRAW
-        print(f"向聴数: {self.calculate_shanten()}")
-        log_action("execute_kan", f"暗槓完了: {tile}")
+        if before is not None:
+            self._record_action(ACTION_KAN, (tile, rinshan_tile), before)
+        log_action("execute_kan", "暗槓完了: %s", tile)
         
         log_game_state(self)
 
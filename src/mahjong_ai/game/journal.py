@@ -0,0 +1,105 @@
+"""GameEngineの操作履歴（元に戻す・やり直す）"""
+
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from mahjong_ai.models.tile import Tile
+
+# 操作の種類
+ACTION_DEAL = "deal"  # 配牌（tiles: ツモ順の配牌）
+ACTION_DRAW = "draw"  # ツモ（tiles: ツモ牌）
+ACTION_DISCARD = "discard"  # 打牌（tiles: 打牌）
+ACTION_KAN = "kan"  # 暗槓（tiles: 暗槓した牌, 嶺上牌）
+ACTION_WIN = "win"  # ツモ和了（tiles: なし）
+ACTION_RYUUKYOKU = "ryuukyoku"  # 流局（tiles: なし）
+
+# 操作で変化する状態（ゲーム状態, ターン数, リーチ, 最後にツモした牌, 和了, 和了牌）
+ScalarState = Tuple[Any, int, bool, Optional[Tile], bool, Optional[Tile]]
+
+
+class JournalEntry(NamedTuple):
+    """1回の操作の差分
+
+    牌の移動は操作の種類と移動した牌から一意に決まるため、
+    それ以外の状態だけを操作の前後で保持します。
+
+    Attributes:
+        action: 操作の種類
+        tiles: 移動した牌
+        before: 操作前の状態
+        after: 操作後の状態
+    """
+
+    action: str
+    tiles: Tuple[Tile, ...]
+    before: ScalarState
+    after: ScalarState
+
+
+class ActionJournal:
+    """操作の差分を積み上げる履歴
+
+    新しい操作を記録すると、やり直し用の履歴は破棄されます。
+    """
+
+    def __init__(self) -> None:
+        """空の履歴を作成"""
+        self._undo_stack: List[JournalEntry] = []
+        self._redo_stack: List[JournalEntry] = []
+
+    def __len__(self) -> int:
+        """元に戻せる操作の数"""
+        return len(self._undo_stack)
+
+    @property
+    def can_undo(self) -> bool:
+        """元に戻せる操作があるかどうか"""
+        return bool(self._undo_stack)
+
+    @property
+    def can_redo(self) -> bool:
+        """やり直せる操作があるかどうか"""
+        return bool(self._redo_stack)
+
+    def record(self, entry: JournalEntry) -> None:
+        """新しい操作を記録
+
+        Args:
+            entry: 操作の差分
+        """
+        self._undo_stack.append(entry)
+        self._redo_stack.clear()
+
+    def pop_undo(self) -> JournalEntry:
+        """元に戻す操作を取り出す
+
+        Returns:
+            最後に行った操作
+
+        Raises:
+            ValueError: 元に戻せる操作がない場合
+        """
+        if not self._undo_stack:
+            raise ValueError("元に戻せる操作がありません")
+        entry = self._undo_stack.pop()
+        self._redo_stack.append(entry)
+        return entry
+
+    def pop_redo(self) -> JournalEntry:
+        """やり直す操作を取り出す
+
+        Returns:
+            最後に元に戻した操作
+
+        Raises:
+            ValueError: やり直せる操作がない場合
+        """
+        if not self._redo_stack:
+            raise ValueError("やり直せる操作がありません")
+        entry = self._redo_stack.pop()
+        self._undo_stack.append(entry)
+        return entry
+
+    def clear(self) -> None:
+        """履歴を全て破棄"""
+        self._undo_stack.clear()
+        self._redo_stack.clear()
@@ -0,0 +1,252 @@
+"""対局記録と再現エンジン"""
+
+import bisect
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from mahjong_ai.game.events import EventSink, EventType, GameEvent
+from mahjong_ai.game.game_engine import EngineSnapshot, GameEngine, GameState
+from mahjong_ai.models.tile import Tile
+
+# 対局記録ファイルの形式バージョン
+RECORD_VERSION = 1
+
+# スナップショットを保存するイベント数の間隔
+DEFAULT_SNAPSHOT_INTERVAL = 8
+
+
+@dataclass
+class GameRecord:
+    """1局分の対局記録
+
+    配牌前の山牌の並びと、配牌から終局までのイベント列を保持します。
+    山牌の並びが決まればツモは一意に決まるため、記録から局面を再現できます。
+
+    Attributes:
+        wall_ids: 配牌前の山牌のtile_id列（WallTiles.load() 形式）
+        events: 配牌からのイベント列
+        seed: 山牌のシード（シードから生成していない場合はNone）
+    """
+
+    wall_ids: bytes
+    events: List[GameEvent] = field(default_factory=list)
+    seed: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONに変換できる辞書を取得
+
+        Returns:
+            対局記録の辞書
+        """
+        return {
+            "version": RECORD_VERSION,
+            "seed": self.seed,
+            "wall": list(self.wall_ids),
+            "events": [event.to_dict() for event in self.events],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GameRecord":
+        """辞書から対局記録を復元
+
+        Args:
+            data: to_dict() 形式の辞書
+
+        Returns:
+            復元した対局記録
+
+        Raises:
+            ValueError: 非対応のバージョンの場合
+        """
+        if data.get("version") != RECORD_VERSION:
+            raise ValueError(f"非対応の対局記録のバージョンです: {data.get('version')}")
+        return cls(
+            wall_ids=bytes(data["wall"]),
+            events=[GameEvent.from_dict(event) for event in data["events"]],
+            seed=data.get("seed"),
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """対局記録をJSONファイルに保存
+
+        Args:
+            path: 保存するファイル
+        """
+        Path(path).write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "GameRecord":
+        """JSONファイルから対局記録を読み込む
+
+        Args:
+            path: 読み込むファイル
+
+        Returns:
+            読み込んだ対局記録
+        """
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+class GameRecorder(EventSink):
+    """GameEngineのイベントから対局記録を作成する出力先
+
+    GameEngineに登録すると、配牌のたびに新しい対局記録を開始します。
+    配牌前の山牌の並びは、配牌直後の山牌と配牌（ツモ順）から復元します。
+
+    Attributes:
+        engine: 記録するゲームエンジン
+        records: 作成した対局記録（配牌順）
+    """
+
+    def __init__(self, engine: GameEngine) -> None:
+        """記録を開始
+
+        Args:
+            engine: 記録するゲームエンジン
+        """
+        self.engine = engine
+        self.records: List[GameRecord] = []
+        engine.add_event_sink(self)
+
+    @property
+    def record(self) -> Optional[GameRecord]:
+        """最新の対局記録（まだ配牌していなければNone）"""
+        return self.records[-1] if self.records else None
+
+    def write(self, event: GameEvent) -> None:
+        """イベントを対局記録に追加"""
+        if event.type == EventType.DEAL:
+            wall = self.engine.wall
+            # 配牌は山牌の末尾から引かれるため、逆順に戻すと配牌前の並びになる
+            wall_ids = wall.wall_ids() + bytes(reversed(event.tiles))
+            self.records.append(GameRecord(wall_ids=wall_ids, seed=wall.seed))
+        elif not self.records:
+            return
+        self.records[-1].events.append(event)
+
+    def close(self) -> None:
+        """ゲームエンジンへの登録を解除"""
+        if self in self.engine.event_sinks:
+            self.engine.remove_event_sink(self)
+
+
+class ReplayEngine:
+    """対局記録から任意の時点の局面を再現するエンジン
+
+    イベントをGameEngineに順に適用して局面を再現します。
+    一定のイベント数ごとに局面のスナップショットを保存し、離れた時点へ
+    移動する場合は最も近いスナップショットから再生します。
+
+    Attributes:
+        record: 再現する対局記録
+        engine: 再現中の局面を持つゲームエンジン
+        snapshot_interval: スナップショットを保存するイベント数の間隔
+        position: 適用済みのイベント数
+    """
+
+    def __init__(self, record: GameRecord, snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL) -> None:
+        """再現エンジンを初期化（配牌前の局面から開始）
+
+        Args:
+            record: 再現する対局記録
+            snapshot_interval: スナップショットを保存するイベント数の間隔
+
+        Raises:
+            ValueError: 間隔が1未満の場合
+        """
+        if snapshot_interval < 1:
+            raise ValueError("スナップショットの間隔は1以上である必要があります")
+
+        self.record = record
+        self.snapshot_interval = snapshot_interval
+        self.engine = GameEngine()
+        self.engine.wall.load(record.wall_ids, record.seed)
+        self.position = 0
+        self._snapshots: Dict[int, EngineSnapshot] = {0: self.engine.snapshot()}
+        self._turns = [event.turn for event in record.events]
+
+    def __len__(self) -> int:
+        """記録のイベント数"""
+        return len(self.record.events)
+
+    def seek(self, index: int) -> GameEngine:
+        """先頭からindex件のイベントを適用した局面に移動
+
+        Args:
+            index: 適用するイベント数（0は配牌前、len(self)は終局後）
+
+        Returns:
+            移動後の局面を持つゲームエンジン
+
+        Raises:
+            IndexError: 範囲外の場合
+            ValueError: 記録が山牌と一致しない場合
+        """
+        if not 0 <= index <= len(self):
+            raise IndexError(f"イベント番号が範囲外です: {index}")
+
+        # 現在位置より近いスナップショットがあればそこから再生する
+        start = index - index % self.snapshot_interval
+        while start not in self._snapshots:
+            start -= self.snapshot_interval
+        if not start <= self.position <= index:
+            self.engine.restore(self._snapshots[start])
+            self.position = start
+
+        while self.position < index:
+            self._apply(self.record.events[self.position])
+            self.position += 1
+            if self.position % self.snapshot_interval == 0 and self.position not in self._snapshots:
+                self._snapshots[self.position] = self.engine.snapshot()
+
+        return self.engine
+
+    def seek_turn(self, turn: int) -> GameEngine:
+        """指定したターンのツモ前の局面に移動
+
+        Args:
+            turn: ターン数（1以上、記録の最終ターンより後なら終局後）
+
+        Returns:
+            移動後の局面を持つゲームエンジン
+        """
+        # 配牌（先頭のイベント）はターン1に含まれるため、2件目以降から探す
+        return self.seek(bisect.bisect_left(self._turns, turn, lo=min(1, len(self))))
+
+    def _apply(self, event: GameEvent) -> None:
+        """イベントを1件適用
+
+        Args:
+            event: 適用するイベント
+
+        Raises:
+            ValueError: 記録が山牌と一致しない場合
+        """
+        engine = self.engine
+        event_type = event.type
+
+        if event_type == EventType.DEAL:
+            engine.start_game()
+            if sorted(event.tiles) != [tile.tile_id for tile in engine.current_hand.tiles]:
+                raise ValueError("記録の配牌が山牌と一致しません")
+        elif event_type == EventType.DRAW:
+            drawn_tile = engine.draw_tile()
+            if drawn_tile.tile_id != event.tiles[0]:
+                raise ValueError(f"記録のツモ牌が山牌と一致しません（{event.turn}ターン目）")
+        elif event_type == EventType.DISCARD:
+            engine.discard_tile(Tile.from_id(event.tiles[0]))
+        elif event_type == EventType.RIICHI:
+            engine.discard_tile(Tile.from_id(event.tiles[0]), declare_riichi=True)
+        elif event_type == EventType.KAN:
+            engine.execute_kan(Tile.from_id(event.tiles[0]))
+            if engine.last_drawn_tile is None or engine.last_drawn_tile.tile_id != event.tiles[1]:
+                raise ValueError(f"記録の嶺上牌が山牌と一致しません（{event.turn}ターン目）")
+        elif event_type == EventType.WIN:
+            engine.execute_win(Tile.from_id(event.tiles[0]))
+        elif event_type == EventType.RYUUKYOKU:
+            # 流局は山牌が空の状態でのツモ要求（エラーログを出さずに状態だけ反映する）
+            if not engine.wall.is_empty():
+                raise ValueError(f"記録の流局が山牌と一致しません（{event.turn}ターン目）")
+            engine.game_state = GameState.GAME_OVER
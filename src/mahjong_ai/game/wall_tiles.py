@@ -1,9 +1,134 @@
 """山牌管理システム"""
 
 import random
-from typing import List, Optional
+from array import array
+from typing import List, Optional, Sequence, Tuple
 
-from mahjong_ai.models.tile import Tile
+from mahjong_ai.models.tile import TILE_KIND_COUNT, TILES_PER_KIND, Tile
+
+# 嶺上牌として分離する枚数
+RINSHAN_COUNT = 4
+
+# シャッフル前の山牌（索子1-9を各6枚、牌順）
+CANONICAL_TILES: Tuple[Tile, ...] = tuple(
+    Tile.of("sou", value) for value in range(1, 10) for _ in range(TILES_PER_KIND)
+)
+
+# シャッフル前の山牌のtile_id列
+CANONICAL_IDS = bytes(tile.tile_id for tile in CANONICAL_TILES)
+
+# 山牌1つ分の枚数
+WALL_SIZE = len(CANONICAL_TILES)
+
+# 山牌の牌の種類（索子1-9のtile_id）
+WALL_KINDS = range(len(CANONICAL_TILES) // TILES_PER_KIND)
+
+# tile_idから山牌の牌への対応表（load() でtile_id列を牌のリストに変換する）
+_WALL_TILES_BY_ID: Tuple[Tile, ...] = tuple(Tile.from_id(tile_id) for tile_id in WALL_KINDS)
+
+
+def shuffled_wall_ids(seed: int) -> bytearray:
+    """シードから山牌のtile_id列を生成
+
+    同じシードからは常に同じ並びが得られます。並びは
+    random.Random(seed) で CANONICAL_TILES をシャッフルした結果と一致します。
+
+    Args:
+        seed: 山牌のシード
+
+    Returns:
+        シャッフル済みのtile_id列（先頭RINSHAN_COUNT枚が嶺上牌、末尾から順にツモ）
+    """
+    wall_ids = bytearray(CANONICAL_IDS)
+    random.Random(seed).shuffle(wall_ids)
+    return wall_ids
+
+
+class DealPool:
+    """シャッフル済みの山牌をまとめて生成して保持するクラス
+
+    各山牌はマスターシードから導いたシードで生成され、tile_id列として
+    1つのバイト配列に連続して格納されます。山牌ごとのシードを保持するため、
+    任意の山牌を WallTiles(seed=pool.seed_of(index)) で再現できます。
+    使い切った場合は同じマスターシードの乱数列の続きで次の山牌を生成します。
+
+    Attributes:
+        seed: マスターシード
+        size: 1回に生成する山牌の数
+    """
+
+    def __init__(self, size: int, seed: Optional[int] = None) -> None:
+        """山牌プールを生成
+
+        Args:
+            size: 1回に生成する山牌の数
+            seed: マスターシード（Noneの場合は無作為）
+
+        Raises:
+            ValueError: 山牌の数が1未満の場合
+        """
+        if size < 1:
+            raise ValueError("山牌プールのサイズは1以上である必要があります")
+
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self.size = size
+        self._master = random.Random(self.seed)
+        self._seeds = array("Q")
+        self._walls = bytearray()
+        self._position = 0
+        self._fill()
+
+    def __len__(self) -> int:
+        """生成済みの山牌の数"""
+        return len(self._seeds)
+
+    def seed_of(self, index: int) -> int:
+        """山牌のシードを取得
+
+        Args:
+            index: 山牌の番号
+
+        Returns:
+            山牌のシード
+        """
+        return self._seeds[index]
+
+    def wall_ids(self, index: int) -> bytes:
+        """山牌のtile_id列を取得
+
+        Args:
+            index: 山牌の番号
+
+        Returns:
+            シャッフル済みのtile_id列
+        """
+        if not 0 <= index < len(self._seeds):
+            raise IndexError(f"山牌の番号が範囲外です: {index}")
+        start = index * WALL_SIZE
+        return bytes(self._walls[start : start + WALL_SIZE])
+
+    def next_wall(self) -> Tuple[int, bytes]:
+        """次の山牌を取得
+
+        Returns:
+            (山牌のシード, tile_id列) のタプル
+        """
+        if self._position == len(self._seeds):
+            self._fill()
+        index = self._position
+        self._position += 1
+        return self._seeds[index], self.wall_ids(index)
+
+    def rewind(self) -> None:
+        """最初の山牌から取得し直す（同じ配牌で別の方針を比較する場合など）"""
+        self._position = 0
+
+    def _fill(self) -> None:
+        """山牌をsize個生成して追加"""
+        for _ in range(self.size):
+            wall_seed = self._master.getrandbits(64)
+            self._seeds.append(wall_seed)
+            self._walls += shuffled_wall_ids(wall_seed)
 
 
 class WallTiles:
@@ -11,13 +136,43 @@ class WallTiles:
 
     麻雀の山牌（残りの牌）を管理し、牌の抽選機能を提供します。
     Phase 1では索子のみをサポートし、各種類6枚ずつ計54枚を管理します。
+
+    ツモ順の牌のリストと並行して種類ごとの残り枚数（嶺上牌を除く）を保持するため、
+    牌の有無・残り枚数・牌分布の取得はリストを走査しません。
+
+    山牌の並びは次の優先順で決まります。
+    1. reset(seed) またはコンストラクタのseed: シードから一意に決まる並び
+    2. deal_pool: 山牌プールから順に取り出した並び
+       （コンストラクタで最初の山牌を、以降はreset()のたびに次の山牌を取り出す）
+    3. rng: 注入された乱数生成器でシャッフルした並び（省略時はモジュールのrandom）
+
+    Attributes:
+        rng: シャッフルに使う乱数生成器
+        deal_pool: 山牌を取り出す山牌プール
+        seed: 現在の山牌のシード（シードから生成していない場合はNone）
     """
 
-    def __init__(self) -> None:
-        """山牌を初期化"""
+    def __init__(
+        self,
+        rng: Optional[random.Random] = None,
+        seed: Optional[int] = None,
+        deal_pool: Optional[DealPool] = None,
+    ) -> None:
+        """山牌を初期化
+
+        Args:
+            rng: シャッフルに使う乱数生成器（Noneの場合はモジュールのrandomを使用）
+            seed: 最初の山牌のシード
+            deal_pool: 山牌を取り出す山牌プール
+                （seedを省略した場合、最初の山牌もプールから取り出す）
+        """
+        self.rng = rng
+        self.deal_pool = deal_pool
+        self.seed: Optional[int] = None
         self._tiles: List[Tile] = []
         self._rinshan_tiles: List[Tile] = []  # 嶺上牌
-        self.reset()
+        self._counts = array("b", bytes(TILE_KIND_COUNT))  # 残り牌のtile_idごとの枚数
+        self.reset(seed)
 
     @property
     def remaining_tiles(self) -> List[Tile]:
@@ -46,23 +201,105 @@ class WallTiles:
         """
         return len(self._rinshan_tiles)
 
-    def reset(self) -> None:
-        """山牌をリセット（初期状態に戻す）"""
-        self._tiles.clear()
-        self._rinshan_tiles.clear()
+    def reset(self, seed: Optional[int] = None) -> None:
+        """山牌をリセット（初期状態に戻す）
 
-        # 索子1-9を各6枚ずつ作成
-        all_tiles = []
-        for value in range(1, 10):
-            for _ in range(6):
-                all_tiles.append(Tile(suit="sou", value=value))
+        Args:
+            seed: 山牌のシード（指定した場合はシードから一意に決まる並びにする）
+        """
+        if seed is not None:
+            self.load(shuffled_wall_ids(seed), seed)
+            return
+
+        if self.deal_pool is not None:
+            wall_seed, wall_ids = self.deal_pool.next_wall()
+            self.load(wall_ids, wall_seed)
+            return
+
+        # シャッフル前の山牌を複製してシャッフル
+        all_tiles = list(CANONICAL_TILES)
+        if self.rng is not None:
+            self.rng.shuffle(all_tiles)
+        else:
+            random.shuffle(all_tiles)
 
-        # シャッフル
-        random.shuffle(all_tiles)
-        
         # 嶺上牌として4枚を分離
-        self._rinshan_tiles = all_tiles[:4]
-        self._tiles = all_tiles[4:]
+        self._rinshan_tiles = all_tiles[:RINSHAN_COUNT]
+        self._tiles = all_tiles[RINSHAN_COUNT:]
+        self._recount()
+        self.seed = None
+
+    def load(self, wall_ids: Sequence[int], seed: Optional[int] = None, rinshan_count: int = RINSHAN_COUNT) -> None:
+        """tile_id列から山牌を設定
+
+        Args:
+            wall_ids: シャッフル済みのtile_id列（先頭rinshan_count枚が嶺上牌）
+            seed: tile_id列のシード（分かっている場合）
+            rinshan_count: 先頭の嶺上牌の枚数（暗槓後の山牌を再現する場合に指定）
+        """
+        wall_ids = bytes(wall_ids)
+        all_tiles = list(map(_WALL_TILES_BY_ID.__getitem__, wall_ids))
+        self._rinshan_tiles = all_tiles[:rinshan_count]
+        self._tiles = all_tiles[rinshan_count:]
+        counts = array("b", bytes(TILE_KIND_COUNT))
+        for tile_id in WALL_KINDS:
+            counts[tile_id] = wall_ids.count(tile_id, rinshan_count)
+        self._counts[:] = counts
+        self.seed = seed
+
+    def is_untouched(self) -> bool:
+        """1枚もツモしていない山牌かどうか
+
+        Returns:
+            残り牌・嶺上牌がリセット直後の枚数のままの場合True
+        """
+        return len(self._tiles) == WALL_SIZE - RINSHAN_COUNT and len(self._rinshan_tiles) == RINSHAN_COUNT
+
+    def _recount(self) -> None:
+        """残り牌から種類ごとの枚数を数え直す"""
+        counts = array("b", bytes(TILE_KIND_COUNT))
+        for tile in self._tiles:
+            counts[tile.tile_id] += 1
+        self._counts[:] = counts
+
+    def counts_view(self) -> memoryview:
+        """残り牌の枚数ベクトルの読み取り専用ビューを取得
+
+        Hand.counts_view() と同じtile_id順です。嶺上牌は含みません。
+        山牌を変更するとビューの内容も変わります。
+
+        Returns:
+            tile_idを添字とする残り枚数の読み取り専用memoryview
+        """
+        return memoryview(self._counts).toreadonly()
+
+    def wall_ids(self) -> bytes:
+        """現在の山牌をtile_id列で取得
+
+        rinshan_count と合わせて load() に渡すと同じ状態の山牌を再現できます。
+
+        Returns:
+            残りの嶺上牌と残り牌のtile_id列（先頭が嶺上牌、末尾から順にツモ）
+        """
+        return bytes(tile.tile_id for tile in self._rinshan_tiles + self._tiles)
+
+    def copy(self) -> "WallTiles":
+        """山牌の複製を作成
+
+        牌は不変のフライウェイトなので、並びのリストだけを複製します。
+        シャッフルは行わず、乱数生成器と山牌プールは元の山牌と共有します。
+
+        Returns:
+            同じ並び・同じ残り枚数の新しい山牌
+        """
+        wall = WallTiles.__new__(WallTiles)
+        wall.rng = self.rng
+        wall.deal_pool = self.deal_pool
+        wall.seed = self.seed
+        wall._tiles = self._tiles.copy()
+        wall._rinshan_tiles = self._rinshan_tiles.copy()
+        wall._counts = array("b", self._counts)
+        return wall
 
     def draw_tile(self) -> Tile:
         """牌を1枚抽選
@@ -77,7 +314,9 @@ class WallTiles:
             raise ValueError("山牌が空です")
 
         # 最後の牌を取得（効率的）
-        return self._tiles.pop()
+        tile = self._tiles.pop()
+        self._counts[tile.tile_id] -= 1
+        return tile
 
     def peek_next_tile(self) -> Tile:
         """次に抽選される牌を確認（実際には抽選しない）
@@ -103,7 +342,7 @@ class WallTiles:
         Returns:
             存在する場合True、そうでなければFalse
         """
-        return tile in self._tiles
+        return self._counts[tile.tile_id] > 0
 
     def count_tile(self, tile: Tile) -> int:
         """指定された牌の残り枚数をカウント
@@ -114,7 +353,7 @@ class WallTiles:
         Returns:
             指定された牌の残り枚数
         """
-        return self._tiles.count(tile)
+        return self._counts[tile.tile_id]
 
     def draw_specific_tile(self, tile: Tile) -> Tile:
         """特定の牌を抽選（デバッグ用）
@@ -130,11 +369,12 @@ class WallTiles:
         Raises:
             ValueError: 指定された牌が山牌に存在しない場合
         """
-        if tile not in self._tiles:
+        if not self.has_tile(tile):
             raise ValueError(f"指定された牌{tile}が山牌に存在しません")
 
         # 指定された牌を除去
         self._tiles.remove(tile)
+        self._counts[tile.tile_id] -= 1
         return tile
 
     def get_tile_distribution(self) -> dict[Tile, int]:
@@ -143,11 +383,8 @@ class WallTiles:
         Returns:
             牌をキー、枚数を値とする辞書
         """
-        distribution = {}
-        for value in range(1, 10):
-            tile = Tile(suit="sou", value=value)
-            distribution[tile] = self.count_tile(tile)
-        return distribution
+        counts = self._counts
+        return {Tile.from_id(tile_id): counts[tile_id] for tile_id in WALL_KINDS}
 
     def is_empty(self) -> bool:
         """山牌が空かどうかを判定
@@ -172,10 +409,18 @@ class WallTiles:
         if count > self.remaining_count:
             raise ValueError(f"山牌の残り枚数（{self.remaining_count}）が不足しています（要求: {count}）")
 
-        drawn_tiles = []
-        for _ in range(count):
-            drawn_tiles.append(self.draw_tile())
+        if count <= 0:
+            return []
 
+        # 末尾count枚をツモ順（末尾から）に取り出す
+        start = len(self._tiles) - count
+        drawn_tiles = self._tiles[start:]
+        drawn_tiles.reverse()
+        del self._tiles[start:]
+
+        counts = self._counts
+        for tile in drawn_tiles:
+            counts[tile.tile_id] -= 1
         return drawn_tiles
     
     def draw_rinshan_tile(self) -> Tile:
@@ -192,6 +437,25 @@ class WallTiles:
         
         return self._rinshan_tiles.pop()
     
+    def put_back_tile(self, tile: Tile) -> None:
+        """ツモした牌を山牌の先頭（次にツモされる位置）に戻す
+
+        操作を元に戻す場合に使います。
+
+        Args:
+            tile: 戻す牌
+        """
+        self._tiles.append(tile)
+        self._counts[tile.tile_id] += 1
+
+    def put_back_rinshan_tile(self, tile: Tile) -> None:
+        """ツモした嶺上牌を嶺上牌の先頭（次にツモされる位置）に戻す
+
+        Args:
+            tile: 戻す嶺上牌
+        """
+        self._rinshan_tiles.append(tile)
+
     def has_rinshan_tiles(self) -> bool:
         """嶺上牌が残っているかチェック
         
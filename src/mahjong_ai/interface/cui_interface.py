@@ -4,11 +4,66 @@ import os
 import sys
 from typing import List, Optional
 
+from mahjong_ai.game.events import EventSink, EventType, GameEvent
 from mahjong_ai.game.game_engine import GameEngine, GameState
+from mahjong_ai.logic.waits import WaitResult
 from mahjong_ai.models.tile import Tile
 from mahjong_ai.utils.logger import get_logger, log_action, log_error, log_game_state, log_ui_action
 
 
+class ConsoleEventSink(EventSink):
+    """ゲームイベントごとに進行状況を画面に表示する出力先
+
+    GameEngine は画面に出力しないため、CUIInterface はこの出力先を登録して
+    ツモ・打牌などの結果（現在の手牌・向聴数など）を表示します。
+    """
+
+    def __init__(self, engine: GameEngine) -> None:
+        """表示するエンジンを保持
+
+        Args:
+            engine: イベントを出力するゲームエンジン
+        """
+        self.engine = engine
+
+    def write(self, event: GameEvent) -> None:
+        """イベントに応じたメッセージを表示
+
+        Args:
+            event: ゲームエンジンが出力したイベント
+        """
+        engine = self.engine
+        tiles = [Tile.from_id(tile_id) for tile_id in event.tiles]
+
+        if event.type == EventType.DEAL:
+            print(f"ゲーム開始！ 初期手牌: {engine.current_hand}")
+        elif event.type == EventType.DRAW:
+            print(f"ツモ: {tiles[0]}")
+            self._print_hand_after_draw(tiles[0], "ツモ和了可能！")
+        elif event.type in (EventType.DISCARD, EventType.RIICHI):
+            if event.type == EventType.RIICHI:
+                print("リーチ宣言！")
+            print(f"打牌: {tiles[0]}")
+            print(f"現在の手牌: {engine.current_hand}")
+        elif event.type == EventType.KAN:
+            print(f"暗槓: {tiles[0]} × 4")
+            print(f"嶺上ツモ: {tiles[1]}")
+            self._print_hand_after_draw(tiles[1], "嶺上開花可能！")
+        elif event.type == EventType.WIN:
+            print(f"ツモ和了！ 和了牌: {tiles[0]}")
+            return
+        else:
+            return
+
+        print(f"向聴数: {engine.shanten}")
+
+    def _print_hand_after_draw(self, drawn_tile: Tile, winning_message: str) -> None:
+        """ツモ後の手牌と、和了可能な場合はその旨を表示"""
+        print(f"現在の手牌: {self.engine.current_hand}")
+        if self.engine.check_winning_hand():
+            print(f"{winning_message} 和了牌: {drawn_tile}")
+
+
 class CUIInterface:
     """コマンドラインユーザーインターフェース
 
@@ -18,11 +73,11 @@ class CUIInterface:
 
     def __init__(self) -> None:
         """CUIインターフェースを初期化"""
-        self.logger = get_logger()
         self.engine = GameEngine()
+        self.engine.add_event_sink(ConsoleEventSink(self.engine))
         self.running = True
         
-        self.logger.info("CUIInterface初期化完了")
+        get_logger().info("CUIInterface初期化完了")
 
     def start(self) -> None:
         """メインゲームループを開始"""
@@ -32,7 +87,7 @@ class CUIInterface:
             try:
                 self.main_menu()
             except KeyboardInterrupt:
-                self.logger.info("ユーザーによるゲーム終了")
+                get_logger().info("ユーザーによるゲーム終了")
                 print("\n\nゲームを終了します...")
                 self.running = False
             except Exception as e:
@@ -93,7 +148,7 @@ class CUIInterface:
             self.display_help()
             input("\n続行するには何かキーを押してください...")
         elif choice == 3:
-            self.engine.reset_game()
+            self.process_reset_game()
 
     def show_discard_menu(self) -> None:
         """打牌メニュー"""
@@ -186,7 +241,7 @@ class CUIInterface:
             self.display_help()
             input("\n続行するには何かキーを押してください...")
         elif (choice == 2 and not self.engine.can_draw()) or (choice == 3 and self.engine.can_draw()):
-            self.engine.reset_game()
+            self.process_reset_game()
 
     def process_kan(self) -> None:
         """暗槓処理"""
@@ -275,10 +330,15 @@ class CUIInterface:
         choice = self.get_menu_choice(2)
 
         if choice == 1:
-            self.engine.reset_game()
+            self.process_reset_game()
         elif choice == 2:
             self.running = False
 
+    def process_reset_game(self) -> None:
+        """ゲームリセット処理"""
+        self.engine.reset_game()
+        print("ゲームをリセットしました")
+
     def process_start_game(self) -> None:
         """ゲーム開始処理"""
         print("\nゲームを開始します...")
@@ -291,15 +351,15 @@ class CUIInterface:
         log_game_state(self.engine)
         
         if not self.engine.can_draw():
-            self.logger.warning(f"ツモ不可: can_draw()=False")
+            get_logger().warning(f"ツモ不可: can_draw()=False")
             print("ツモできません")
             input("\n続行するには何かキーを押してください...")
             return
 
         try:
-            self.logger.info("engine.draw_tile()呼び出し前")
+            get_logger().info("engine.draw_tile()呼び出し前")
             drawn_tile = self.engine.draw_tile()
-            self.logger.info(f"engine.draw_tile()呼び出し後: {drawn_tile}")
+            get_logger().info(f"engine.draw_tile()呼び出し後: {drawn_tile}")
 
             if self.engine.is_game_over():
                 if self.engine.is_winner:
@@ -398,9 +458,9 @@ class CUIInterface:
             # 13枚の状態でのみ聴牌表示
             if self.engine.current_hand.size == 13:
                 print("聴牌中です！")
-                winning_tiles = self.engine.get_winning_tiles()
-                if winning_tiles:
-                    print(f"待ち牌: {self.format_tile_list(winning_tiles)}")
+                waits = self.engine.get_waits()
+                if waits.live_tiles:
+                    print(f"待ち牌: {self.format_waits(waits)}")
             else:
                 print(f"向聴数: {shanten}")
         else:
@@ -513,6 +573,10 @@ class CUIInterface:
         """牌リストの整形"""
         return " ".join(str(tile) for tile in tiles)
     
+    def format_waits(self, waits: WaitResult) -> str:
+        """待ち牌と残り枚数の整形"""
+        return " ".join(f"{tile}(残り{count}枚)" for tile, count in waits.tiles.items() if count > 0)
+    
     def format_kan_tiles(self) -> str:
         """暗槓牌リストの整形"""
         kan_groups = []
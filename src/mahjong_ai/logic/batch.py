@@ -0,0 +1,268 @@
+"""NumPyによる多数の手牌の一括評価
+
+(N, 34) の枚数行列（Hand.counts_view() と同じtile_id順）を受け取り、
+向聴数・和了判定・待ち牌を行列演算でまとめて求めます。
+通常形の向聴数はテーブルファイルの向聴数の配列を5進数キーで一括参照します。
+
+NumPyはオプションの依存関係（web extra）です。インストールされていない場合、
+このモジュールのimportは成功しますが、評価を行うとImportErrorになります。
+"""
+
+from typing import NamedTuple, Optional, Tuple
+
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.logic.shanten_table import KEY_BASE, KEY_POWERS, SUIT_SIZE, UNCOMPUTED
+from mahjong_ai.logic.table_file import SuitTableFile, open_table_file
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import TILE_KIND_COUNT
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpyはオプション
+    np = None
+
+# 和了形の枚数
+WINNING_SIZE = 14
+
+
+class BatchResult(NamedTuple):
+    """一括評価の結果
+
+    Attributes:
+        shanten: 各手牌の向聴数（int8, 長さN）
+        is_winning: 各手牌が和了形かどうか（bool, 長さN）
+        wait_masks: 各手牌の待ち牌（bool, (N, 34)、3n+1枚の手牌のみ。ツモで和了になる種類がTrue）
+    """
+
+    shanten: "np.ndarray"
+    is_winning: "np.ndarray"
+    wait_masks: "np.ndarray"
+
+
+def _require_numpy() -> None:
+    """NumPyがインストールされていることを確認
+
+    Raises:
+        ImportError: NumPyがインストールされていない場合
+    """
+    if np is None:
+        raise ImportError("一括評価にはNumPyが必要です（poetry install --extras web）")
+
+
+class BatchEvaluator:
+    """多数の手牌の向聴数・和了判定・待ち牌を一括で求めるクラス
+
+    結果は各手牌に ShantenCalculator.calculate_shanten、
+    WinningChecker.is_winning_hand、shanten_after_each_draw を適用した結果と一致します。
+    5枚以上の牌を含む手牌や、テーブルファイルに値がない形の手牌は
+    その行だけ ShantenCalculator で計算します。
+    """
+
+    def __init__(
+        self,
+        table_file: Optional[SuitTableFile] = None,
+        shanten_calculator: Optional[ShantenCalculator] = None,
+    ) -> None:
+        """評価器を初期化
+
+        Args:
+            table_file: 通常形の向聴数を参照するテーブルファイル
+                （Noneの場合は既定のテーブルファイルを読み込む。生成は行わない）
+            shanten_calculator: 表引きできない行に使う向聴数計算器（Noneの場合は新規作成）
+
+        Raises:
+            ImportError: NumPyがインストールされていない場合
+            FileNotFoundError: table_fileを省略し、既定のテーブルファイルがない場合
+                （scripts/build_tables.py または load_table_file(regenerate=True) で生成する）
+            ValueError: table_fileを省略し、既定のテーブルファイルが不正な場合
+        """
+        _require_numpy()
+        self.table_file = table_file if table_file is not None else open_table_file()
+        self.shanten_calculator = shanten_calculator if shanten_calculator is not None else ShantenCalculator()
+        self._values = np.frombuffer(self.table_file.shanten_values, dtype=np.int8)
+        self._powers = np.array(KEY_POWERS, dtype=np.int64)
+
+    def evaluate(self, counts: "np.ndarray") -> BatchResult:
+        """向聴数・和了判定・待ち牌を一括で求める
+
+        Args:
+            counts: (N, 34) の枚数行列（uint8）
+
+        Returns:
+            一括評価の結果
+        """
+        counts = self._validate(counts)
+        normal, fallback = self._normal_shanten(counts)
+        sizes = counts.sum(axis=1, dtype=np.int64)
+        seven_pairs, is_seven_pairs = self._seven_pairs(counts, sizes)
+
+        is_winning = (sizes == WINNING_SIZE) & ((normal == -1) | is_seven_pairs)
+        shanten = np.minimum(normal, seven_pairs)
+        shanten[is_winning] = -1
+
+        wait_masks = self._wait_masks(counts, sizes)
+
+        # 表引きできない行は1行ずつ計算する
+        for row in np.flatnonzero(fallback):
+            hand = Hand.from_counts(counts[row].tobytes())
+            shanten[row] = self.shanten_calculator.calculate_shanten(hand)
+            is_winning[row] = self.shanten_calculator.winning_checker.is_winning_hand(hand)
+            wait_masks[row] = self._scalar_waits(counts[row], int(sizes[row]))
+
+        return BatchResult(shanten.astype(np.int8), is_winning, wait_masks)
+
+    def shanten(self, counts: "np.ndarray") -> "np.ndarray":
+        """向聴数を一括で求める
+
+        Args:
+            counts: (N, 34) の枚数行列（uint8）
+
+        Returns:
+            各手牌の向聴数（int8, 長さN）
+        """
+        return self.evaluate(counts).shanten
+
+    def is_winning(self, counts: "np.ndarray") -> "np.ndarray":
+        """和了判定を一括で行う
+
+        Args:
+            counts: (N, 34) の枚数行列（uint8）
+
+        Returns:
+            各手牌が和了形かどうか（bool, 長さN）
+        """
+        return self.evaluate(counts).is_winning
+
+    def wait_masks(self, counts: "np.ndarray") -> "np.ndarray":
+        """待ち牌を一括で求める
+
+        Args:
+            counts: (N, 34) の枚数行列（uint8）
+
+        Returns:
+            各手牌の待ち牌（bool, (N, 34)）
+        """
+        return self.evaluate(counts).wait_masks
+
+    @staticmethod
+    def _validate(counts: "np.ndarray") -> "np.ndarray":
+        """枚数行列の形を確認
+
+        Raises:
+            ValueError: (N, 34) の行列でない場合
+        """
+        counts = np.asarray(counts, dtype=np.uint8)
+        if counts.ndim != 2 or counts.shape[1] != TILE_KIND_COUNT:
+            raise ValueError(f"枚数行列は (N, {TILE_KIND_COUNT}) である必要があります: {counts.shape}")
+        return counts
+
+    def _lookup(self, keys: "np.ndarray") -> "np.ndarray":
+        """5進数キーの向聴数を一括で参照（範囲外のキーはUNCOMPUTED）"""
+        in_range = keys < len(self._values)
+        values = np.full(keys.shape, UNCOMPUTED, dtype=np.int16)
+        values[in_range] = self._values[keys[in_range]]
+        return values
+
+    def _normal_shanten(self, counts: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """通常形の向聴数と、表引きできない行のマスクを求める"""
+        suit = counts[:, :SUIT_SIZE]
+        overflow = (suit >= KEY_BASE).any(axis=1)
+        keys = suit.astype(np.int64) @ self._powers
+        keys[overflow] = 0
+
+        normal = self._lookup(keys)
+        empty = keys == 0
+        normal[empty] = 8
+        fallback = overflow | (normal == UNCOMPUTED)
+        return normal, fallback
+
+    @staticmethod
+    def _seven_pairs(counts: "np.ndarray", sizes: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """七対子の向聴数と、七対子の和了形かどうかを求める
+
+        ShantenCalculator._seven_pairs_shanten と同じ規則で計算します。
+        """
+        pairs = np.minimum((counts // 2).sum(axis=1, dtype=np.int64), 7)
+        singles = (counts % 2).sum(axis=1, dtype=np.int64)
+
+        shanten = 6 - pairs
+        thirteen = sizes == 13
+        shanten = np.where(thirteen & (pairs == 6) & (singles == 1), 0, np.where(thirteen & (pairs >= 6), 1, shanten))
+        shanten = np.maximum(shanten, 0)
+        shanten[sizes == 0] = 6
+
+        exact_pairs = (counts == 2).sum(axis=1)
+        is_seven_pairs = (sizes == WINNING_SIZE) & (exact_pairs == 7)
+        return shanten, is_seven_pairs
+
+    def _wait_masks(self, counts: "np.ndarray", sizes: "np.ndarray") -> "np.ndarray":
+        """3n+1枚の手牌について、ツモで和了形になる種類を求める"""
+        rows = counts.shape[0]
+        masks = np.zeros((rows, TILE_KIND_COUNT), dtype=bool)
+        waiting = sizes % 3 == 1
+        if not waiting.any():
+            return masks
+
+        suit = counts[:, :SUIT_SIZE].astype(np.int64)
+        keys = suit @ self._powers
+        exact_pairs = (counts == 2).sum(axis=1)
+        overflow = (suit >= KEY_BASE).any(axis=1)
+        fallback = np.zeros(rows, dtype=bool)
+        table = self.shanten_calculator.table
+        for tile_id in range(SUIT_SIZE):
+            column = suit[:, tile_id]
+            drawable = waiting & ~overflow & (column < KEY_BASE - 1)
+            after = self._lookup(np.where(drawable, keys + KEY_POWERS[tile_id], 0))
+            # 13枚に1枚加えて2枚の種類がちょうど7つになれば七対子
+            seven_pairs = (sizes == 13) & (exact_pairs + (column == 1) - (column == 2) == 7)
+            masks[:, tile_id] = drawable & ((after == -1) | seven_pairs)
+            fallback |= drawable & (after == UNCOMPUTED)
+
+            # 4枚の種類に加えると5進数キーで表せないため、そのセルだけ計算する
+            for row in np.flatnonzero(waiting & ~overflow & (column == KEY_BASE - 1)):
+                after_counts = [int(count) for count in suit[row]]
+                after_counts[tile_id] += 1
+                masks[row, tile_id] = table.normal_shanten(after_counts) == -1
+
+        # 5枚以上の種類や表にない形を含む行は1行ずつ計算する
+        fallback |= waiting & overflow
+        for row in np.flatnonzero(fallback):
+            masks[row] = self._scalar_waits(counts[row], int(sizes[row]))
+        return masks
+
+    def _scalar_waits(self, row: "np.ndarray", size: int) -> "np.ndarray":
+        """1行分の待ち牌を ShantenCalculator で求める"""
+        mask = np.zeros(TILE_KIND_COUNT, dtype=bool)
+        if size % 3 != 1:
+            return mask
+        draw_table = self.shanten_calculator.draw_shanten_from_counts([int(count) for count in row], size)
+        for tile_id, shanten in draw_table.items():
+            mask[tile_id] = shanten == -1
+        return mask
+
+
+# プロセス内で共有する評価器
+_default_evaluator: Optional[BatchEvaluator] = None
+
+
+def evaluate_batch(counts: "np.ndarray") -> BatchResult:
+    """共有の評価器で向聴数・和了判定・待ち牌を一括で求める
+
+    初回呼び出し時に既定のテーブルファイルを読み込みます。ファイルの生成は行わないため、
+    事前に scripts/build_tables.py または load_table_file(regenerate=True) で生成してください。
+
+    Args:
+        counts: (N, 34) の枚数行列（uint8）
+
+    Returns:
+        一括評価の結果
+
+    Raises:
+        ImportError: NumPyがインストールされていない場合
+        FileNotFoundError: 既定のテーブルファイルがない場合
+        ValueError: 既定のテーブルファイルが不正な場合
+    """
+    global _default_evaluator
+    if _default_evaluator is None:
+        _default_evaluator = BatchEvaluator()
+    return _default_evaluator.evaluate(counts)
@@ -0,0 +1,88 @@
+"""計算結果のLRUキャッシュ"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """最大エントリ数を超えると最も古く参照されたエントリから破棄するキャッシュ
+
+    和了判定・待ち牌計算など、手牌の枚数ベクトルをキーとする計算結果の保存に使用します。
+
+    Attributes:
+        max_size: 最大エントリ数（0以下でキャッシュ無効）
+        hits: キャッシュヒット数
+        misses: キャッシュミス数
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """キャッシュを初期化
+
+        Args:
+            max_size: 最大エントリ数（0以下でキャッシュ無効）
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], V]) -> V:
+        """キーの値を取得（なければ計算して保存）
+
+        キャッシュ無効の場合は毎回計算し、統計情報も更新しません。
+
+        Args:
+            key: キャッシュのキー
+            compute: 値を計算する関数
+
+        Returns:
+            キーに対応する値
+        """
+        if self.max_size <= 0:
+            return compute()
+
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+
+        self.misses += 1
+        value = compute()
+        entries[key] = value
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+        return value
+
+    def info(self) -> Dict[str, int]:
+        """キャッシュの統計情報を取得
+
+        Returns:
+            ヒット数・ミス数・現在のエントリ数・最大エントリ数の辞書
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
+
+    def discard(self, key: Hashable) -> None:
+        """キーのエントリを破棄（なければ何もしない）
+
+        Args:
+            key: 破棄するキー
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """全エントリと統計情報を破棄"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """現在のエントリ数"""
+        return len(self._entries)
@@ -1,35 +1,82 @@
 """向聴数計算ロジック"""
 
 from collections import Counter
-from typing import Dict, List
-
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from mahjong_ai.logic.shanten_table import (
+    KEY_BASE,
+    KEY_POWERS,
+    SUIT_SIZE,
+    ShantenTable,
+    encode_counts,
+    get_shanten_table,
+)
 from mahjong_ai.logic.winning_checker import WinningChecker
 from mahjong_ai.models.hand import Hand
 from mahjong_ai.models.tile import Tile
 
+# 暗槓のない手牌の枚数（ツモ後）
+FULL_HAND_SIZE = 14
+
+
+def kan_count_for_size(size: int) -> int:
+    """手牌の枚数から暗槓の数を求める
+
+    暗槓1回ごとに手牌は3枚減ります（4枚を除いて嶺上牌を1枚ツモ）。
+    ツモ前（3n+1枚）・ツモ後（3n+2枚）のどちらの枚数でも同じ値になります。
+
+    Args:
+        size: 手牌の枚数
+
+    Returns:
+        暗槓の数
+    """
+    return max(0, (FULL_HAND_SIZE - size) // 3)
+
 
 class ShantenCalculator:
     """向聴数を計算するクラス
 
     麻雀の手牌の向聴数（あと何枚で聴牌になるか）を計算します。
     Phase 1では索子のみを対象とし、通常形と七対子の向聴数を計算します。
+    通常形の向聴数はデフォルトでShantenTableの表引きで求め、
+    use_table=Falseの場合は再帰探索（_find_best_shanten）を使用します。
     """
 
-    def __init__(self) -> None:
-        """向聴数計算器を初期化"""
-        self.winning_checker = WinningChecker()
+    def __init__(
+        self,
+        use_table: bool = True,
+        table: Optional[ShantenTable] = None,
+        winning_checker: Optional[WinningChecker] = None,
+    ) -> None:
+        """向聴数計算器を初期化
+
+        Args:
+            use_table: 通常形の向聴数を分解テーブルで計算するかどうか
+            table: 使用する分解テーブル（Noneの場合はプロセス共有のテーブル）
+            winning_checker: 和了判定に使う判定器（共有すると判定キャッシュも共有される）
+        """
+        self.winning_checker = winning_checker if winning_checker is not None else WinningChecker()
+        self.use_table = use_table
+        self.table = table if table is not None else get_shanten_table()
 
-    def calculate_shanten(self, hand: Hand) -> int:
+    def calculate_shanten(self, hand: Hand, kan_count: int = 0) -> int:
         """手牌の向聴数を計算
 
         通常形と七対子の向聴数を計算し、より小さい値を返します。
+        暗槓がある場合は暗槓を面子に数えた通常形の向聴数を分解テーブルで求めます
+        （七対子にはならないため評価しません）。
 
         Args:
             hand: 向聴数を計算する手牌
+            kan_count: 暗槓の数（kan_count_for_size(hand.size) で手牌の枚数から求められる）
 
         Returns:
             向聴数（-1: 和了, 0: 聴牌, 1以上: n向聴）
         """
+        if kan_count:
+            return self.table.normal_shanten(hand.counts_view()[:SUIT_SIZE], kan_count)
+
         # 和了形の判定
         if hand.size == 14 and self.winning_checker.is_winning_hand(hand):
             return -1
@@ -53,6 +100,10 @@ class ShantenCalculator:
         if hand.size == 0:
             return 8  # 空手牌の場合は8向聴相当
 
+        if self.use_table:
+            # 索子の枚数ベクトルを直接表引き
+            return self.table.normal_shanten(hand.counts_view()[:SUIT_SIZE])
+
         # 各牌の枚数を取得
         tile_counts = hand.get_tile_counts()
 
@@ -67,22 +118,200 @@ class ShantenCalculator:
         Returns:
             七対子の向聴数
         """
-        if hand.size == 0:
-            return 6  # 空手牌の場合は6向聴相当
-
-        # 各牌の枚数を取得
-        tile_counts = hand.get_tile_counts()
-
         # 対子の数をカウント
         pairs = 0
         singles = 0
 
-        for count in tile_counts.values():
+        for count in hand.counts_view():
             if count >= 2:
                 pairs += count // 2
             if count % 2 == 1:
                 singles += 1
 
+        return self._seven_pairs_shanten(pairs, singles, hand.size)
+
+    def shanten_after_each_discard(self, hand: Hand, kan_count: int = 0) -> Dict[int, int]:
+        """各牌を打牌した後の向聴数を一括で計算
+
+        Args:
+            hand: 打牌前の手牌
+            kan_count: 暗槓の数
+
+        Returns:
+            打牌する牌のtile_idをキー、打牌後の向聴数を値とする辞書
+        """
+        return self.discard_shanten_from_counts(hand.counts_view(), hand.size, kan_count)
+
+    def discard_shanten_from_counts(self, counts: Sequence[int], size: int, kan_count: int = 0) -> Dict[int, int]:
+        """枚数ベクトルから各牌を1枚除いた後の向聴数を一括で計算
+
+        Phase 1の索子9種類だけを走査し、同じ種類の牌は1回だけ評価します。
+        除く前のキーと、除いた種類の枚数が偶数・奇数の場合の七対子の向聴数を
+        1回だけ求め、除いた後の値を差分で求めます。手牌のコピーは作りません。
+        各値は除いた後の手牌に calculate_shanten を適用した結果と一致します。
+
+        Args:
+            counts: tile_idを添字とする枚数ベクトル
+            size: 枚数ベクトルの合計枚数
+            kan_count: 暗槓の数
+
+        Returns:
+            除く牌のtile_idをキー、除いた後の向聴数を値とする辞書
+        """
+        suit_counts = list(counts[:SUIT_SIZE])
+        discard_table: Dict[int, int] = {}
+
+        if kan_count:
+            for tile_id, count in enumerate(suit_counts):
+                if count:
+                    suit_counts[tile_id] -= 1
+                    discard_table[tile_id] = self.table.normal_shanten(suit_counts, kan_count)
+                    suit_counts[tile_id] += 1
+            return discard_table
+
+        size -= 1
+
+        pairs = 0
+        singles = 0
+        for count in suit_counts:
+            pairs += count // 2
+            singles += count % 2
+
+        # 1枚減らした時の七対子の向聴数（枚数が偶数なら対子が1つ減り、奇数なら孤立牌が1つ減る）
+        seven_pairs_from_even = self._seven_pairs_shanten(pairs - 1, singles + 1, size)
+        seven_pairs_from_odd = self._seven_pairs_shanten(pairs, singles - 1, size)
+
+        key: Optional[int] = None
+        if self.use_table and max(suit_counts) < KEY_BASE:
+            key = encode_counts(suit_counts)
+
+        for tile_id, count in enumerate(suit_counts):
+            if count == 0:
+                continue
+
+            if size == 0:
+                normal = 8
+            elif key is not None:
+                normal = self.table.normal_shanten_by_key(key - KEY_POWERS[tile_id])
+            elif self.use_table:
+                suit_counts[tile_id] -= 1
+                normal = self.table.normal_shanten(suit_counts)
+                suit_counts[tile_id] += 1
+            else:
+                suit_counts[tile_id] -= 1
+                normal = self._calculate_normal_shanten_recursive(
+                    {Tile.from_id(i): c for i, c in enumerate(suit_counts) if c}
+                )
+                suit_counts[tile_id] += 1
+
+            seven_pairs = seven_pairs_from_odd if count % 2 else seven_pairs_from_even
+            discard_table[tile_id] = min(normal, seven_pairs)
+
+        return discard_table
+
+    def shanten_after_each_draw(self, hand: Hand) -> Dict[int, int]:
+        """各牌をツモした後の向聴数を一括で計算
+
+        Args:
+            hand: ツモ前の手牌
+
+        Returns:
+            ツモする牌のtile_idをキー、ツモ後の向聴数を値とする辞書
+        """
+        return self.draw_shanten_from_counts(hand.counts_view(), hand.size)
+
+    def draw_shanten_from_counts(
+        self,
+        counts: Sequence[int],
+        size: int,
+        tile_ids: Iterable[int] = range(SUIT_SIZE),
+        kan_count: int = 0,
+    ) -> Dict[int, int]:
+        """枚数ベクトルに各牌を1枚加えた後の向聴数を一括で計算
+
+        discard_shanten_from_counts と同様に、Phase 1の索子9種類だけを走査し、
+        加える前のキーと七対子の向聴数を共有して差分で求めます。手牌のコピーは作りません。
+        各値はツモ後の手牌に calculate_shanten を適用した結果と一致します。
+
+        Args:
+            counts: tile_idを添字とする枚数ベクトル
+            size: 枚数ベクトルの合計枚数
+            tile_ids: 加える牌のtile_id（省略時はPhase 1の索子9種類すべて）
+            kan_count: 暗槓の数
+
+        Returns:
+            加える牌のtile_idをキー、加えた後の向聴数を値とする辞書
+        """
+        suit_counts = list(counts[:SUIT_SIZE])
+        draw_table: Dict[int, int] = {}
+
+        if kan_count:
+            for tile_id in tile_ids:
+                suit_counts[tile_id] += 1
+                draw_table[tile_id] = self.table.normal_shanten(suit_counts, kan_count)
+                suit_counts[tile_id] -= 1
+            return draw_table
+
+        size += 1
+
+        pairs = 0
+        singles = 0
+        exact_pairs = 0
+        for count in suit_counts:
+            pairs += count // 2
+            singles += count % 2
+            if count == 2:
+                exact_pairs += 1
+
+        # 1枚増やした時の七対子の向聴数（枚数が奇数なら対子が1つ増え、偶数なら孤立牌が1つ増える）
+        seven_pairs_to_even = self._seven_pairs_shanten(pairs + 1, singles - 1, size)
+        seven_pairs_to_odd = self._seven_pairs_shanten(pairs, singles + 1, size)
+
+        # 4枚の種類に加えた形は5進数キーで表せないため、その種類だけ枚数ベクトルで引く
+        key: Optional[int] = None
+        if self.use_table and max(suit_counts) < KEY_BASE:
+            key = encode_counts(suit_counts)
+
+        for tile_id in tile_ids:
+            count = suit_counts[tile_id]
+
+            # 七対子の和了（ちょうど2枚の種類が7つ）
+            if size == 14 and exact_pairs + (count == 1) - (count == 2) == 7:
+                draw_table[tile_id] = -1
+                continue
+
+            if key is not None and count < KEY_BASE - 1:
+                normal = self.table.normal_shanten_by_key(key + KEY_POWERS[tile_id])
+            elif self.use_table:
+                suit_counts[tile_id] += 1
+                normal = self.table.normal_shanten(suit_counts)
+                suit_counts[tile_id] -= 1
+            else:
+                suit_counts[tile_id] += 1
+                normal = self._calculate_normal_shanten_recursive(
+                    {Tile.from_id(i): c for i, c in enumerate(suit_counts) if c}
+                )
+                suit_counts[tile_id] -= 1
+
+            seven_pairs = seven_pairs_to_even if count % 2 else seven_pairs_to_odd
+            draw_table[tile_id] = min(normal, seven_pairs)
+
+        return draw_table
+
+    def _seven_pairs_shanten(self, pairs: int, singles: int, size: int) -> int:
+        """対子数・孤立牌数から七対子の向聴数を計算
+
+        Args:
+            pairs: 対子の数（4枚は2対子として数える）
+            singles: 奇数枚の牌の種類数
+            size: 手牌の枚数
+
+        Returns:
+            七対子の向聴数
+        """
+        if size == 0:
+            return 6  # 空手牌の場合は6向聴相当
+
         # 七対子には最大7対子が必要
         pairs = min(pairs, 7)
 
@@ -90,7 +319,7 @@ class ShantenCalculator:
         shanten = 6 - pairs
 
         # 13枚の場合の特別処理
-        if hand.size == 13:
+        if size == 13:
             if pairs == 6 and singles == 1:
                 shanten = 0  # 聴牌
             elif pairs >= 6:
@@ -177,8 +406,8 @@ class ShantenCalculator:
 
         # 順子を作る場合
         if first_tile.value <= 7:
-            next_tile = Tile(suit="sou", value=first_tile.value + 1)
-            next_next_tile = Tile(suit="sou", value=first_tile.value + 2)
+            next_tile = Tile.of("sou", first_tile.value + 1)
+            next_next_tile = Tile.of("sou", first_tile.value + 2)
 
             if (
                 next_tile in tile_counts
@@ -201,7 +430,7 @@ class ShantenCalculator:
 
         # 搭子（隣り合う2枚）を作る場合
         if first_tile.value <= 8:
-            next_tile = Tile(suit="sou", value=first_tile.value + 1)
+            next_tile = Tile.of("sou", first_tile.value + 1)
             if next_tile in tile_counts and tile_counts[next_tile] >= 1:
                 new_counts = tile_counts.copy()
                 new_counts[first_tile] -= 1
@@ -216,7 +445,7 @@ class ShantenCalculator:
 
         # 搭子（1つ空きの2枚）を作る場合
         if first_tile.value <= 7:
-            next_next_tile = Tile(suit="sou", value=first_tile.value + 2)
+            next_next_tile = Tile.of("sou", first_tile.value + 2)
             if next_next_tile in tile_counts and tile_counts[next_next_tile] >= 1:
                 new_counts = tile_counts.copy()
                 new_counts[first_tile] -= 1
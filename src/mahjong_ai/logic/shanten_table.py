@@ -0,0 +1,570 @@
+"""テーブル駆動の向聴数計算エンジン
+
+スートごとの9種類の枚数を5進数のキーに符号化し、そのキーに対する
+面子・搭子・雀頭の分解結果を表引きすることで向聴数を求めます。
+分解結果は一度計算したら再利用されるため、同じ形の手牌に対しては
+辞書の参照だけで向聴数が得られます。
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from mahjong_ai.models.tile import TILES_PER_KIND
+
+# スート内の牌の種類数
+SUIT_SIZE = 9
+
+# キーの基数（1種類あたり0-4枚）
+KEY_BASE = 5
+
+# 各桁の重み（tile_id順）
+KEY_POWERS: Tuple[int, ...] = tuple(KEY_BASE**i for i in range(SUIT_SIZE))
+
+# 5枚以上を含む形の事前計算で扱う1種類あたりの最大枚数（Phase 1の山牌は各種類6枚）
+OVERFLOW_MAX_COUNT = TILES_PER_KIND
+
+# 面子数の上限（14枚では4面子まで）
+MAX_MELDS = 4
+
+# 分解レコードのスロット数（面子数0-4 × 雀頭有無 × 残り0枚で終端したか）
+RECORD_SIZE = (MAX_MELDS + 1) * 2 * 2
+
+# 到達不能なスロットを表す値
+UNREACHABLE = -1
+
+# 事前計算済みの向聴数の配列で、値が未計算のキーを表す値
+UNCOMPUTED = 127
+
+# 分解レコードの型: スロットごとの最大搭子数
+Record = Tuple[int, ...]
+
+# 部分形の分解レコードを取得する関数の型
+RecordLookup = Callable[[int, List[int]], Record]
+
+
+def record_index(melds: int, has_pair: bool, closed: bool) -> int:
+    """分解レコードのスロット番号を取得
+
+    Args:
+        melds: 面子数
+        has_pair: 雀頭があるかどうか
+        closed: 再帰の末端で残り0枚になったかどうか
+
+    Returns:
+        スロット番号（0 - RECORD_SIZE-1）
+    """
+    return (melds * 2 + int(has_pair)) * 2 + int(closed)
+
+
+def iter_record(record: Record) -> Iterator[Tuple[int, int, bool, bool]]:
+    """分解レコードの到達可能なスロットを列挙
+
+    Args:
+        record: 分解レコード
+
+    Yields:
+        (面子数, 搭子数, 雀頭有無, 残り0枚で終端したか) のタプル
+    """
+    for index, tatsu in enumerate(record):
+        if tatsu == UNREACHABLE:
+            continue
+        yield index >> 2, tatsu, bool(index & 2), bool(index & 1)
+
+
+def encode_counts(counts: Sequence[int]) -> int:
+    """枚数ベクトルを5進数のキーに符号化
+
+    Args:
+        counts: tile_id順の枚数ベクトル（長さ9、各要素0-4）
+
+    Returns:
+        5進数キー
+    """
+    key = 0
+    for count, power in zip(counts, KEY_POWERS):
+        key += count * power
+    return key
+
+
+def decode_key(key: int) -> List[int]:
+    """5進数のキーを枚数ベクトルに復号
+
+    Args:
+        key: 5進数キー
+
+    Returns:
+        tile_id順の枚数ベクトル
+    """
+    counts = []
+    for _ in range(SUIT_SIZE):
+        key, count = divmod(key, KEY_BASE)
+        counts.append(count)
+    return counts
+
+
+@lru_cache(maxsize=None)
+def _rank_offsets(max_tiles: int) -> Tuple[Tuple[Tuple[Tuple[int, ...], ...], ...], int]:
+    """枚数ベクトルの通し番号を求める加算表を作成
+
+    Args:
+        max_tiles: 最大枚数
+
+    Returns:
+        (加算表, 枚数ベクトルの総数) のタプル。加算表[位置][残り枚数][枚数] は、
+        位置より前の種類が同じで位置の枚数がそれより少ない枚数ベクトルの数
+    """
+    # tails[位置][残り枚数] = 位置以降の種類の枚数ベクトル（合計が残り枚数以下）の数
+    tails = [[1] * (max_tiles + 1) for _ in range(SUIT_SIZE + 1)]
+    for position in range(SUIT_SIZE - 1, -1, -1):
+        for remaining in range(max_tiles + 1):
+            tails[position][remaining] = sum(
+                tails[position + 1][remaining - count] for count in range(min(OVERFLOW_MAX_COUNT, remaining) + 1)
+            )
+
+    offsets = []
+    for position in range(SUIT_SIZE):
+        rows = []
+        for remaining in range(max_tiles + 1):
+            row = [0]
+            for count in range(min(OVERFLOW_MAX_COUNT, remaining)):
+                row.append(row[-1] + tails[position + 1][remaining - count])
+            rows.append(tuple(row))
+        offsets.append(tuple(rows))
+    return tuple(offsets), tails[0][max_tiles]
+
+
+def overflow_array_length(max_tiles: int) -> int:
+    """通し番号で引く向聴数の配列の長さを取得
+
+    Args:
+        max_tiles: 最大枚数
+
+    Returns:
+        各種類0-OVERFLOW_MAX_COUNT枚、合計max_tiles枚以下の枚数ベクトルの数
+    """
+    return _rank_offsets(max_tiles)[1]
+
+
+def rank_counts(counts: Sequence[int], max_tiles: int) -> int:
+    """枚数ベクトルの通し番号を求める
+
+    通し番号は各種類0-OVERFLOW_MAX_COUNT枚、合計max_tiles枚以下の枚数ベクトルを
+    tile_id順の辞書順に並べた位置です（_iter_suit_counts の列挙順と一致）。
+
+    Args:
+        counts: tile_id順の枚数ベクトル（長さ9、各要素0-OVERFLOW_MAX_COUNT、合計max_tiles枚以下）
+        max_tiles: 最大枚数
+
+    Returns:
+        通し番号
+    """
+    offsets = _rank_offsets(max_tiles)[0]
+    rank = 0
+    remaining = max_tiles
+    for position, count in enumerate(counts):
+        rank += offsets[position][remaining][count]
+        remaining -= count
+    return rank
+
+
+def evaluate_record(record: Record, kan_count: int = 0) -> int:
+    """分解レコードから通常形の向聴数を評価
+
+    ShantenCalculator._find_best_shanten の末端評価と同じ規則で、
+    到達可能な全ての分解のうち最小の値を返します。
+    暗槓は手牌の外にある完成した面子として面子数に加えます。
+
+    Args:
+        record: 分解レコード
+        kan_count: 暗槓の数
+
+    Returns:
+        通常形の向聴数
+    """
+    best = 8
+    for melds, tatsu, has_pair, closed in iter_record(record):
+        melds += kan_count
+        if melds > MAX_MELDS:
+            continue
+        if closed and melds == MAX_MELDS:
+            value = -1 if has_pair else 0
+        elif closed and melds == 3 and has_pair:
+            value = 0
+        else:
+            value = 8 - melds * 2 - tatsu - (1 if has_pair else 0)
+        if value < best:
+            best = value
+    return best
+
+
+class ShantenTable:
+    """スート分解テーブルによる向聴数計算エンジン
+
+    各キーに対して「面子数・雀頭有無・残り0枚で終端したか」ごとの最大搭子数を
+    記録したレコードを保持します。レコードは最小の牌から面子・対子・搭子を
+    取り出す遷移で部分キーのレコードから組み立てるため、共通する部分形は
+    一度しか計算されません。
+
+    Phase 1の山牌は各種類6枚のため、5枚以上の牌を含む手牌は5進数キーで
+    表現できません。そのような形は枚数タプルをキーとする補助テーブルで
+    扱います。
+
+    attach_values() で事前計算済みの向聴数の配列（テーブルファイルを
+    mmapしたもの等）を登録すると、配列に値があるキーは配列から直接返します。
+    5枚以上を含む形の配列（通し番号で引く）も登録すると、その形も
+    分解レコードを組み立てずに配列から返します。
+
+    Attributes:
+        _records: 5進数キーから分解レコードへの対応表
+        _values: 5進数キーから通常形の向聴数への対応表
+        _overflow_records: 5枚以上を含む枚数タプルから分解レコードへの対応表
+        _overflow_values: 5枚以上を含む枚数タプルから通常形の向聴数への対応表
+        _kan_values: (暗槓の数, 枚数タプル) から暗槓後の通常形の向聴数への対応表
+        _precomputed: 5進数キーを添字とする事前計算済みの向聴数の配列
+        _precomputed_overflow: rank_counts() の通し番号を添字とする事前計算済みの向聴数の配列
+        _overflow_max_tiles: _precomputed_overflow が対象とする最大枚数
+    """
+
+    def __init__(self) -> None:
+        """空のテーブルで初期化"""
+        empty: List[int] = [UNREACHABLE] * RECORD_SIZE
+        empty[record_index(0, False, True)] = 0
+
+        self._records: Dict[int, Record] = {0: tuple(empty)}
+        self._values: Dict[int, int] = {}
+        self._overflow_records: Dict[Tuple[int, ...], Record] = {}
+        self._overflow_values: Dict[Tuple[int, ...], int] = {}
+        self._kan_values: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+        self._precomputed: Optional[Sequence[int]] = None
+        self._precomputed_overflow: Optional[Sequence[int]] = None
+        self._overflow_max_tiles = 0
+
+    @property
+    def size(self) -> int:
+        """計算済みのキー数
+
+        Returns:
+            テーブルに登録済みの5進数キーの数
+        """
+        return len(self._records)
+
+    def attach_values(
+        self, values: Optional[Sequence[int]], overflow_values: Optional[Sequence[int]] = None
+    ) -> None:
+        """事前計算済みの向聴数の配列を登録
+
+        Args:
+            values: 5進数キーを添字とする通常形の向聴数の配列
+                （長さKEY_BASE**SUIT_SIZE、未計算のキーはUNCOMPUTED。Noneで登録解除）
+            overflow_values: rank_counts() の通し番号を添字とする通常形の向聴数の配列
+                （長さoverflow_array_length(最大枚数)、対象とする最大枚数は長さから求める。
+                Noneの場合は5枚以上を含む形を従来どおり計算する）
+
+        Raises:
+            ValueError: 配列の長さが合わない場合
+        """
+        if values is not None and len(values) != KEY_BASE**SUIT_SIZE:
+            raise ValueError(f"向聴数の配列の長さが不正です: {len(values)}")
+
+        max_tiles = 0
+        if overflow_values is not None:
+            lengths = {overflow_array_length(tiles): tiles for tiles in range(SUIT_SIZE * OVERFLOW_MAX_COUNT + 1)}
+            if len(overflow_values) not in lengths:
+                raise ValueError(f"5枚以上を含む形の向聴数の配列の長さが不正です: {len(overflow_values)}")
+            max_tiles = lengths[len(overflow_values)]
+
+        self._precomputed = values
+        self._precomputed_overflow = overflow_values
+        self._overflow_max_tiles = max_tiles
+
+    def normal_shanten(self, counts: Sequence[int], kan_count: int = 0) -> int:
+        """枚数ベクトルから通常形の向聴数を取得
+
+        Args:
+            counts: tile_id順の枚数ベクトル（長さ9）
+            kan_count: 暗槓の数（暗槓後の手牌は面子数に暗槓を加えて評価する）
+
+        Returns:
+            通常形の向聴数（空の場合は8）
+        """
+        if kan_count:
+            signature = (kan_count, tuple(counts))
+            value = self._kan_values.get(signature)
+            if value is None:
+                value = evaluate_record(self.record(counts), kan_count)
+                self._kan_values[signature] = value
+            return value
+
+        if max(counts) >= KEY_BASE:
+            if (
+                self._precomputed_overflow is not None
+                and max(counts) <= OVERFLOW_MAX_COUNT
+                and sum(counts) <= self._overflow_max_tiles
+            ):
+                return self._precomputed_overflow[rank_counts(counts, self._overflow_max_tiles)]
+
+            signature = tuple(counts)
+            value = self._overflow_values.get(signature)
+            if value is None:
+                value = evaluate_record(self._overflow_record(list(counts)))
+                self._overflow_values[signature] = value
+            return value
+
+        key = encode_counts(counts)
+        if self._precomputed is not None:
+            value = self._precomputed[key]
+            if value != UNCOMPUTED:
+                return value
+
+        value = self._values.get(key)
+        if value is None:
+            value = evaluate_record(self._record_for_key(key, list(counts)))
+            self._values[key] = value
+        return value
+
+    def normal_shanten_by_key(self, key: int) -> int:
+        """5進数キーから通常形の向聴数を取得
+
+        Args:
+            key: 5進数キー
+
+        Returns:
+            通常形の向聴数
+        """
+        if self._precomputed is not None:
+            value = self._precomputed[key]
+            if value != UNCOMPUTED:
+                return value
+
+        value = self._values.get(key)
+        if value is None:
+            value = evaluate_record(self._record_for_key(key, decode_key(key)))
+            self._values[key] = value
+        return value
+
+    def record(self, counts: Sequence[int]) -> Record:
+        """枚数ベクトルの分解レコードを取得
+
+        Args:
+            counts: tile_id順の枚数ベクトル（長さ9）
+
+        Returns:
+            分解レコード
+        """
+        if max(counts) < KEY_BASE:
+            return self._record_for_key(encode_counts(counts), list(counts))
+        return self._overflow_record(list(counts))
+
+    def precompute(self, max_tiles: int = 14) -> int:
+        """到達可能な全てのキーを事前計算
+
+        各種類0-4枚、合計max_tiles枚以下の全ての形を登録します。
+
+        Args:
+            max_tiles: 対象とする最大枚数
+
+        Returns:
+            テーブルに登録済みのキー数
+        """
+        for counts in _iter_suit_counts(max_tiles):
+            key = encode_counts(counts)
+            if key not in self._values:
+                self._values[key] = evaluate_record(self._record_for_key(key, counts))
+        return self.size
+
+    def values_array(self, max_tiles: int = 14) -> bytearray:
+        """合計max_tiles枚以下の全てのキーの向聴数を配列にまとめる
+
+        テーブルファイルの生成に使用します。
+
+        Args:
+            max_tiles: 対象とする最大枚数
+
+        Returns:
+            5進数キーを添字とする通常形の向聴数の配列（符号付き8bit、対象外のキーはUNCOMPUTED）
+        """
+        self.precompute(max_tiles)
+        values = bytearray([UNCOMPUTED]) * KEY_BASE**SUIT_SIZE
+        for counts in _iter_suit_counts(max_tiles):
+            key = encode_counts(counts)
+            values[key] = self._values[key] & 0xFF
+        return values
+
+    def overflow_values_array(self, max_tiles: int = 14) -> bytearray:
+        """5枚以上を含む形も含めた、合計max_tiles枚以下の全ての形の向聴数を配列にまとめる
+
+        テーブルファイルの生成に使用します。4枚以下の形は values_array() と同じ値です。
+
+        Args:
+            max_tiles: 対象とする最大枚数
+
+        Returns:
+            rank_counts() の通し番号を添字とする通常形の向聴数の配列（符号付き8bit）
+        """
+        values = bytearray()
+        for counts in _iter_suit_counts(max_tiles, OVERFLOW_MAX_COUNT):
+            values.append(self.normal_shanten(counts) & 0xFF)
+        return values
+
+    def clear(self) -> None:
+        """計算済みのレコードを全て破棄"""
+        empty_record = self._records[0]
+        self._records = {0: empty_record}
+        self._values.clear()
+        self._overflow_records.clear()
+        self._overflow_values.clear()
+        self._kan_values.clear()
+
+    def _record_for_key(self, key: int, counts: List[int]) -> Record:
+        """5進数キーの分解レコードを取得（未計算なら計算して登録）
+
+        Args:
+            key: 5進数キー
+            counts: キーに対応する枚数ベクトル（作業用に一時的に変更される）
+
+        Returns:
+            分解レコード
+        """
+        record = self._records.get(key)
+        if record is not None:
+            return record
+
+        record = self._build_record(counts, self._record_for_key)
+        self._records[key] = record
+        return record
+
+    def _overflow_record(self, counts: List[int]) -> Record:
+        """5枚以上を含む形の分解レコードを取得
+
+        Args:
+            counts: tile_id順の枚数ベクトル（作業用に一時的に変更される）
+
+        Returns:
+            分解レコード
+        """
+        signature = tuple(counts)
+        record = self._overflow_records.get(signature)
+        if record is not None:
+            return record
+
+        def lookup(sub_key: int, sub_counts: List[int]) -> Record:
+            if max(sub_counts) < KEY_BASE:
+                return self._record_for_key(sub_key, sub_counts)
+            return self._overflow_record(sub_counts)
+
+        record = self._build_record(counts, lookup)
+        self._overflow_records[signature] = record
+        return record
+
+    def _build_record(self, counts: List[int], lookup: RecordLookup) -> Record:
+        """最小の牌を起点とする遷移から分解レコードを組み立て
+
+        ShantenCalculator._find_best_shanten と同じく、最小の牌について
+        刻子・雀頭・順子・両面/辺張搭子・嵌張搭子・孤立牌の6通りを試します。
+
+        Args:
+            counts: tile_id順の枚数ベクトル（空でないこと）
+            lookup: 部分形の分解レコードを取得する関数
+
+        Returns:
+            分解レコード
+        """
+        first = 0
+        while counts[first] == 0:
+            first += 1
+
+        best: List[int] = [UNREACHABLE] * RECORD_SIZE
+
+        def merge(removed: Tuple[int, ...], add_meld: int, add_pair: bool, add_tatsu: int) -> None:
+            for tile_id in removed:
+                counts[tile_id] -= 1
+            sub_key = 0
+            for count, power in zip(counts, KEY_POWERS):
+                sub_key += count * power
+            sub_record = lookup(sub_key, counts)
+            for tile_id in removed:
+                counts[tile_id] += 1
+
+            # 孤立牌で残り0枚になった場合のみ、再帰の末端は「残り1枚」になる
+            is_isolated = len(removed) == 1
+            for melds, tatsu, has_pair, closed in iter_record(sub_record):
+                if add_pair and has_pair:
+                    continue
+                total_melds = melds + add_meld
+                if total_melds > MAX_MELDS:
+                    continue
+                closed = closed and not (is_isolated and sub_key == 0)
+                index = record_index(total_melds, has_pair or add_pair, closed)
+                if tatsu + add_tatsu > best[index]:
+                    best[index] = tatsu + add_tatsu
+
+        count = counts[first]
+        has_next = first + 1 < SUIT_SIZE and counts[first + 1] > 0
+        has_next_next = first + 2 < SUIT_SIZE and counts[first + 2] > 0
+
+        # 刻子
+        if count >= 3:
+            merge((first, first, first), 1, False, 0)
+        # 雀頭
+        if count >= 2:
+            merge((first, first), 0, True, 0)
+        # 順子
+        if has_next and has_next_next:
+            merge((first, first + 1, first + 2), 1, False, 0)
+        # 搭子（隣り合う2枚）
+        if has_next:
+            merge((first, first + 1), 0, False, 1)
+        # 搭子（1つ空きの2枚）
+        if has_next_next:
+            merge((first, first + 2), 0, False, 1)
+        # 孤立牌として扱う
+        merge((first,), 0, False, 0)
+
+        return tuple(best)
+
+
+def _iter_suit_counts(max_tiles: int, max_count: int = KEY_BASE - 1) -> Iterator[List[int]]:
+    """各種類0-max_count枚、合計max_tiles枚以下の枚数ベクトルを辞書順に列挙
+
+    Args:
+        max_tiles: 最大枚数
+        max_count: 1種類あたりの最大枚数
+
+    Yields:
+        tile_id順の枚数ベクトル
+    """
+    counts = [0] * SUIT_SIZE
+
+    def walk(position: int, remaining: int) -> Iterator[List[int]]:
+        if position == SUIT_SIZE:
+            yield list(counts)
+            return
+        for count in range(min(max_count, remaining) + 1):
+            counts[position] = count
+            yield from walk(position + 1, remaining - count)
+        counts[position] = 0
+
+    yield from walk(0, max_tiles)
+
+
+# 全ての計算器で共有するデフォルトテーブル
+_default_table: Optional[ShantenTable] = None
+
+
+def get_shanten_table() -> ShantenTable:
+    """共有の向聴数テーブルを取得
+
+    初回の呼び出しで、既定のテーブルファイル（default_table_path()）があれば
+    読み込んで登録します。ファイルの生成は行いません。
+
+    Returns:
+        プロセス内で共有されるShantenTableインスタンス
+    """
+    global _default_table
+    if _default_table is None:
+        # table_file が shanten_table を参照するため関数内でimportする
+        from mahjong_ai.logic.table_file import attach_default_table_file
+
+        _default_table = ShantenTable()
+        attach_default_table_file(_default_table)
+    return _default_table
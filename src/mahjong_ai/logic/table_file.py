@@ -0,0 +1,273 @@
+"""事前計算したスート分解テーブルのファイル
+
+ShantenTable の通常形の向聴数（5進数キーごと、および5枚以上を含む形も含めた通し番号ごと）と
+WinningChecker の完全形集合を1つのバイナリファイルに書き出し、実行時は mmap で読み込みます。
+読み取り専用でマップするため、同じファイルを読み込んだ複数のワーカープロセスは
+物理メモリ上の1つのコピーを共有します。
+
+ファイル形式（リトルエンディアン）:
+    ヘッダー: 識別子 "MJST", 形式バージョン, スートの種類数, キーの基数, 最大枚数,
+              向聴数の配列の長さ, 通し番号の向聴数の配列の長さ,
+              面子のみの完全形の数, 雀頭付きの完全形の数, 本体のCRC32
+    本体: 向聴数の配列（符号付き8bit）, 通し番号の向聴数の配列（符号付き8bit）,
+          面子のみの完全形（各9バイト）, 雀頭付きの完全形（各9バイト）
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import FrozenSet, Optional, Tuple, Union
+
+from mahjong_ai.logic.shanten_table import (
+    KEY_BASE,
+    SUIT_SIZE,
+    ShantenTable,
+    get_shanten_table,
+    overflow_array_length,
+)
+from mahjong_ai.logic.winning_checker import get_complete_suits, set_complete_suits
+
+# ファイルの識別子と形式バージョン（テーブルの生成規則を変えたら上げる）
+TABLE_FILE_MAGIC = b"MJST"
+TABLE_FILE_VERSION = 2
+
+# ヘッダー（識別子, バージョン, 種類数, 基数, 最大枚数, 配列長×2, 完全形の数×2, CRC32）
+_HEADER = struct.Struct("<4sBBBBIIIII")
+
+# テーブルファイルの場所を指定する環境変数
+TABLE_FILE_ENV = "MAHJONG_AI_TABLE_FILE"
+
+# 既定のテーブルファイル
+DEFAULT_TABLE_FILE = Path.home() / ".cache" / "mahjong_ai" / f"suit_tables-v{TABLE_FILE_VERSION}.bin"
+
+# 事前計算する最大枚数（14枚 = ツモ後の手牌）
+DEFAULT_MAX_TILES = 14
+
+
+def default_table_path() -> Path:
+    """既定のテーブルファイルのパスを取得
+
+    Returns:
+        環境変数 MAHJONG_AI_TABLE_FILE が設定されていればそのパス、なければ DEFAULT_TABLE_FILE
+    """
+    path = os.environ.get(TABLE_FILE_ENV)
+    return Path(path) if path else DEFAULT_TABLE_FILE
+
+
+def build_table_file(path: Union[str, Path], max_tiles: int = DEFAULT_MAX_TILES) -> Path:
+    """テーブルを生成してファイルに書き出す
+
+    一時ファイルに書き出してから置き換えるため、他のプロセスが書き出し途中の
+    ファイルを読み込むことはありません。
+
+    Args:
+        path: 書き出すファイル
+        max_tiles: 向聴数を事前計算する最大枚数
+
+    Returns:
+        書き出したファイルのパス
+    """
+    path = Path(path)
+    table = ShantenTable()
+    values = table.values_array(max_tiles)
+    overflow_values = table.overflow_values_array(max_tiles)
+    melds_only, with_pair = get_complete_suits()
+    body = b"".join((values, overflow_values, b"".join(sorted(melds_only)), b"".join(sorted(with_pair))))
+    header = _HEADER.pack(
+        TABLE_FILE_MAGIC,
+        TABLE_FILE_VERSION,
+        SUIT_SIZE,
+        KEY_BASE,
+        max_tiles,
+        len(values),
+        len(overflow_values),
+        len(melds_only),
+        len(with_pair),
+        zlib.crc32(body),
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "wb") as file:
+        file.write(header)
+        file.write(body)
+    os.replace(temp_path, path)
+    return path
+
+
+class SuitTableFile:
+    """mmapで読み込んだスート分解テーブルのファイル
+
+    Attributes:
+        path: 読み込んだファイル
+        max_tiles: 向聴数を事前計算した最大枚数
+        shanten_values: 5進数キーを添字とする通常形の向聴数（ShantenTable.attach_values() 形式）
+        overflow_values: 5枚以上を含む形も含めた、通し番号を添字とする通常形の向聴数
+            （ShantenTable.attach_values() の overflow_values 形式）
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """ファイルを読み込み専用でマップして検証
+
+        Args:
+            path: 読み込むファイル
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+            ValueError: テーブルファイルでない場合、形式が合わない場合、またはチェックサムが一致しない場合
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"テーブルファイルではありません: {self.path}")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._validate()
+        except ValueError:
+            self._mmap.close()
+            raise
+
+    def _validate(self) -> None:
+        """ヘッダーとチェックサムを検証して各領域を取り出す"""
+        header = _HEADER.unpack_from(self._mmap)
+        magic, version, suit_size, key_base, max_tiles = header[:5]
+        length, overflow_length, melds_count, pair_count, checksum = header[5:]
+        if magic != TABLE_FILE_MAGIC:
+            raise ValueError(f"テーブルファイルではありません: {self.path}")
+        if (version, suit_size, key_base, length) != (TABLE_FILE_VERSION, SUIT_SIZE, KEY_BASE, KEY_BASE**SUIT_SIZE):
+            raise ValueError(f"非対応のテーブルファイルの形式です: バージョン{version}")
+        if overflow_length != overflow_array_length(max_tiles):
+            raise ValueError(f"非対応のテーブルファイルの形式です: バージョン{version}")
+
+        body = memoryview(self._mmap)[_HEADER.size :]
+        try:
+            expected = length + overflow_length + (melds_count + pair_count) * SUIT_SIZE
+            if len(body) != expected or zlib.crc32(body) != checksum:
+                raise ValueError(f"テーブルファイルのチェックサムが一致しません: {self.path}")
+        finally:
+            body.release()
+
+        self.max_tiles = max_tiles
+        self._suits_offset = _HEADER.size + length + overflow_length
+        self._melds_count = melds_count
+        self._pair_count = pair_count
+        values = memoryview(self._mmap)[_HEADER.size : _HEADER.size + length]
+        self.shanten_values: Optional[memoryview] = values.cast("b")
+        overflow_values = memoryview(self._mmap)[_HEADER.size + length : self._suits_offset]
+        self.overflow_values: Optional[memoryview] = overflow_values.cast("b")
+
+    def complete_suits(self) -> Tuple[FrozenSet[bytes], FrozenSet[bytes]]:
+        """完全形集合を取得
+
+        Returns:
+            (面子のみの完全形集合, 雀頭付きの完全形集合) のタプル（get_complete_suits() 形式）
+        """
+        start = self._suits_offset
+        middle = start + self._melds_count * SUIT_SIZE
+        end = middle + self._pair_count * SUIT_SIZE
+        data = self._mmap
+        melds_only = frozenset(data[offset : offset + SUIT_SIZE] for offset in range(start, middle, SUIT_SIZE))
+        with_pair = frozenset(data[offset : offset + SUIT_SIZE] for offset in range(middle, end, SUIT_SIZE))
+        return melds_only, with_pair
+
+    def close(self) -> None:
+        """マップを解除
+
+        ShantenTable に登録している場合は、先に attach_values(None) で登録を解除してください。
+        """
+        for values in (self.shanten_values, self.overflow_values):
+            if values is not None:
+                values.release()
+        self.shanten_values = None
+        self.overflow_values = None
+        self._mmap.close()
+
+
+def open_table_file(
+    path: Optional[Union[str, Path]] = None,
+    regenerate: bool = False,
+    max_tiles: int = DEFAULT_MAX_TILES,
+) -> SuitTableFile:
+    """テーブルファイルを読み込む
+
+    Args:
+        path: 読み込むファイル（Noneの場合は default_table_path()）
+        regenerate: ファイルがない・壊れている・形式が古い場合に生成し直すかどうか
+            （生成には数十秒かかり、ファイルを書き出すため明示的に指定した場合のみ）
+        max_tiles: 生成し直す場合に向聴数を事前計算する最大枚数
+
+    Returns:
+        読み込んだテーブルファイル
+
+    Raises:
+        FileNotFoundError: ファイルがなく、regenerateがFalseの場合
+        ValueError: ファイルが不正で、regenerateがFalseの場合
+    """
+    path = Path(path) if path is not None else default_table_path()
+    try:
+        return SuitTableFile(path)
+    except (FileNotFoundError, ValueError):
+        if not regenerate:
+            raise
+    build_table_file(path, max_tiles)
+    return SuitTableFile(path)
+
+
+def load_table_file(
+    path: Optional[Union[str, Path]] = None,
+    regenerate: bool = False,
+    max_tiles: int = DEFAULT_MAX_TILES,
+) -> SuitTableFile:
+    """テーブルファイルを読み込み、プロセス共有のテーブルに登録
+
+    以降、get_shanten_table() を使う ShantenCalculator と WinningChecker は
+    ファイルのテーブルを参照します。プロセスプールを作成する前に呼び出すと、
+    fork したワーカープロセスもマップを共有します。
+
+    Args:
+        path: 読み込むファイル（Noneの場合は default_table_path()）
+        regenerate: ファイルがない・壊れている・形式が古い場合に生成し直すかどうか
+        max_tiles: 生成し直す場合に向聴数を事前計算する最大枚数
+
+    Returns:
+        読み込んだテーブルファイル
+
+    Raises:
+        FileNotFoundError: ファイルがなく、regenerateがFalseの場合
+        ValueError: ファイルが不正で、regenerateがFalseの場合
+    """
+    table_file = open_table_file(path, regenerate, max_tiles)
+    get_shanten_table().attach_values(table_file.shanten_values, table_file.overflow_values)
+    set_complete_suits(table_file.complete_suits())
+    return table_file
+
+
+# get_shanten_table() が読み込んだ既定のテーブルファイル（登録中はマップを保持する）
+_default_table_file: Optional[SuitTableFile] = None
+
+
+def attach_default_table_file(table: ShantenTable) -> Optional[SuitTableFile]:
+    """既定のテーブルファイルがあれば読み込み、テーブルと完全形集合に登録
+
+    get_shanten_table() が共有のテーブルを作成するときに呼び出します。
+    ファイルの生成は行わず、ファイルがない・読み込めない場合は何もしません
+    （テーブルは従来どおり必要になった形から計算します）。
+
+    Args:
+        table: 向聴数の配列を登録するテーブル
+
+    Returns:
+        読み込んだテーブルファイル（読み込まなかった場合はNone）
+    """
+    global _default_table_file
+    try:
+        table_file = SuitTableFile(default_table_path())
+    except (OSError, ValueError):
+        return None
+    table.attach_values(table_file.shanten_values, table_file.overflow_values)
+    set_complete_suits(table_file.complete_suits())
+    _default_table_file = table_file
+    return table_file
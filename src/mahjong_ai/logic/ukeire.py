@@ -0,0 +1,183 @@
+"""受け入れ（有効牌）計算ロジック"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.logic.shanten_table import SUIT_SIZE
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import TILES_PER_KIND, Tile
+
+
+@dataclass(frozen=True)
+class UkeireResult:
+    """受け入れの計算結果
+
+    Attributes:
+        shanten: ツモ前の向聴数
+        tiles: 向聴数を下げる牌をキー、残り枚数を値とする辞書（牌順）
+    """
+
+    shanten: int
+    tiles: Dict[Tile, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """有効牌の残り枚数の合計
+
+        Returns:
+            受け入れ枚数
+        """
+        return sum(self.tiles.values())
+
+
+class UkeireCalculator:
+    """受け入れ（有効牌）を計算するクラス
+
+    13枚（3n+1枚）の手牌に対して向聴数を下げる牌と残り枚数を求め、
+    14枚（3n+2枚）の手牌に対しては打牌ごとの受け入れ表を求めます。
+    向聴数はShantenCalculatorの差分計算（ツモ・打牌ごとの一括計算）で求め、
+    手牌のコピーや牌ごとの再計算は行いません。
+
+    残り枚数は WallTiles.get_tile_distribution() の結果を渡すと山牌の枚数を、
+    省略した場合は各種類6枚から手牌の枚数を引いた見えていない枚数を使います。
+    """
+
+    def __init__(self, shanten_calculator: Optional[ShantenCalculator] = None) -> None:
+        """受け入れ計算器を初期化
+
+        Args:
+            shanten_calculator: 使用する向聴数計算器（Noneの場合は新規作成）
+        """
+        self.shanten_calculator = shanten_calculator if shanten_calculator is not None else ShantenCalculator()
+
+    def calculate(self, hand: Hand, remaining: Optional[Mapping[Tile, int]] = None) -> UkeireResult:
+        """ツモ前の手牌の受け入れを計算
+
+        Args:
+            hand: 受け入れを計算する手牌（3n+1枚）
+            remaining: 牌ごとの残り枚数（WallTiles.get_tile_distribution()の結果など）
+
+        Returns:
+            受け入れの計算結果
+
+        Raises:
+            ValueError: 手牌の枚数が3n+1枚でない場合
+        """
+        if hand.size % 3 != 1:
+            raise ValueError("受け入れは3n+1枚の手牌に対して計算します")
+
+        counts = hand.counts_view()
+        live = self._live_counts(counts, remaining)
+        shanten = self.shanten_calculator.calculate_shanten(hand)
+        return self._collect(counts, hand.size, shanten, live)
+
+    def calculate_discards(
+        self, hand: Hand, remaining: Optional[Mapping[Tile, int]] = None
+    ) -> Dict[Tile, UkeireResult]:
+        """打牌ごとの受け入れ表を計算
+
+        Args:
+            hand: 打牌前の手牌（3n+2枚）
+            remaining: 牌ごとの残り枚数（WallTiles.get_tile_distribution()の結果など）
+
+        Returns:
+            打牌する牌をキー、打牌後の受け入れを値とする辞書（牌順）
+
+        Raises:
+            ValueError: 手牌の枚数が3n+2枚でない場合
+        """
+        if hand.size % 3 != 2:
+            raise ValueError("打牌ごとの受け入れは3n+2枚の手牌に対して計算します")
+
+        counts = hand.counts_view()
+        live = self._live_counts(counts, remaining)
+
+        # 打牌した牌は河に見えているため、残り枚数は打牌前の手牌基準のまま
+        tables: Dict[Tile, UkeireResult] = {}
+        for tile_id, (shanten, effective_ids) in self.effective_ids_after_discards(counts, hand.size).items():
+            tiles = {Tile.from_id(effective_id): live[effective_id] for effective_id in effective_ids}
+            tables[Tile.from_id(tile_id)] = UkeireResult(shanten=shanten, tiles=tiles)
+        return tables
+
+    def effective_ids_after_discards(
+        self, counts: Sequence[int], size: int
+    ) -> Dict[int, Tuple[int, Tuple[int, ...]]]:
+        """枚数ベクトルから打牌ごとの向聴数と有効牌の種類を計算
+
+        結果は残り枚数に依存しないため、枚数ベクトルごとに保存しておき、
+        残り枚数は呼び出し側で後から付け加えられます（UkeirePolicy など）。
+
+        Args:
+            counts: 打牌前の枚数ベクトル（3n+2枚）
+            size: 枚数ベクトルの合計枚数
+
+        Returns:
+            打牌するtile_idをキー、(打牌後の向聴数, 打牌後に向聴数を下げるtile_idのタプル) を値とする辞書（牌順）
+        """
+        calculator = self.shanten_calculator
+        after = list(counts[:SUIT_SIZE])
+        effective: Dict[int, Tuple[int, Tuple[int, ...]]] = {}
+        for tile_id, shanten in calculator.discard_shanten_from_counts(after, size).items():
+            after[tile_id] -= 1
+            draw_table = calculator.draw_shanten_from_counts(after, size - 1)
+            after[tile_id] += 1
+            effective[tile_id] = (shanten, tuple(draw_id for draw_id, value in draw_table.items() if value < shanten))
+        return effective
+
+    def best_discards(self, hand: Hand, remaining: Optional[Mapping[Tile, int]] = None) -> List[Tile]:
+        """向聴数が最小で受け入れ枚数が最大になる打牌を取得
+
+        Args:
+            hand: 打牌前の手牌（3n+2枚）
+            remaining: 牌ごとの残り枚数
+
+        Returns:
+            最善の打牌候補のリスト（牌順）
+        """
+        tables = self.calculate_discards(hand, remaining)
+        if not tables:
+            return []
+
+        best = min((result.shanten, -result.total) for result in tables.values())
+        return [tile for tile, result in tables.items() if (result.shanten, -result.total) == best]
+
+    def _collect(self, counts: Sequence[int], size: int, shanten: int, live: Sequence[int]) -> UkeireResult:
+        """ツモ後の向聴数表から有効牌を集計
+
+        Args:
+            counts: ツモ前の枚数ベクトル
+            size: ツモ前の枚数
+            shanten: ツモ前の向聴数
+            live: tile_idごとの残り枚数
+
+        Returns:
+            受け入れの計算結果
+        """
+        draw_table = self.shanten_calculator.draw_shanten_from_counts(counts, size)
+        tiles = {
+            Tile.from_id(tile_id): live[tile_id]
+            for tile_id, draw_shanten in draw_table.items()
+            if draw_shanten < shanten
+        }
+        return UkeireResult(shanten=shanten, tiles=tiles)
+
+    @staticmethod
+    def _live_counts(counts: Sequence[int], remaining: Optional[Mapping[Tile, int]]) -> List[int]:
+        """tile_idごとの残り枚数を取得
+
+        Args:
+            counts: 手牌の枚数ベクトル
+            remaining: 牌ごとの残り枚数（Noneの場合は見えていない枚数）
+
+        Returns:
+            tile_idを添字とする残り枚数のリスト
+        """
+        if remaining is None:
+            return [max(0, TILES_PER_KIND - counts[tile_id]) for tile_id in range(SUIT_SIZE)]
+
+        live = [0] * SUIT_SIZE
+        for tile, count in remaining.items():
+            if tile.tile_id < SUIT_SIZE:
+                live[tile.tile_id] = count
+        return live
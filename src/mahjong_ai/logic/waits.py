@@ -0,0 +1,153 @@
+"""待ち牌計算ロジック"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from mahjong_ai.logic.lru_cache import LRUCache
+from mahjong_ai.logic.shanten_table import SUIT_SIZE
+from mahjong_ai.logic.winning_checker import get_complete_suits
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import TILES_PER_KIND, Tile
+
+# 七対子の対子数
+SEVEN_PAIRS = 7
+
+
+@dataclass(frozen=True)
+class WaitResult:
+    """待ち牌の計算結果
+
+    Attributes:
+        tiles: 待ち牌をキー、残り枚数を値とする辞書（牌順、残り0枚の待ちも含む）
+    """
+
+    tiles: Dict[Tile, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """待ち牌の残り枚数の合計
+
+        Returns:
+            和了牌の残り枚数
+        """
+        return sum(self.tiles.values())
+
+    @property
+    def live_tiles(self) -> List[Tile]:
+        """残り1枚以上の待ち牌
+
+        Returns:
+            ツモで和了できる牌のリスト（牌順）
+        """
+        return [tile for tile, count in self.tiles.items() if count > 0]
+
+
+class WaitCalculator:
+    """3n+1枚の手牌の待ち牌を求めるクラス
+
+    各種類を1枚加えた枚数ベクトルがスートの完全形集合（雀頭付き）に含まれるか、
+    13枚の場合は七対子の単騎待ちかを1回の走査で判定します。
+    手牌のコピーや和了判定の呼び出しは行いません。
+
+    待ち牌の種類は枚数ベクトルをキーとするLRUキャッシュに保存されます。
+    残り枚数は呼び出しごとに渡された分布から付け加えるため、
+    山牌が変わってもキャッシュは有効です。
+    """
+
+    DEFAULT_CACHE_SIZE = 4096
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """待ち牌計算器を初期化
+
+        Args:
+            cache_size: キャッシュの最大エントリ数（0以下でキャッシュ無効）
+        """
+        self._cache: LRUCache[Tuple[int, ...]] = LRUCache(cache_size)
+
+    def calculate(self, hand: Hand, remaining: Optional[Mapping[Tile, int]] = None) -> WaitResult:
+        """手牌の待ち牌と残り枚数を求める
+
+        Args:
+            hand: 待ち牌を求める手牌（3n+1枚）
+            remaining: 牌ごとの残り枚数（WallTiles.get_tile_distribution()の結果など、
+                Noneの場合は各種類6枚から手牌の枚数を引いた見えていない枚数）
+
+        Returns:
+            待ち牌の計算結果（3n+1枚でない場合は空）
+        """
+        wait_tiles = [Tile.from_id(tile_id) for tile_id in self.wait_ids(hand)]
+        if remaining is None:
+            counts = hand.counts_view()
+            return WaitResult(tiles={tile: max(0, TILES_PER_KIND - counts[tile.tile_id]) for tile in wait_tiles})
+        return WaitResult(tiles={tile: remaining.get(tile, 0) for tile in wait_tiles})
+
+    def wait_ids(self, hand: Hand) -> Tuple[int, ...]:
+        """手牌の待ち牌の種類を求める
+
+        Args:
+            hand: 待ち牌を求める手牌
+
+        Returns:
+            ツモで和了形になる種類のtile_id（昇順、3n+1枚でない場合は空）
+        """
+        if hand.size % 3 != 1:
+            return ()
+
+        counts = hand.counts_view()
+        return self._cache.get_or_compute(
+            counts.tobytes(), lambda: self.wait_ids_from_counts(counts[:SUIT_SIZE], hand.size)
+        )
+
+    @staticmethod
+    def wait_ids_from_counts(counts: Sequence[int], size: int) -> Tuple[int, ...]:
+        """枚数ベクトルから待ち牌の種類を求める（キャッシュなし）
+
+        Args:
+            counts: tile_id順の枚数ベクトル（先頭9種類を使用）
+            size: 手牌の枚数（3n+1枚）
+
+        Returns:
+            ツモで和了形になる種類のtile_id（昇順）
+        """
+        _, with_pair = get_complete_suits()
+        after = bytearray(counts[:SUIT_SIZE])
+
+        pairs = 0
+        single = None
+        for tile_id in range(SUIT_SIZE):
+            count = after[tile_id]
+            if count == 2:
+                pairs += 1
+            elif count == 1 and single is None:
+                single = tile_id
+            elif count:
+                # 1枚の種類が2つ以上、または3枚以上の種類があれば七対子にならない
+                pairs = -SUIT_SIZE
+        seven_pairs_wait = single if size == 2 * SEVEN_PAIRS - 1 and pairs == SEVEN_PAIRS - 1 else None
+
+        waits = []
+        for tile_id in range(SUIT_SIZE):
+            after[tile_id] += 1
+            if tile_id == seven_pairs_wait or bytes(after) in with_pair:
+                waits.append(tile_id)
+            after[tile_id] -= 1
+        return tuple(waits)
+
+    def cache_info(self) -> Dict[str, int]:
+        """キャッシュの統計情報を取得
+
+        Returns:
+            ヒット数・ミス数・現在のエントリ数・最大エントリ数の辞書
+        """
+        return self._cache.info()
+
+    def invalidate_cache(self, hand: Optional[Hand] = None) -> None:
+        """キャッシュを無効化
+
+        Args:
+            hand: 無効化する手牌（Noneの場合は全エントリと統計情報を破棄）
+        """
+        if hand is not None:
+            self._cache.discard(hand.counts_view().tobytes())
+        else:
+            self._cache.clear()
@@ -1,19 +1,109 @@
 """和了判定ロジック"""
 
 from collections import Counter
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
+from mahjong_ai.logic.lru_cache import LRUCache
+from mahjong_ai.logic.shanten_table import SUIT_SIZE
 from mahjong_ai.models.hand import Hand
 from mahjong_ai.models.tile import Tile
 
+# 完全形集合で扱う最大面子数（14枚 = 4面子1雀頭）
+MAX_COMPLETE_MELDS = 4
+
+# 面子の形（tile_idの組）: 刻子9種 + 順子7種
+MELD_SHAPES: Tuple[Tuple[int, ...], ...] = tuple((i, i, i) for i in range(SUIT_SIZE)) + tuple(
+    (i, i + 1, i + 2) for i in range(SUIT_SIZE - 2)
+)
+
+# 完全形集合（面子のみ, 面子+雀頭）。初回使用時に生成
+_complete_suits: Optional[Tuple[FrozenSet[bytes], FrozenSet[bytes]]] = None
+
+
+def get_complete_suits() -> Tuple[FrozenSet[bytes], FrozenSet[bytes]]:
+    """スートの完全形集合を取得
+
+    面子のみ（0-4面子）で構成できる枚数ベクトルの集合と、
+    それに雀頭1つを加えた枚数ベクトル（空を含む）の集合を返します。
+    枚数ベクトルは tile_id順の9バイトで表します。
+
+    Returns:
+        (面子のみの完全形集合, 雀頭付きの完全形集合) のタプル
+    """
+    global _complete_suits
+    if _complete_suits is None:
+        melds_only: Set[bytes] = set()
+        level = {bytes(SUIT_SIZE)}
+        melds_only |= level
+        for _ in range(MAX_COMPLETE_MELDS):
+            next_level: Set[bytes] = set()
+            for signature in level:
+                for shape in MELD_SHAPES:
+                    counts = bytearray(signature)
+                    for tile_id in shape:
+                        counts[tile_id] += 1
+                    next_level.add(bytes(counts))
+            melds_only |= next_level
+            level = next_level
+
+        with_pair: Set[bytes] = {bytes(SUIT_SIZE)}
+        for signature in melds_only:
+            for tile_id in range(SUIT_SIZE):
+                counts = bytearray(signature)
+                counts[tile_id] += 2
+                with_pair.add(bytes(counts))
+
+        _complete_suits = (frozenset(melds_only), frozenset(with_pair))
+    return _complete_suits
+
+
+def set_complete_suits(suits: Optional[Tuple[FrozenSet[bytes], FrozenSet[bytes]]]) -> None:
+    """スートの完全形集合を差し替え
+
+    テーブルファイルから読み込んだ集合を登録する場合に使用します。
+
+    Args:
+        suits: (面子のみの完全形集合, 雀頭付きの完全形集合)（Noneの場合は次回使用時に再生成）
+    """
+    global _complete_suits
+    _complete_suits = suits
+
+
+def suit_signature(tile_counts: Dict[Tile, int]) -> bytes:
+    """牌の種類別枚数辞書を完全形集合のキーに変換
+
+    Args:
+        tile_counts: 牌の種類別枚数辞書
+
+    Returns:
+        tile_id順の9バイトの枚数ベクトル
+    """
+    counts = bytearray(SUIT_SIZE)
+    for tile, count in tile_counts.items():
+        counts[tile.tile_id] = count
+    return bytes(counts)
+
 
 class WinningChecker:
     """和了判定を行うクラス
 
     麻雀の手牌が和了形（あがり形）かどうかを判定します。
     Phase 1では索子のみを対象とし、通常の和了形と七対子を判定します。
+
+    is_winning_hand の結果は枚数ベクトルをキーとするLRUキャッシュに保存され、
+    同じ手牌に対する2回目以降の判定は辞書の参照だけで済みます。
     """
 
+    DEFAULT_CACHE_SIZE = 4096
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """和了判定器を初期化
+
+        Args:
+            cache_size: キャッシュの最大エントリ数（0以下でキャッシュ無効）
+        """
+        self._cache: LRUCache[bool] = LRUCache(cache_size)
+
     def is_winning_hand(self, hand: Hand) -> bool:
         """手牌が和了形かどうかを判定
 
@@ -27,6 +117,36 @@ class WinningChecker:
         if hand.size != 14:
             return False
 
+        return self._cache.get_or_compute(hand.counts_view().tobytes(), lambda: self._evaluate_winning_hand(hand))
+
+    def cache_info(self) -> Dict[str, int]:
+        """キャッシュの統計情報を取得
+
+        Returns:
+            ヒット数・ミス数・現在のエントリ数・最大エントリ数の辞書
+        """
+        return self._cache.info()
+
+    def invalidate_cache(self, hand: Optional[Hand] = None) -> None:
+        """キャッシュを無効化
+
+        Args:
+            hand: 無効化する手牌（Noneの場合は全エントリと統計情報を破棄）
+        """
+        if hand is not None:
+            self._cache.discard(hand.counts_view().tobytes())
+        else:
+            self._cache.clear()
+
+    def _evaluate_winning_hand(self, hand: Hand) -> bool:
+        """キャッシュを介さずに和了形かどうかを判定
+
+        Args:
+            hand: 判定対象の手牌（14枚）
+
+        Returns:
+            和了形の場合True、そうでなければFalse
+        """
         # 七対子の判定
         if self.check_seven_pairs(hand):
             return True
@@ -47,14 +167,17 @@ class WinningChecker:
         if hand.size != 14:
             return False
 
-        # 各牌の枚数を取得
-        tile_counts = hand.get_tile_counts()
-
         # 7種類の牌があり、すべて2枚ずつであることを確認
-        if len(tile_counts) != 7:
-            return False
+        counts = hand.counts_view()
+        kinds = 0
+        for count in counts:
+            if count == 0:
+                continue
+            if count != 2:
+                return False
+            kinds += 1
 
-        return all(count == 2 for count in tile_counts.values())
+        return kinds == 7
 
     def check_normal_winning_form(self, hand: Hand) -> bool:
         """通常の和了形（4面子1雀頭）かどうかを判定
@@ -69,29 +192,39 @@ class WinningChecker:
         if hand.size != 14:
             return False
 
-        # 各牌の枚数を取得
-        tile_counts = hand.get_tile_counts()
+        # 索子の枚数ベクトルを完全形集合で判定
+        return hand.counts_view()[:SUIT_SIZE].tobytes() in get_complete_suits()[1]
+
+    def is_complete_hand(self, hand: Hand) -> bool:
+        """手牌がn面子1雀頭の形かどうかを枚数に関わらず判定
+
+        暗槓を除いた手牌（11枚・8枚など）の和了判定に使用します。
+        WaitCalculator の待ち牌判定と同じ完全形集合を参照します。
 
-        # 再帰的に面子を除去して判定
-        return self._check_winning_form_recursive(tile_counts)
+        Args:
+            hand: 判定対象の手牌（3n+2枚、14枚以下）
+
+        Returns:
+            n面子1雀頭で構成できる場合True、そうでなければFalse
+        """
+        if hand.size % 3 != 2:
+            return False
+        return hand.counts_view()[:SUIT_SIZE].tobytes() in get_complete_suits()[1]
 
     def _check_winning_form_recursive(self, tile_counts: Dict[Tile, int]) -> bool:
         """再帰的に面子を除去して和了形を判定
 
+        14枚以下の場合は雀頭付きの完全形集合への所属判定だけで決まります。
+
         Args:
             tile_counts: 牌の種類別枚数辞書
 
         Returns:
             和了形の場合True、そうでなければFalse
         """
-        # 牌がなくなったら成功
         total_tiles = sum(tile_counts.values())
-        if total_tiles == 0:
-            return True
-
-        # 雀頭（対子）が残っている場合
-        if total_tiles == 2:
-            return any(count == 2 for count in tile_counts.values())
+        if total_tiles <= MAX_COMPLETE_MELDS * 3 + 2:
+            return suit_signature(tile_counts) in get_complete_suits()[1]
 
         # 雀頭を選んでから面子を除去
         for tile, count in tile_counts.items():
@@ -117,9 +250,9 @@ class WinningChecker:
         Returns:
             面子のみで構成できる場合True、そうでなければFalse
         """
-        # 牌がなくなったら成功
-        if not tile_counts or sum(tile_counts.values()) == 0:
-            return True
+        # 12枚以下の場合は面子のみの完全形集合への所属判定だけで決まる
+        if sum(tile_counts.values()) <= MAX_COMPLETE_MELDS * 3:
+            return suit_signature(tile_counts) in get_complete_suits()[0]
 
         # 残り牌数が3の倍数でなければ失敗
         if sum(tile_counts.values()) % 3 != 0:
@@ -142,8 +275,8 @@ class WinningChecker:
 
         # 順子を作る場合（value+1, value+2の牌が必要）
         if first_tile.value <= 7:  # 1-7索のみ順子の先頭になれる
-            next_tile = Tile(suit="sou", value=first_tile.value + 1)
-            next_next_tile = Tile(suit="sou", value=first_tile.value + 2)
+            next_tile = Tile.of("sou", first_tile.value + 1)
+            next_next_tile = Tile.of("sou", first_tile.value + 2)
 
             if (
                 next_tile in tile_counts
@@ -1,19 +1,23 @@
 """手牌を管理するクラス"""
 
-from collections import Counter
-from typing import Dict, List, Optional
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from mahjong_ai.models.tile import Tile
+from mahjong_ai.models.tile import TILE_KIND_COUNT, Tile
 
 
 class Hand:
     """手牌を管理するクラス
 
     麻雀の手牌を表現し、牌の追加・削除・検索機能を提供します。
-    常にソート状態を維持し、最大14枚まで保持できます。
+    内部ではtile_idを添字とする枚数ベクトルを正規の状態として保持し、
+    牌の追加・除去・枚数取得はO(1)で行えます。最大14枚まで保持できます。
+    枚数ベクトルやソート済みの牌列からは from_counts / from_sorted で一括作成できます。
 
     Attributes:
-        _tiles: 手牌の牌リスト（内部管理用、常にソート済み）
+        _counts: tile_idごとの枚数（長さTILE_KIND_COUNTの符号付きバイト配列）
+        _size: 現在の手牌の牌数
+        _sorted_tiles: ソート済み牌列のキャッシュ（変更時に破棄）
     """
 
     MAX_SIZE = 14
@@ -24,10 +28,83 @@ class Hand:
         Args:
             tiles: 初期牌のリスト（Noneの場合は空で初期化）
         """
-        self._tiles: List[Tile] = []
+        self._counts = array("b", bytes(TILE_KIND_COUNT))
+        self._size = 0
+        self._sorted_tiles: Optional[Tuple[Tile, ...]] = None
         if tiles:
+            if len(tiles) > self.MAX_SIZE:
+                raise ValueError("手牌は最大14枚までです")
+            counts = self._counts
             for tile in tiles:
-                self.add_tile(tile)
+                counts[tile.tile_id] += 1
+            self._size = len(tiles)
+
+    @classmethod
+    def from_counts(cls, counts: Sequence[int]) -> "Hand":
+        """枚数ベクトルから手牌を作成
+
+        Args:
+            counts: tile_idを添字とする枚数（長さTILE_KIND_COUNT以下、
+                counts_view() やその先頭の索子9種類分など）
+
+        Returns:
+            枚数ベクトルどおりの手牌
+
+        Raises:
+            ValueError: 枚数ベクトルが長すぎる場合、負の枚数を含む場合、または合計が14枚を超える場合
+        """
+        if len(counts) > TILE_KIND_COUNT:
+            raise ValueError(f"枚数ベクトルは{TILE_KIND_COUNT}種類以下である必要があります")
+        # 符号付きバイト配列に収まらない値もValueErrorにするため、配列化する前に範囲を確認
+        if counts and min(counts) < 0:
+            raise ValueError("枚数は0以上である必要があります")
+        if counts and max(counts) > cls.MAX_SIZE:
+            raise ValueError("手牌は最大14枚までです")
+
+        hand_counts = array("b", counts)
+        hand_counts.frombytes(bytes(TILE_KIND_COUNT - len(hand_counts)))
+        size = sum(hand_counts)
+        if size > cls.MAX_SIZE:
+            raise ValueError("手牌は最大14枚までです")
+
+        hand = cls.__new__(cls)
+        hand._counts = hand_counts
+        hand._size = size
+        hand._sorted_tiles = None
+        return hand
+
+    @classmethod
+    def from_sorted(cls, tiles: Sequence[Tile]) -> "Hand":
+        """牌順に並んだ牌列から手牌を作成
+
+        牌列をソート済み牌列のキャッシュとしてそのまま使います。
+
+        Args:
+            tiles: 牌順（tile_id順）に並んだ牌列
+
+        Returns:
+            牌列どおりの手牌
+
+        Raises:
+            ValueError: 牌順に並んでいない場合、または14枚を超える場合
+        """
+        if len(tiles) > cls.MAX_SIZE:
+            raise ValueError("手牌は最大14枚までです")
+
+        counts = array("b", bytes(TILE_KIND_COUNT))
+        previous = 0
+        for tile in tiles:
+            tile_id = tile.tile_id
+            if tile_id < previous:
+                raise ValueError("牌が牌順に並んでいません")
+            counts[tile_id] += 1
+            previous = tile_id
+
+        hand = cls.__new__(cls)
+        hand._counts = counts
+        hand._size = len(tiles)
+        hand._sorted_tiles = tuple(tiles)
+        return hand
 
     @property
     def tiles(self) -> List[Tile]:
@@ -36,7 +113,13 @@ class Hand:
         Returns:
             ソート済み牌リストのコピー
         """
-        return self._tiles.copy()
+        if self._sorted_tiles is None:
+            sorted_tiles: List[Tile] = []
+            for tile_id, count in enumerate(self._counts):
+                if count:
+                    sorted_tiles.extend([Tile.from_id(tile_id)] * count)
+            self._sorted_tiles = tuple(sorted_tiles)
+        return list(self._sorted_tiles)
 
     @property
     def size(self) -> int:
@@ -45,12 +128,24 @@ class Hand:
         Returns:
             現在の手牌の牌数
         """
-        return len(self._tiles)
+        return self._size
+
+    def counts_view(self) -> memoryview:
+        """枚数ベクトルの読み取り専用ビューを取得
+
+        コピーを作らずに内部の枚数ベクトルを参照します。
+        手牌を変更するとビューの内容も変わります。
+
+        Returns:
+            tile_idを添字とする枚数の読み取り専用memoryview
+        """
+        return memoryview(self._counts).toreadonly()
 
     def add_tile(self, tile: Tile) -> None:
         """牌を追加
 
-        追加後は自動的にソートされます。
+        枚数ベクトルを更新し、ソート済み牌列のキャッシュを破棄します。
+        ソートは次に tiles を参照したときに行われます。
 
         Args:
             tile: 追加する牌
@@ -58,11 +153,12 @@ class Hand:
         Raises:
             ValueError: 手牌が最大サイズ（14枚）に達している場合
         """
-        if self.size >= self.MAX_SIZE:
+        if self._size >= self.MAX_SIZE:
             raise ValueError("手牌は最大14枚までです")
 
-        self._tiles.append(tile)
-        self._tiles.sort()
+        self._counts[tile.tile_id] += 1
+        self._size += 1
+        self._sorted_tiles = None
 
     def remove_tile(self, tile: Tile) -> None:
         """牌を除去
@@ -75,11 +171,13 @@ class Hand:
         Raises:
             ValueError: 指定された牌が手牌に存在しない場合
         """
-        try:
-            self._tiles.remove(tile)
-        except ValueError:
+        if self._counts[tile.tile_id] == 0:
             raise ValueError("指定された牌が手牌に存在しません")
 
+        self._counts[tile.tile_id] -= 1
+        self._size -= 1
+        self._sorted_tiles = None
+
     def has_tile(self, tile: Tile) -> bool:
         """指定された牌が手牌に存在するかチェック
 
@@ -89,7 +187,7 @@ class Hand:
         Returns:
             存在する場合True、そうでなければFalse
         """
-        return tile in self._tiles
+        return self._counts[tile.tile_id] > 0
 
     def count_tile(self, tile: Tile) -> int:
         """指定された牌の枚数をカウント
@@ -100,11 +198,13 @@ class Hand:
         Returns:
             指定された牌の枚数
         """
-        return self._tiles.count(tile)
+        return self._counts[tile.tile_id]
 
     def clear(self) -> None:
         """手牌をクリア（全ての牌を除去）"""
-        self._tiles.clear()
+        self._counts = array("b", bytes(TILE_KIND_COUNT))
+        self._size = 0
+        self._sorted_tiles = None
 
     def get_unique_tiles(self) -> List[Tile]:
         """ユニークな牌のリストを取得
@@ -112,9 +212,7 @@ class Hand:
         Returns:
             重複を除いた牌のリスト（ソート済み）
         """
-        unique_tiles = list(set(self._tiles))
-        unique_tiles.sort()
-        return unique_tiles
+        return [Tile.from_id(tile_id) for tile_id, count in enumerate(self._counts) if count]
 
     def get_tile_counts(self) -> Dict[Tile, int]:
         """牌の種類別枚数を取得
@@ -122,15 +220,21 @@ class Hand:
         Returns:
             牌をキー、枚数を値とする辞書
         """
-        return dict(Counter(self._tiles))
+        return {Tile.from_id(tile_id): count for tile_id, count in enumerate(self._counts) if count}
 
     def copy(self) -> "Hand":
         """手牌のコピーを作成
 
+        枚数ベクトルを複製し、ソート済み牌列のキャッシュ（不変）は共有します。
+
         Returns:
             この手牌と同じ内容の新しいHandインスタンス
         """
-        return Hand(self._tiles)
+        hand = Hand.__new__(Hand)
+        hand._counts = array("b", self._counts)
+        hand._size = self._size
+        hand._sorted_tiles = self._sorted_tiles
+        return hand
 
     def __str__(self) -> str:
         """手牌の文字列表現
@@ -138,10 +242,10 @@ class Hand:
         Returns:
             牌を空白区切りで並べた文字列（空の場合は「（空）」）
         """
-        if not self._tiles:
+        if not self._size:
             return "（空）"
 
-        return " ".join(str(tile) for tile in self._tiles)
+        return " ".join(str(tile) for tile in self.tiles)
 
     def __repr__(self) -> str:
         """手牌の開発者向け表現
@@ -149,7 +253,7 @@ class Hand:
         Returns:
             Hand(tiles=[...])の形式
         """
-        return f"Hand(tiles={self._tiles!r})"
+        return f"Hand(tiles={self.tiles!r})"
 
     def __eq__(self, other: object) -> bool:
         """手牌の等価性チェック
@@ -163,8 +267,8 @@ class Hand:
         if not isinstance(other, Hand):
             return False
 
-        # ソート済みなので直接比較可能
-        return self._tiles == other._tiles
+        # 枚数ベクトルが同じなら同じ組み合わせ
+        return self._counts == other._counts
 
     def __hash__(self) -> int:
         """手牌のハッシュ値
@@ -172,4 +276,4 @@ class Hand:
         Returns:
             牌の組み合わせに基づくハッシュ値
         """
-        return hash(tuple(self._tiles))
+        return hash(self._counts.tobytes())
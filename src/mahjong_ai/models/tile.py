@@ -1,59 +1,156 @@
 """麻雀の牌を表現するクラス"""
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import FrozenInstanceError
+from typing import Any, Dict, List, Optional, Tuple
+
+# 牌の種類数（数牌3種×9 + 字牌7）。枚数ベクトルの長さとして使用
+TILE_KIND_COUNT = 34
+
+# Phase 1の山牌に含まれる各種類の牌の枚数
+TILES_PER_KIND = 6
+
+# スートの並び順（tile_idの区間順と一致）
+SUIT_ORDER = {"sou": 0, "man": 1, "pin": 2, "honor": 3}
+
+# 生成済みの牌（(suit, value) → 牌）
+_INTERNED: Dict[Tuple[str, int], "Tile"] = {}
+
+# tile_idから牌への対応表
+_BY_ID: List[Optional["Tile"]] = [None] * TILE_KIND_COUNT
 
 
-@dataclass(frozen=True)
 class Tile:
     """麻雀の牌を表現するイミュータブルクラス
 
     Phase 1では索子のみをサポートします。
     将来の拡張性を考慮して設計されています。
 
+    同じ(suit, value)の牌は常に同一のインスタンスになります（フライウェイト）。
+    Tile(...)・Tile.of(...)・Tile.from_id(...)のいずれで取得しても
+    生成済みの牌が返されるため、等価性は同一性比較で判定できます。
+
     Attributes:
         suit: 牌の種類（Phase 1では'sou'のみ）
         value: 牌の数字（1-9）
+        tile_id: 将来の拡張に備えた数値ID
+        is_terminal: 么九牌（1, 9）かどうか
+        is_middle: 中張牌（2-8）かどうか
+        sort_key: 並び順の比較に使う整数キー
     """
 
+    __slots__ = ("suit", "value", "tile_id", "is_terminal", "is_middle", "sort_key", "_hash")
+
     suit: str
     value: int
+    tile_id: int
+    is_terminal: bool
+    is_middle: bool
+    sort_key: int
+    _hash: int
+
+    def __new__(cls, suit: str, value: int) -> "Tile":
+        """牌を取得（生成済みなら同じインスタンスを返す）
+
+        Args:
+            suit: 牌の種類
+            value: 牌の数字
 
-    def __post_init__(self) -> None:
-        """初期化後の検証処理"""
-        if self.suit != "sou":
+        Returns:
+            (suit, value)に対応する牌
+
+        Raises:
+            ValueError: 不正な種類・数字の場合
+        """
+        tile = _INTERNED.get((suit, value))
+        if tile is not None:
+            return tile
+
+        if suit != "sou":
             raise ValueError("Phase 1では索子のみサポートしています")
 
-        if not (1 <= self.value <= 9):
+        if not (1 <= value <= 9):
             raise ValueError("索子の値は1-9である必要があります")
 
-    @property
-    def tile_id(self) -> int:
-        """将来の拡張に備えた数値ID
+        tile = super().__new__(cls)
+        # 索子の場合: 0-8 (value - 1)
+        # 将来の拡張: 萬子9-17, 筒子18-26, 字牌27-33
+        tile_id = SUIT_ORDER[suit] * 9 + value - 1
+        object.__setattr__(tile, "suit", suit)
+        object.__setattr__(tile, "value", value)
+        object.__setattr__(tile, "tile_id", tile_id)
+        object.__setattr__(tile, "is_terminal", value in (1, 9))
+        object.__setattr__(tile, "is_middle", 2 <= value <= 8)
+        object.__setattr__(tile, "sort_key", tile_id)
+        object.__setattr__(tile, "_hash", hash((suit, value)))
+
+        _INTERNED[(suit, value)] = tile
+        _BY_ID[tile_id] = tile
+        return tile
+
+    @classmethod
+    def of(cls, suit: str, value: int) -> "Tile":
+        """(suit, value)に対応する生成済みの牌を取得
+
+        Args:
+            suit: 牌の種類
+            value: 牌の数字
 
         Returns:
-            索子の場合: 0-8 (value - 1)
-            将来の拡張: 萬子36-71, 筒子72-107, 字牌108-135
+            対応する牌
+
+        Raises:
+            ValueError: 不正な種類・数字の場合
         """
-        return self.value - 1
+        tile = _INTERNED.get((suit, value))
+        if tile is None:
+            tile = cls(suit, value)
+        return tile
 
-    @property
-    def is_terminal(self) -> bool:
-        """么九牌（1, 9）かどうかを判定
+    @staticmethod
+    def from_id(tile_id: int) -> "Tile":
+        """tile_idに対応する生成済みの牌を取得
+
+        Args:
+            tile_id: 牌の数値ID
 
         Returns:
-            么九牌の場合True、そうでなければFalse
+            対応する牌
+
+        Raises:
+            ValueError: 対応する牌が存在しない場合
         """
-        return self.value in (1, 9)
+        tile = _BY_ID[tile_id] if 0 <= tile_id < TILE_KIND_COUNT else None
+        if tile is None:
+            raise ValueError(f"tile_id {tile_id} に対応する牌がありません")
+        return tile
 
-    @property
-    def is_middle(self) -> bool:
-        """中張牌（2-8）かどうかを判定
+    def __setattr__(self, name: str, value: Any) -> None:
+        """属性の変更を禁止"""
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
 
-        Returns:
-            中張牌の場合True、そうでなければFalse
-        """
-        return 2 <= self.value <= 8
+    def __delattr__(self, name: str) -> None:
+        """属性の削除を禁止"""
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str, int]]:
+        """pickle復元時も生成済みの牌を返すようにする"""
+        return (Tile, (self.suit, self.value))
+
+    def __copy__(self) -> "Tile":
+        """コピーは自分自身"""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Tile":
+        """ディープコピーも自分自身"""
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        """牌の等価性（生成済みの牌は一意なので同一性で判定）"""
+        return self is other
+
+    def __hash__(self) -> int:
+        """牌のハッシュ値（事前計算済み）"""
+        return self._hash
 
     def __str__(self) -> str:
         """牌の文字列表現
@@ -63,6 +160,14 @@ class Tile:
         """
         return f"{self.value}索"
 
+    def __repr__(self) -> str:
+        """牌の開発者向け表現
+
+        Returns:
+            Tile(suit='sou', value=1)の形式
+        """
+        return f"Tile(suit={self.suit!r}, value={self.value!r})"
+
     def __lt__(self, other: Any) -> bool:
         """牌の順序比較（小なり）
 
@@ -77,30 +182,28 @@ class Tile:
         """
         if not isinstance(other, Tile):
             raise TypeError("Tileオブジェクト同士でのみ比較可能です")
-
-        # 同じスートの場合は値で比較
-        if self.suit == other.suit:
-            return self.value < other.value
-
-        # 異なるスートの場合は将来の拡張を考慮
-        # Phase 1では索子のみなので、この分岐は使用されない
-        suit_order = {"sou": 0, "man": 1, "pin": 2, "honor": 3}
-        return suit_order[self.suit] < suit_order[other.suit]
+        return self.sort_key < other.sort_key
 
     def __le__(self, other: Any) -> bool:
         """牌の順序比較（小なりイコール）"""
         if not isinstance(other, Tile):
             raise TypeError("Tileオブジェクト同士でのみ比較可能です")
-        return self == other or self < other
+        return self.sort_key <= other.sort_key
 
     def __gt__(self, other: Any) -> bool:
         """牌の順序比較（大なり）"""
         if not isinstance(other, Tile):
             raise TypeError("Tileオブジェクト同士でのみ比較可能です")
-        return not self <= other
+        return self.sort_key > other.sort_key
 
     def __ge__(self, other: Any) -> bool:
         """牌の順序比較（大なりイコール）"""
         if not isinstance(other, Tile):
             raise TypeError("Tileオブジェクト同士でのみ比較可能です")
-        return not self < other
+        return self.sort_key >= other.sort_key
+
+
+# Phase 1で使用する索子を事前に生成
+for _value in range(1, 10):
+    Tile("sou", _value)
+del _value
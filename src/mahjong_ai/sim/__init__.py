@@ -0,0 +1,31 @@
+"""ヘッドレス自己対局パッケージ"""
+
+from .advisor import DiscardAdvisor, DiscardEstimate
+from .policies import (
+    DiscardPolicy,
+    RandomDiscardPolicy,
+    ShantenPolicy,
+    TsumogiriPolicy,
+    UkeirePolicy,
+    create_policy,
+)
+from .runner import ParallelRunner
+from .simulator import GameResult, SimulationStats, Simulator
+from .solver import ExactSolver, SolverResult
+
+__all__ = [
+    'DiscardAdvisor',
+    'DiscardEstimate',
+    'DiscardPolicy',
+    'ExactSolver',
+    'GameResult',
+    'ParallelRunner',
+    'RandomDiscardPolicy',
+    'ShantenPolicy',
+    'SimulationStats',
+    'Simulator',
+    'SolverResult',
+    'TsumogiriPolicy',
+    'UkeirePolicy',
+    'create_policy',
+]
@@ -0,0 +1,48 @@
+"""自己対局のコマンドラインエントリーポイント
+
+使用例:
+    poetry run python -m mahjong_ai.sim --games 10000 --policy ukeire
+    poetry run python -m mahjong_ai.sim --games 1000000 --workers 8 --seed 42
+"""
+
+import argparse
+import random
+import time
+from typing import List, Optional
+
+from mahjong_ai.sim.policies import POLICIES
+from mahjong_ai.sim.runner import ParallelRunner
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """指定された方針で自己対局を行い、集計結果を表示
+
+    Args:
+        argv: コマンドライン引数（Noneの場合はsys.argv）
+    """
+    parser = argparse.ArgumentParser(description="1人麻雀の自己対局シミュレーション")
+    parser.add_argument("--games", type=int, default=10000, help="対局数")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="shanten", help="打牌方針")
+    parser.add_argument("--workers", type=int, default=1, help="ワーカープロセス数（0でCPUコア数）")
+    parser.add_argument("--seed", type=int, default=None, help="マスターシード（省略時は無作為）")
+    args = parser.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else random.SystemRandom().getrandbits(32)
+    runner = ParallelRunner(workers=args.workers or None)
+
+    start = time.perf_counter()
+    stats = runner.run(args.policy, args.games, seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"方針: {args.policy}")
+    print(f"シード: {seed}")
+    print(f"対局数: {stats.games}")
+    print(f"和了率: {stats.win_rate:.2%}")
+    print(f"流局率: {stats.ryuukyoku_rate:.2%}")
+    print(f"平均和了巡目: {stats.average_turns_to_win:.2f}")
+    print(f"平均聴牌巡目: {stats.average_turns_to_tenpai:.2f}")
+    print(f"処理速度: {stats.games / elapsed:.0f} 局/秒")
+
+
+if __name__ == "__main__":
+    main()
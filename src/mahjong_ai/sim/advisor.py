@@ -0,0 +1,468 @@
+"""モンテカルロ法による打牌評価"""
+
+import multiprocessing
+import random
+import time
+from dataclasses import dataclass
+from math import sqrt
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from mahjong_ai.game.game_engine import GameEngine
+from mahjong_ai.logic.lru_cache import LRUCache
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator, kan_count_for_size
+from mahjong_ai.logic.shanten_table import SUIT_SIZE
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import TILES_PER_KIND, Tile
+from mahjong_ai.sim.runner import batch_seeds
+from mahjong_ai.utils.logger import configure_logging
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpyはオプション
+    np = None
+
+# 1回の評価で行う試行数の既定値（打牌候補ごと）
+DEFAULT_ROLLOUTS = 2000
+
+# 1バッチあたりの試行数の既定値
+DEFAULT_ROLLOUT_BATCH_SIZE = 250
+
+# ロールアウトのバッチの指定（手牌の枚数ベクトル, 打牌候補, 山牌の枚数ベクトル, ツモ回数, 試行数, シード）
+RolloutSpec = Tuple[bytes, Tuple[int, ...], bytes, int, int, int]
+
+
+@dataclass(frozen=True)
+class DiscardEstimate:
+    """打牌候補の和了率の推定値
+
+    Attributes:
+        tile: 打牌する牌
+        wins: 和了した試行数
+        rollouts: 試行数
+    """
+
+    tile: Tile
+    wins: int
+    rollouts: int
+
+    @property
+    def win_rate(self) -> float:
+        """推定和了率"""
+        return self.wins / self.rollouts if self.rollouts else 0.0
+
+    @property
+    def stderr(self) -> float:
+        """推定和了率の標準誤差"""
+        if not self.rollouts:
+            return 0.0
+        rate = self.win_rate
+        return sqrt(rate * (1.0 - rate) / self.rollouts)
+
+
+class RolloutEvaluator:
+    """枚数ベクトル上で終局までのツモを試行するクラス
+
+    試行中の打牌は「ツモで向聴数が下がる場合だけ手牌に取り込み、向聴数が
+    最小で有効牌の種類・枚数が最大の牌を打牌、それ以外はツモ切り」とします。
+    手牌の枚数ベクトルごとに向聴数とツモ後の向聴数表、打牌の選択を
+    LRUキャッシュに保存するため、同じ手牌を何度通っても計算は1回だけです。
+    暗槓後の手牌（3n+1枚・3n+2枚）は、手牌の枚数から求めた暗槓の数を
+    面子に数えて向聴数と和了を判定します。
+
+    NumPyがインストールされている場合は、打牌候補×試行の全行を1ツモずつ
+    行列演算でまとめて進めます（手牌が変わる行だけ個別に処理します）。
+    ツモ順は常に同じ乱数列から生成するため、結果はNumPyの有無に依存しません。
+    """
+
+    DEFAULT_CACHE_SIZE = 1 << 16
+
+    def __init__(
+        self, shanten_calculator: Optional[ShantenCalculator] = None, cache_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        """評価器を初期化
+
+        Args:
+            shanten_calculator: 使用する向聴数計算器（Noneの場合は新規作成）
+            cache_size: 各キャッシュの最大エントリ数（0以下でキャッシュ無効）
+        """
+        self.shanten_calculator = shanten_calculator if shanten_calculator is not None else ShantenCalculator()
+        # ツモ前の枚数ベクトル → (向聴数, ツモ後の向聴数表)
+        self._draw_cache: LRUCache[Tuple[int, List[int]]] = LRUCache(cache_size)
+        # ツモ後の枚数ベクトル → 打牌するtile_id
+        self._discard_cache: LRUCache[int] = LRUCache(cache_size)
+
+    def run_batch(
+        self,
+        hand_counts: Sequence[int],
+        candidates: Sequence[int],
+        wall_counts: Sequence[int],
+        draws: int,
+        rollouts: int,
+        rng: random.Random,
+    ) -> List[int]:
+        """打牌候補ごとにrollouts回ずつ試行して和了数を数える
+
+        全候補に同じツモ順を使うため、候補間の差の分散が小さくなります。
+
+        Args:
+            hand_counts: 打牌前の手牌の枚数ベクトル（3n+2枚）
+            candidates: 打牌候補のtile_id
+            wall_counts: 山牌に残っている牌の枚数ベクトル
+            draws: 打牌後に残っているツモ回数
+            rollouts: 試行数
+            rng: ツモ順の生成に使う乱数生成器
+
+        Returns:
+            候補の順に並べた和了数のリスト
+        """
+        population = [tile_id for tile_id in range(SUIT_SIZE) for _ in range(wall_counts[tile_id])]
+        draws = min(draws, len(population))
+        starts = []
+        for tile_id in candidates:
+            counts = list(hand_counts[:SUIT_SIZE])
+            counts[tile_id] -= 1
+            starts.append(counts)
+
+        sequences = [rng.sample(population, draws) for _ in range(rollouts)]
+        if np is None:
+            return self._count_wins(starts, sequences)
+        return self._count_wins_vectorized(starts, sequences)
+
+    def _count_wins(self, starts: Sequence[Sequence[int]], sequences: Sequence[Sequence[int]]) -> List[int]:
+        """試行を1つずつ進めて打牌候補ごとの和了数を数える
+
+        Args:
+            starts: 打牌候補ごとの打牌後の手牌の枚数ベクトル
+            sequences: 試行ごとのツモ順（tile_id列）
+
+        Returns:
+            候補の順に並べた和了数のリスト
+        """
+        wins = [0] * len(starts)
+        for sequence in sequences:
+            for index, counts in enumerate(starts):
+                if self._rollout(list(counts), sequence):
+                    wins[index] += 1
+        return wins
+
+    def _count_wins_vectorized(
+        self, starts: Sequence[Sequence[int]], sequences: Sequence[Sequence[int]]
+    ) -> List[int]:
+        """全試行をNumPyで1ツモずつまとめて進めて打牌候補ごとの和了数を数える
+
+        途中の手牌に番号を付け、向聴数とツモ後の向聴数表を番号で引ける行列に
+        まとめます。各ツモでは和了・取り込みの判定を全行まとめて行い、
+        手牌が変わる行の遷移だけを (手牌の番号, ツモ牌) ごとに1回計算します。
+        結果は _count_wins と一致します。
+
+        Args:
+            starts: 打牌候補ごとの打牌後の手牌の枚数ベクトル
+            sequences: 試行ごとのツモ順（tile_id列、すべて同じ長さ）
+
+        Returns:
+            候補の順に並べた和了数のリスト
+        """
+        rollouts = len(sequences)
+        draws = len(sequences[0]) if rollouts else 0
+        if draws == 0:
+            return [0] * len(starts)
+
+        state_ids: Dict[bytes, int] = {}
+        state_counts: List[List[int]] = []
+        shanten_rows: List[int] = []
+        table_rows: List[List[int]] = []
+
+        def state_of(counts: List[int]) -> int:
+            key = bytes(counts)
+            state = state_ids.get(key)
+            if state is None:
+                state = len(state_counts)
+                state_ids[key] = state
+                state_counts.append(counts)
+                shanten, draw_table = self._draw_entry(counts)
+                shanten_rows.append(shanten)
+                table_rows.append(draw_table)
+            return state
+
+        # (手牌の番号, ツモ牌) → 取り込んで打牌した後の手牌の番号
+        transitions: Dict[Tuple[int, int], int] = {}
+
+        # 行は打牌候補ごとにrollouts行ずつ並べ、全候補で同じツモ順を使う
+        states = np.repeat(np.array([state_of(list(counts)) for counts in starts], dtype=np.intp), rollouts)
+        row_sequences = np.tile(np.array(sequences, dtype=np.intp), (len(starts), 1))
+        won = np.zeros(len(states), dtype=bool)
+        active = np.arange(len(states))
+        shanten_array = np.array(shanten_rows, dtype=np.int8)
+        table_array = np.array(table_rows, dtype=np.int8)
+
+        for step in range(draws):
+            drawn = row_sequences[active, step]
+            current = states[active]
+            drawn_shanten = table_array[current, drawn]
+            wins = drawn_shanten == -1
+            won[active[wins]] = True
+
+            improved = np.flatnonzero(~wins & (drawn_shanten < shanten_array[current]))
+            if improved.size:
+                known = len(state_counts)
+                for index in improved.tolist():
+                    key = (int(current[index]), int(drawn[index]))
+                    next_state = transitions.get(key)
+                    if next_state is None:
+                        counts = list(state_counts[key[0]])
+                        counts[key[1]] += 1
+                        counts[self._choose_discard(counts)] -= 1
+                        next_state = state_of(counts)
+                        transitions[key] = next_state
+                    states[active[index]] = next_state
+                if len(state_counts) > known:
+                    shanten_array = np.array(shanten_rows, dtype=np.int8)
+                    table_array = np.array(table_rows, dtype=np.int8)
+
+            active = active[~wins]
+            if not active.size:
+                break
+
+        return won.reshape(len(starts), rollouts).sum(axis=1).tolist()
+
+    def _rollout(self, counts: List[int], sequence: Sequence[int]) -> bool:
+        """ツモ順に従って1局分を試行
+
+        Args:
+            counts: ツモ前の手牌の枚数ベクトル（変更される）
+            sequence: ツモする牌のtile_id列
+
+        Returns:
+            和了した場合True
+        """
+        shanten, draw_table = self._draw_entry(counts)
+        for tile_id in sequence:
+            drawn_shanten = draw_table[tile_id]
+            if drawn_shanten == -1:
+                return True
+            if drawn_shanten < shanten:
+                counts[tile_id] += 1
+                counts[self._choose_discard(counts)] -= 1
+                shanten, draw_table = self._draw_entry(counts)
+        return False
+
+    def _draw_entry(self, counts: Sequence[int]) -> Tuple[int, List[int]]:
+        """ツモ前の手牌の向聴数とツモ後の向聴数表を取得（キャッシュ付き）"""
+
+        def compute() -> Tuple[int, List[int]]:
+            calculator = self.shanten_calculator
+            size = sum(counts)
+            kan_count = kan_count_for_size(size)
+            shanten = calculator.calculate_shanten(Hand.from_counts(counts), kan_count)
+            draw_table = calculator.draw_shanten_from_counts(counts, size, kan_count=kan_count)
+            return shanten, [draw_table[tile_id] for tile_id in range(SUIT_SIZE)]
+
+        return self._draw_cache.get_or_compute(bytes(counts), compute)
+
+    def _choose_discard(self, counts: Sequence[int]) -> int:
+        """ツモ後の手牌から打牌するtile_idを選択（キャッシュ付き）"""
+
+        def compute() -> int:
+            hand = Hand.from_counts(counts)
+            discard_table = self.shanten_calculator.shanten_after_each_discard(hand, kan_count_for_size(hand.size))
+            best = min(discard_table.values())
+            scores = {}
+            for tile_id, shanten in discard_table.items():
+                if shanten != best:
+                    continue
+                after = list(counts)
+                after[tile_id] -= 1
+                _, draw_table = self._draw_entry(after)
+                effective = [t for t in range(SUIT_SIZE) if draw_table[t] < shanten]
+                scores[tile_id] = (len(effective), sum(TILES_PER_KIND - after[t] for t in effective))
+            return max(scores, key=lambda tile_id: scores[tile_id])
+
+        return self._discard_cache.get_or_compute(bytes(counts), compute)
+
+
+# ワーカープロセスごとの評価器（キャッシュをバッチ間で共有する）
+_worker_evaluator: Optional[RolloutEvaluator] = None
+
+
+def run_rollout_batch(spec: RolloutSpec) -> List[int]:
+    """1バッチ分の試行を行う（プロセスプールから呼び出される）
+
+    Args:
+        spec: バッチの指定
+
+    Returns:
+        候補の順に並べた和了数のリスト
+    """
+    global _worker_evaluator
+    if _worker_evaluator is None:
+        _worker_evaluator = RolloutEvaluator()
+
+    hand_counts, candidates, wall_counts, draws, rollouts, seed = spec
+    return _worker_evaluator.run_batch(hand_counts, candidates, wall_counts, draws, rollouts, random.Random(seed))
+
+
+class DiscardAdvisor:
+    """打牌候補ごとの和了率をモンテカルロ法で推定するクラス
+
+    山牌の残りの構成（並びは未知とする）から無作為なツモ順を生成し、
+    各打牌候補について残りのツモ回数内に和了できるかを試行します。
+    試行はバッチ単位で行い、試行数に達するか持ち時間を使い切った時点で終了します。
+    workersを2以上にすると、バッチをプロセスプールで並列に実行します。
+    プロセスプールは最初の評価時に作成して評価間で再利用するため、
+    使い終わったら close() するか with文で使用してください。
+    """
+
+    def __init__(
+        self,
+        rollouts: int = DEFAULT_ROLLOUTS,
+        batch_size: int = DEFAULT_ROLLOUT_BATCH_SIZE,
+        time_budget: Optional[float] = None,
+        workers: int = 1,
+        seed: Optional[int] = None,
+        evaluator: Optional[RolloutEvaluator] = None,
+    ) -> None:
+        """評価器を初期化
+
+        Args:
+            rollouts: 打牌候補ごとの最大試行数
+            batch_size: 1バッチあたりの試行数
+            time_budget: 1回の評価の持ち時間（秒、Noneの場合は試行数まで実行）
+            workers: ワーカープロセス数（1の場合は同一プロセスで実行）
+            seed: ツモ順の生成に使うマスターシード（Noneの場合は無作為）
+            evaluator: 同一プロセスで使う評価器（Noneの場合は新規作成）
+
+        Raises:
+            ValueError: 試行数・バッチサイズ・ワーカー数が1未満の場合
+        """
+        if rollouts < 1 or batch_size < 1 or workers < 1:
+            raise ValueError("試行数・バッチサイズ・ワーカー数は1以上である必要があります")
+
+        self.rollouts = rollouts
+        self.batch_size = batch_size
+        self.time_budget = time_budget
+        self.workers = workers
+        self.seed = seed
+        self.evaluator = evaluator if evaluator is not None else RolloutEvaluator()
+        self._rng = random.Random(seed)
+        self._pool: Optional[Any] = None
+
+    def close(self) -> None:
+        """プロセスプールを終了"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "DiscardAdvisor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def evaluate(self, engine: GameEngine) -> Dict[Tile, DiscardEstimate]:
+        """ゲームエンジンの現在の手牌について打牌候補を評価
+
+        リーチ中はツモ切りのみを候補とします。暗槓後の手牌も評価できます。
+
+        Args:
+            engine: ツモ後（打牌前）のゲームエンジン
+
+        Returns:
+            打牌する牌をキー、推定値を値とする辞書（牌順）
+
+        Raises:
+            ValueError: 打牌前の手牌（3n+2枚）でない場合
+        """
+        hand = engine.current_hand
+        if hand.size % 3 != 2:
+            raise ValueError("打牌評価は3n+2枚の手牌に対して行います")
+
+        counts = hand.counts_view()
+        if engine.is_riichi and engine.last_drawn_tile is not None:
+            candidates = [engine.last_drawn_tile.tile_id]
+        else:
+            candidates = [tile_id for tile_id in range(SUIT_SIZE) if counts[tile_id]]
+
+        wall_counts = list(engine.wall.counts_view()[:SUIT_SIZE])
+        return self.evaluate_counts(counts, candidates, wall_counts, engine.wall.remaining_count)
+
+    def evaluate_counts(
+        self,
+        hand_counts: Sequence[int],
+        candidates: Sequence[int],
+        wall_counts: Sequence[int],
+        draws: int,
+    ) -> Dict[Tile, DiscardEstimate]:
+        """枚数ベクトルで与えた局面について打牌候補を評価
+
+        Args:
+            hand_counts: 打牌前の手牌の枚数ベクトル
+            candidates: 打牌候補のtile_id
+            wall_counts: 山牌に残っている牌の枚数ベクトル
+            draws: 打牌後に残っているツモ回数
+
+        Returns:
+            打牌する牌をキー、推定値を値とする辞書（牌順）
+        """
+        candidates = tuple(sorted(candidates))
+        hand_key = bytes(hand_counts[:SUIT_SIZE])
+        wall_key = bytes(wall_counts[:SUIT_SIZE])
+
+        batches = (self.rollouts + self.batch_size - 1) // self.batch_size
+        specs: List[RolloutSpec] = []
+        for index, seed in enumerate(batch_seeds(self._rng.getrandbits(64), batches)):
+            size = min(self.batch_size, self.rollouts - index * self.batch_size)
+            specs.append((hand_key, candidates, wall_key, draws, size, seed))
+
+        wins = [0] * len(candidates)
+        done = 0
+        for batch_size, batch_wins in self._run_specs(specs):
+            done += batch_size
+            for index, count in enumerate(batch_wins):
+                wins[index] += count
+
+        return {
+            Tile.from_id(tile_id): DiscardEstimate(Tile.from_id(tile_id), wins[index], done)
+            for index, tile_id in enumerate(candidates)
+        }
+
+    def best_discard(self, engine: GameEngine) -> Tile:
+        """推定和了率が最も高い打牌を取得
+
+        Args:
+            engine: ツモ後（打牌前）のゲームエンジン
+
+        Returns:
+            打牌する牌
+        """
+        estimates = self.evaluate(engine)
+        return max(estimates.values(), key=lambda estimate: estimate.win_rate).tile
+
+    def _run_specs(self, specs: List[RolloutSpec]) -> Iterator[Tuple[int, List[int]]]:
+        """バッチを実行し、(試行数, 和了数のリスト) を完了順に返す
+
+        持ち時間を超えた時点で残りのバッチは実行しません（最低1バッチは実行）。
+        """
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+
+        if self.workers <= 1 or len(specs) <= 1:
+            for spec in specs:
+                hand_key, candidates, wall_key, draws, size, seed = spec
+                yield size, self.evaluator.run_batch(hand_key, candidates, wall_key, draws, size, random.Random(seed))
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+            return
+
+        if self._pool is None:
+            # ワーカーごとのログファイルは作成しない
+            self._pool = multiprocessing.Pool(
+                processes=self.workers, initializer=configure_logging, initargs=(None, False)
+            )
+
+        # 持ち時間内に終わるよう、ワーカー数ずつ投入して完了を待つ
+        for start in range(0, len(specs), self.workers):
+            chunk = specs[start : start + self.workers]
+            for spec, batch_wins in zip(chunk, self._pool.map(run_rollout_batch, chunk)):
+                yield spec[4], batch_wins
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
@@ -0,0 +1,258 @@
+"""自己対局用の打牌方針"""
+
+import random
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from mahjong_ai.game.wall_tiles import WallTiles
+from mahjong_ai.logic.lru_cache import LRUCache
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.logic.ukeire import UkeireCalculator
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import Tile
+
+
+class DiscardPolicy(ABC):
+    """打牌方針の基底クラス
+
+    シミュレーターはツモ後（14枚）の枚数ベクトルごとに choose_discard_id を呼び出し、
+    返された種類の牌を打牌します。手牌・枚数ベクトルや山牌を変更してはいけません。
+
+    既定の choose_discard_id は手牌を作成して choose_discard に委ねるため、
+    派生クラスは choose_discard だけを実装すれば使えます。組み込みの方針は
+    枚数ベクトルのまま判断する choose_discard_id を実装し、choose_discard から呼び出します。
+    choose_discard だけを上書きした派生クラスでは、上書きした choose_discard が使われます。
+    """
+
+    name = "base"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """choose_discard だけを上書きした派生クラスの choose_discard_id を既定に戻す"""
+        super().__init_subclass__(**kwargs)
+        if "choose_discard" in cls.__dict__ and "choose_discard_id" not in cls.__dict__:
+            cls.choose_discard_id = DiscardPolicy.choose_discard_id  # type: ignore[method-assign]
+
+    @abstractmethod
+    def choose_discard(self, hand: Hand, drawn_tile: Tile, wall: WallTiles) -> Tile:
+        """打牌する牌を選択
+
+        Args:
+            hand: ツモ後の手牌
+            drawn_tile: 直前にツモした牌
+            wall: 現在の山牌
+
+        Returns:
+            打牌する牌（手牌に含まれていること）
+        """
+
+    def choose_discard_id(self, counts: Sequence[int], drawn_id: int, wall: WallTiles) -> int:
+        """枚数ベクトル上で打牌する種類を選択
+
+        Args:
+            counts: ツモ後の手牌の枚数ベクトル（tile_idを添字とする）
+            drawn_id: 直前にツモした牌のtile_id
+            wall: 現在の山牌
+
+        Returns:
+            打牌する牌のtile_id（枚数ベクトルに1枚以上あること）
+        """
+        return self.choose_discard(Hand.from_counts(counts), Tile.from_id(drawn_id), wall).tile_id
+
+    @staticmethod
+    def _prefer_drawn(candidate_ids: Sequence[int], drawn_id: int) -> int:
+        """候補にツモ牌があればツモ切りを優先して1種類選ぶ
+
+        Args:
+            candidate_ids: 同等と評価された打牌候補のtile_id（牌順）
+            drawn_id: 直前にツモした牌のtile_id
+
+        Returns:
+            打牌する牌のtile_id
+        """
+        if drawn_id in candidate_ids:
+            return drawn_id
+        return candidate_ids[-1]
+
+
+class TsumogiriPolicy(DiscardPolicy):
+    """常にツモ切りする方針（比較の基準用）"""
+
+    name = "tsumogiri"
+
+    def choose_discard(self, hand: Hand, drawn_tile: Tile, wall: WallTiles) -> Tile:
+        """ツモした牌をそのまま打牌"""
+        return drawn_tile
+
+    def choose_discard_id(self, counts: Sequence[int], drawn_id: int, wall: WallTiles) -> int:
+        """ツモした牌をそのまま打牌"""
+        return drawn_id
+
+
+class RandomDiscardPolicy(DiscardPolicy):
+    """手牌から無作為に打牌する方針"""
+
+    name = "random"
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        """無作為打牌方針を初期化
+
+        Args:
+            rng: 使用する乱数生成器（Noneの場合は新規作成）
+        """
+        self.rng = rng if rng is not None else random.Random()
+
+    def choose_discard(self, hand: Hand, drawn_tile: Tile, wall: WallTiles) -> Tile:
+        """手牌の牌から1枚を無作為に選択"""
+        return Tile.from_id(self.choose_discard_id(hand.counts_view(), drawn_tile.tile_id, wall))
+
+    def choose_discard_id(self, counts: Sequence[int], drawn_id: int, wall: WallTiles) -> int:
+        """手牌の牌から1枚を無作為に選択
+
+        牌順に並べた手牌から rng.choice で1枚選ぶのと同じ乱数の消費で、同じ牌を選びます。
+        """
+        index = self.rng.randrange(sum(counts))
+        for tile_id, count in enumerate(counts):
+            if index < count:
+                return tile_id
+            index -= count
+        raise ValueError("手牌が空です")
+
+
+class ShantenPolicy(DiscardPolicy):
+    """打牌後の向聴数が最小になる牌を選ぶ方針
+
+    打牌候補はツモ後の枚数ベクトルをキーとするLRUキャッシュに保存します。
+    """
+
+    name = "shanten"
+
+    DEFAULT_CACHE_SIZE = 1 << 16
+
+    def __init__(
+        self, shanten_calculator: Optional[ShantenCalculator] = None, cache_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        """向聴数優先方針を初期化
+
+        Args:
+            shanten_calculator: 使用する向聴数計算器（Noneの場合は新規作成）
+            cache_size: キャッシュの最大エントリ数（0以下でキャッシュ無効）
+        """
+        self.shanten_calculator = shanten_calculator if shanten_calculator is not None else ShantenCalculator()
+        # ツモ後の枚数ベクトル → 打牌後の向聴数が最小になるtile_id
+        self._cache: LRUCache[Tuple[int, ...]] = LRUCache(cache_size)
+
+    def choose_discard(self, hand: Hand, drawn_tile: Tile, wall: WallTiles) -> Tile:
+        """打牌後の向聴数表から最小の牌を選択"""
+        return Tile.from_id(self.choose_discard_id(hand.counts_view(), drawn_tile.tile_id, wall))
+
+    def choose_discard_id(self, counts: Sequence[int], drawn_id: int, wall: WallTiles) -> int:
+        """打牌後の向聴数表から最小の種類を選択"""
+        candidate_ids = self._cache.get_or_compute(bytes(counts), lambda: self._best_ids(counts))
+        return self._prefer_drawn(candidate_ids, drawn_id)
+
+    def _best_ids(self, counts: Sequence[int]) -> Tuple[int, ...]:
+        """打牌後の向聴数が最小になるtile_idを求める
+
+        Args:
+            counts: ツモ後の手牌の枚数ベクトル
+
+        Returns:
+            打牌候補のtile_id（牌順）
+        """
+        discard_table = self.shanten_calculator.discard_shanten_from_counts(counts, sum(counts))
+        best = min(discard_table.values())
+        return tuple(tile_id for tile_id, shanten in discard_table.items() if shanten == best)
+
+
+class UkeirePolicy(DiscardPolicy):
+    """向聴数が最小で受け入れ枚数が最大になる牌を選ぶ方針
+
+    打牌ごとの向聴数と有効牌の種類はツモ後の枚数ベクトルをキーとするLRUキャッシュに保存し、
+    山牌の残り枚数（counts_view()）は打牌のたびに付け加えます。
+    """
+
+    name = "ukeire"
+
+    DEFAULT_CACHE_SIZE = 1 << 16
+
+    def __init__(
+        self, ukeire_calculator: Optional[UkeireCalculator] = None, cache_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        """受け入れ優先方針を初期化
+
+        Args:
+            ukeire_calculator: 使用する受け入れ計算器（Noneの場合は新規作成）
+            cache_size: キャッシュの最大エントリ数（0以下でキャッシュ無効）
+        """
+        self.ukeire_calculator = ukeire_calculator if ukeire_calculator is not None else UkeireCalculator()
+        # ツモ後の枚数ベクトル → 打牌ごとの (tile_id, 打牌後の向聴数, 有効牌のtile_id)
+        self._cache: LRUCache[Tuple[Tuple[int, int, Tuple[int, ...]], ...]] = LRUCache(cache_size)
+
+    def choose_discard(self, hand: Hand, drawn_tile: Tile, wall: WallTiles) -> Tile:
+        """山牌の残り枚数を使って受け入れ最大の牌を選択"""
+        return Tile.from_id(self.choose_discard_id(hand.counts_view(), drawn_tile.tile_id, wall))
+
+    def choose_discard_id(self, counts: Sequence[int], drawn_id: int, wall: WallTiles) -> int:
+        """山牌の残り枚数を使って受け入れ最大の種類を選択
+
+        UkeireCalculator.best_discards に山牌の分布を渡した場合と同じ候補から選びます。
+        """
+        discards = self._cache.get_or_compute(bytes(counts), lambda: self._discards(counts))
+        live = wall.counts_view()
+
+        best: Optional[Tuple[int, int]] = None
+        candidate_ids: List[int] = []
+        for tile_id, shanten, effective_ids in discards:
+            total = 0
+            for effective_id in effective_ids:
+                total += live[effective_id]
+            score = (shanten, -total)
+            if best is None or score < best:
+                best = score
+                candidate_ids = [tile_id]
+            elif score == best:
+                candidate_ids.append(tile_id)
+        return self._prefer_drawn(candidate_ids, drawn_id)
+
+    def _discards(self, counts: Sequence[int]) -> Tuple[Tuple[int, int, Tuple[int, ...]], ...]:
+        """打牌ごとの向聴数と有効牌の種類を求める
+
+        Args:
+            counts: ツモ後の手牌の枚数ベクトル
+
+        Returns:
+            (打牌するtile_id, 打牌後の向聴数, 有効牌のtile_id) のタプル（牌順）
+        """
+        effective = self.ukeire_calculator.effective_ids_after_discards(counts, sum(counts))
+        return tuple((tile_id, shanten, effective_ids) for tile_id, (shanten, effective_ids) in effective.items())
+
+
+# 名前から打牌方針クラスへの対応表
+POLICIES: Dict[str, type] = {
+    TsumogiriPolicy.name: TsumogiriPolicy,
+    RandomDiscardPolicy.name: RandomDiscardPolicy,
+    ShantenPolicy.name: ShantenPolicy,
+    UkeirePolicy.name: UkeirePolicy,
+}
+
+
+def create_policy(name: str, rng: Optional[random.Random] = None) -> DiscardPolicy:
+    """名前から打牌方針を作成
+
+    Args:
+        name: 打牌方針の名前（tsumogiri, random, shanten, ukeire）
+        rng: 乱数を使う方針に渡す乱数生成器
+
+    Returns:
+        打牌方針のインスタンス
+
+    Raises:
+        ValueError: 未知の名前の場合
+    """
+    policy_class = POLICIES.get(name)
+    if policy_class is None:
+        raise ValueError(f"未知の打牌方針です: {name}")
+    if policy_class is RandomDiscardPolicy:
+        return RandomDiscardPolicy(rng)
+    policy: DiscardPolicy = policy_class()
+    return policy
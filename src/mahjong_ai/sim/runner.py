@@ -0,0 +1,138 @@
+"""マルチプロセスの自己対局ランナー"""
+
+import multiprocessing
+import os
+import random
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from mahjong_ai.game.wall_tiles import DealPool, WallTiles
+from mahjong_ai.sim.policies import create_policy
+from mahjong_ai.sim.simulator import SimulationStats, Simulator
+from mahjong_ai.utils.logger import configure_logging
+
+# 1バッチあたりの対局数
+DEFAULT_BATCH_SIZE = 1000
+
+# バッチの指定（バッチ番号, 打牌方針の名前, 対局数, シード）
+BatchSpec = Tuple[int, str, int, int]
+
+
+def batch_seeds(master_seed: int, batches: int) -> List[int]:
+    """マスターシードから各バッチのシードを生成
+
+    バッチの分割はワーカー数に依存しないため、同じマスターシードからは
+    常に同じシード列が得られます。
+
+    Args:
+        master_seed: マスターシード
+        batches: バッチ数
+
+    Returns:
+        バッチ番号順のシードのリスト
+    """
+    master = random.Random(master_seed)
+    return [master.getrandbits(64) for _ in range(batches)]
+
+
+def run_batch(spec: BatchSpec) -> Tuple[int, SimulationStats]:
+    """1バッチ分を対局して集計
+
+    バッチのシードから山牌プールのシードと打牌方針の乱数生成器のシードを導き、
+    バッチ分の山牌を先にまとめて生成してから対局します。
+    どのプロセスで実行しても結果は同じになります。
+
+    Args:
+        spec: バッチの指定
+
+    Returns:
+        (バッチ番号, 集計結果) のタプル
+    """
+    index, policy_name, games, seed = spec
+    batch_rng = random.Random(seed)
+    deal_pool = DealPool(games, seed=batch_rng.getrandbits(64))
+    policy_rng = random.Random(batch_rng.getrandbits(64))
+
+    simulator = Simulator(policy=create_policy(policy_name, policy_rng), wall=WallTiles(deal_pool=deal_pool))
+    return index, simulator.run(games)
+
+
+class ParallelRunner:
+    """対局をバッチに分割してプロセスプールで実行するクラス
+
+    各バッチはマスターシードから導いたシードを持つ独立した乱数生成器で
+    対局し、結果は対局ごとではなくバッチごとの集計値として返されます。
+    集計は整数の合計のみなので、ワーカー数や完了順に関わらず
+    同じマスターシードからは同一の結果になります。
+    """
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """ランナーを初期化
+
+        Args:
+            workers: ワーカープロセス数（Noneの場合はCPUコア数、1の場合は同一プロセスで実行）
+            batch_size: 1バッチあたりの対局数
+
+        Raises:
+            ValueError: バッチサイズが1未満の場合
+        """
+        if batch_size < 1:
+            raise ValueError("バッチサイズは1以上である必要があります")
+
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.batch_size = batch_size
+
+    def iter_batches(self, policy_name: str, games: int, master_seed: int) -> Iterator[Tuple[int, SimulationStats]]:
+        """バッチごとの集計結果を完了順に取得
+
+        Args:
+            policy_name: 打牌方針の名前
+            games: 総対局数
+            master_seed: マスターシード
+
+        Yields:
+            (バッチ番号, 集計結果) のタプル
+        """
+        # 打牌方針名の検証は親プロセスで行う
+        create_policy(policy_name)
+
+        batches = (games + self.batch_size - 1) // self.batch_size
+        specs: List[BatchSpec] = []
+        for index, seed in enumerate(batch_seeds(master_seed, batches)):
+            batch_games = min(self.batch_size, games - index * self.batch_size)
+            specs.append((index, policy_name, batch_games, seed))
+
+        if self.workers <= 1 or len(specs) <= 1:
+            for spec in specs:
+                yield run_batch(spec)
+            return
+
+        # ワーカーごとのログファイルは作成しない
+        with multiprocessing.Pool(
+            processes=min(self.workers, len(specs)), initializer=configure_logging, initargs=(None, False)
+        ) as pool:
+            yield from pool.imap_unordered(run_batch, specs)
+
+    def run(
+        self,
+        policy_name: str,
+        games: int,
+        master_seed: int,
+        progress: Optional[Callable[[SimulationStats], None]] = None,
+    ) -> SimulationStats:
+        """全バッチを対局して集計を合算
+
+        Args:
+            policy_name: 打牌方針の名前
+            games: 総対局数
+            master_seed: マスターシード
+            progress: バッチ完了ごとに途中の合算結果を受け取る関数
+
+        Returns:
+            合算した集計結果
+        """
+        total = SimulationStats()
+        for _, stats in self.iter_batches(policy_name, games, master_seed):
+            total.merge(stats)
+            if progress is not None:
+                progress(total)
+        return total
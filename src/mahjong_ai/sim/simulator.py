@@ -0,0 +1,245 @@
+"""ヘッドレス自己対局シミュレーター"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from mahjong_ai.game.wall_tiles import WallTiles
+from mahjong_ai.logic.lru_cache import LRUCache
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import TILE_KIND_COUNT
+from mahjong_ai.sim.policies import DiscardPolicy, TsumogiriPolicy
+
+# 配牌の枚数
+INITIAL_HAND_SIZE = 13
+
+
+@dataclass
+class GameResult:
+    """1局分の結果
+
+    Attributes:
+        is_win: ツモ和了したかどうか
+        turns: ツモした回数
+        tenpai_turn: 初めて聴牌したツモ回数（配牌聴牌は0、未聴牌はNone）
+        seed: 山牌のシード（WallTiles(seed=...)で同じ山牌を再現できる。不明の場合はNone）
+    """
+
+    is_win: bool
+    turns: int
+    tenpai_turn: Optional[int]
+    seed: Optional[int] = None
+
+
+@dataclass
+class SimulationStats:
+    """自己対局の集計結果
+
+    対局ごとの結果は保持せず、合計値のみを積み上げます。
+
+    Attributes:
+        games: 対局数
+        wins: ツモ和了した対局数
+        ryuukyoku: 流局した対局数
+        win_turns: 和了した対局のツモ回数の合計
+        tenpai_games: 聴牌に到達した対局数
+        tenpai_turns: 聴牌に到達した対局の到達ツモ回数の合計
+    """
+
+    games: int = 0
+    wins: int = 0
+    ryuukyoku: int = 0
+    win_turns: int = 0
+    tenpai_games: int = 0
+    tenpai_turns: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        """和了率"""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def ryuukyoku_rate(self) -> float:
+        """流局率"""
+        return self.ryuukyoku / self.games if self.games else 0.0
+
+    @property
+    def average_turns_to_win(self) -> float:
+        """和了までの平均ツモ回数（和了した対局のみ）"""
+        return self.win_turns / self.wins if self.wins else 0.0
+
+    @property
+    def average_turns_to_tenpai(self) -> float:
+        """聴牌までの平均ツモ回数（聴牌した対局のみ）"""
+        return self.tenpai_turns / self.tenpai_games if self.tenpai_games else 0.0
+
+    def add(self, result: GameResult) -> None:
+        """1局分の結果を集計に加える
+
+        Args:
+            result: 対局結果
+        """
+        self.games += 1
+        if result.is_win:
+            self.wins += 1
+            self.win_turns += result.turns
+        else:
+            self.ryuukyoku += 1
+        if result.tenpai_turn is not None:
+            self.tenpai_games += 1
+            self.tenpai_turns += result.tenpai_turn
+
+    def merge(self, other: "SimulationStats") -> None:
+        """別の集計結果を合算
+
+        Args:
+            other: 合算する集計結果
+        """
+        self.games += other.games
+        self.wins += other.wins
+        self.ryuukyoku += other.ryuukyoku
+        self.win_turns += other.win_turns
+        self.tenpai_games += other.tenpai_games
+        self.tenpai_turns += other.tenpai_turns
+
+    def to_dict(self) -> Dict[str, Any]:
+        """集計値と各種率を辞書で取得
+
+        Returns:
+            集計結果の辞書
+        """
+        summary: Dict[str, Any] = asdict(self)
+        summary["win_rate"] = self.win_rate
+        summary["ryuukyoku_rate"] = self.ryuukyoku_rate
+        summary["average_turns_to_win"] = self.average_turns_to_win
+        summary["average_turns_to_tenpai"] = self.average_turns_to_tenpai
+        return summary
+
+
+class Simulator:
+    """画面出力・ログ出力なしで1人麻雀を連続で対局するクラス
+
+    GameEngineと同じ規則（13枚の配牌、ツモ和了、山牌が尽きたら流局）で
+    山牌を直接操作し、打牌は打牌方針に委ねます。
+    対話用の状態管理や表示を経由しないため、方針の統計的な評価に使えます。
+
+    手牌は枚数ベクトル（bytearray）のまま扱い、打牌方針には choose_discard_id で渡します。
+    13枚の手牌の向聴数と聴牌時の和了牌は枚数ベクトルをキーとするLRUキャッシュに保存し、
+    和了判定は和了牌の集合の参照だけで行います。手牌が変わるのはツモ切り以外の打牌の時だけです。
+    Phase 1の自己対局ではリーチ・暗槓は行いません。
+    """
+
+    DEFAULT_CACHE_SIZE = 1 << 16
+
+    def __init__(
+        self,
+        policy: Optional[DiscardPolicy] = None,
+        wall: Optional[WallTiles] = None,
+        shanten_calculator: Optional[ShantenCalculator] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """シミュレーターを初期化
+
+        Args:
+            policy: 打牌方針（Noneの場合はツモ切り）
+            wall: 使用する山牌（Noneの場合は新規作成）
+            shanten_calculator: 聴牌判定に使う向聴数計算器（Noneの場合は新規作成）
+            cache_size: 13枚の手牌の評価キャッシュの最大エントリ数（0以下でキャッシュ無効）
+        """
+        self.policy = policy if policy is not None else TsumogiriPolicy()
+        self.wall = wall if wall is not None else WallTiles()
+        self.shanten_calculator = shanten_calculator if shanten_calculator is not None else ShantenCalculator()
+        # 13枚の枚数ベクトル → (向聴数, 聴牌時の和了牌のtile_id)
+        self._cache: LRUCache[Tuple[int, FrozenSet[int]]] = LRUCache(cache_size)
+
+    def play_game(self) -> GameResult:
+        """1局を最後まで対局
+
+        山牌は1枚もツモしていなければそのまま使い、それ以外はリセットしてから対局します。
+        山牌プールを使う場合、N局でプールの山牌を先頭からN個使います。
+
+        Returns:
+            対局結果
+
+        Raises:
+            ValueError: 打牌方針が手牌にない牌を選んだ場合
+        """
+        wall = self.wall
+        if not wall.is_untouched():
+            wall.reset()
+        counts = bytearray(TILE_KIND_COUNT)
+        for tile in wall.draw_multiple_tiles(INITIAL_HAND_SIZE):
+            counts[tile.tile_id] += 1
+
+        choose_discard_id = self.policy.choose_discard_id
+        draw_tile = wall.draw_tile
+
+        # 13枚の手牌の向聴数と和了牌（手牌が変わるまで再利用）
+        shanten, winning_ids = self._evaluate(counts)
+        tenpai_turn: Optional[int] = 0 if shanten == 0 else None
+
+        turns = 0
+        for turns in range(1, wall.remaining_count + 1):
+            drawn_id = draw_tile().tile_id
+
+            # 聴牌していなければ和了牌の集合は空
+            if drawn_id in winning_ids:
+                return GameResult(is_win=True, turns=turns, tenpai_turn=tenpai_turn, seed=wall.seed)
+
+            counts[drawn_id] += 1
+            discarded_id = choose_discard_id(counts, drawn_id, wall)
+            if not counts[discarded_id]:
+                raise ValueError("打牌方針が手牌にない牌を選びました")
+            counts[discarded_id] -= 1
+
+            # ツモ切りなら13枚の手牌は変わらない
+            if discarded_id != drawn_id:
+                shanten, winning_ids = self._evaluate(counts)
+                if tenpai_turn is None and shanten == 0:
+                    tenpai_turn = turns
+
+        return GameResult(is_win=False, turns=turns, tenpai_turn=tenpai_turn, seed=wall.seed)
+
+    def _evaluate(self, counts: bytearray) -> Tuple[int, FrozenSet[int]]:
+        """13枚の手牌の向聴数と和了牌を取得（キャッシュ付き）
+
+        Args:
+            counts: 13枚の手牌の枚数ベクトル
+
+        Returns:
+            (向聴数, 聴牌時にツモで和了になるtile_id（聴牌していなければ空）) のタプル
+        """
+        return self._cache.get_or_compute(bytes(counts), lambda: self._evaluate_uncached(counts))
+
+    def _evaluate_uncached(self, counts: bytearray) -> Tuple[int, FrozenSet[int]]:
+        """13枚の手牌の向聴数と和了牌を計算
+
+        Args:
+            counts: 13枚の手牌の枚数ベクトル
+
+        Returns:
+            (向聴数, 聴牌時にツモで和了になるtile_id（聴牌していなければ空）) のタプル
+        """
+        calculator = self.shanten_calculator
+        shanten = calculator.calculate_shanten(Hand.from_counts(counts))
+        if shanten != 0:
+            return shanten, frozenset()
+
+        draw_table = calculator.draw_shanten_from_counts(counts, INITIAL_HAND_SIZE)
+        return shanten, frozenset(tile_id for tile_id, value in draw_table.items() if value == -1)
+
+    def run(self, games: int, stats: Optional[SimulationStats] = None) -> SimulationStats:
+        """指定された局数を対局して集計
+
+        Args:
+            games: 対局数
+            stats: 結果を加える集計（Noneの場合は新規作成）
+
+        Returns:
+            集計結果
+        """
+        if stats is None:
+            stats = SimulationStats()
+        for _ in range(games):
+            stats.add(self.play_game())
+        return stats
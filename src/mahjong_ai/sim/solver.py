@@ -0,0 +1,352 @@
+"""動的計画法による和了確率の厳密解
+
+Phase 1は1人用・索子のみの麻雀で、山牌の並びが一様に無作為であれば
+局面は (手牌の枚数ベクトル, 山牌の枚数ベクトル, 残りツモ回数) だけで決まります。
+この局面ごとに最適な打牌を続けた場合の和了確率をメモ化再帰で求めます。
+"""
+
+import struct
+from dataclasses import dataclass, field
+from math import comb
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from mahjong_ai.game.game_engine import GameEngine
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator, kan_count_for_size
+from mahjong_ai.logic.shanten_table import SUIT_SIZE
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import Tile
+
+# 置換表ファイルの先頭（識別子 + 形式バージョン、局面の値の求め方を変えたら上げる）
+TABLE_MAGIC = b"MJTT"
+TABLE_VERSION = 2
+TABLE_HEADER = TABLE_MAGIC + bytes([TABLE_VERSION])
+
+# 置換表のレコード（局面キー, 和了確率）
+_RECORD = struct.Struct(f"<{SUIT_SIZE * 2 + 1}sd")
+
+
+@dataclass(frozen=True)
+class SolverResult:
+    """局面の厳密解
+
+    Attributes:
+        win_probability: 最適に打牌した場合の和了確率
+        discards: 打牌する牌をキー、その打牌後の和了確率を値とする辞書
+            （ツモ前の局面では空）
+    """
+
+    win_probability: float
+    discards: Dict[Tile, float] = field(default_factory=dict)
+
+    @property
+    def best_discard(self) -> Optional[Tile]:
+        """和了確率が最も高い打牌（同率の場合は牌順で先の牌、ツモ前の局面ではNone）"""
+        if not self.discards:
+            return None
+        return max(self.discards, key=lambda tile: self.discards[tile])
+
+
+class ExactSolver:
+    """1人用・索子のみの局面の和了確率を厳密に求めるクラス
+
+    ツモ前の局面の値は、山牌に残る各牌をツモする確率と、ツモ後に
+    最善の打牌をした局面の値の期待値です。局面の値は置換表に保持し、
+    評価をまたいで再利用します。置換表は save() でファイルに保存し、
+    次回の起動時に読み込めます。
+
+    局面キーは索子の並びを反転（1索↔9索）しても値が変わらないことを利用し、
+    反転前後の小さい方に正規化します。
+    向聴数nの手牌は和了までに最低n+1回のツモが必要なため、
+    残りツモ回数で届かない局面は探索しません。
+    暗槓は打牌の選択肢に含めません。暗槓済みの局面は、手牌の枚数から求めた
+    暗槓の数を面子に数えて向聴数と和了を判定します。
+
+    局面数は残りツモ回数に対して指数的に増えるため、配牌直後のような
+    ツモ回数の多い局面を評価する場合は horizon で先読みするツモ回数を
+    制限します（その場合の値は「horizon回以内に和了する確率」の厳密解です）。
+    """
+
+    def __init__(
+        self,
+        shanten_calculator: Optional[ShantenCalculator] = None,
+        table_path: Optional[Union[str, Path]] = None,
+        horizon: Optional[int] = None,
+    ) -> None:
+        """ソルバーを初期化
+
+        Args:
+            shanten_calculator: 使用する向聴数計算器（Noneの場合は新規作成）
+            table_path: 置換表ファイル（存在すれば読み込み、save() の既定の保存先になる）
+            horizon: ゲームエンジンの局面で先読みする最大ツモ回数（Noneの場合は山牌が尽きるまで）
+
+        Raises:
+            ValueError: horizonが0未満の場合
+        """
+        if horizon is not None and horizon < 0:
+            raise ValueError("先読みするツモ回数は0以上である必要があります")
+
+        self.shanten_calculator = shanten_calculator if shanten_calculator is not None else ShantenCalculator()
+        self.table_path = Path(table_path) if table_path is not None else None
+        self.horizon = horizon
+        # 正規化した局面キー → 和了確率
+        self.table: Dict[bytes, float] = {}
+        # ツモ前の手牌の枚数ベクトル → (向聴数, ツモ後の向聴数表)
+        self._draw_cache: Dict[bytes, Tuple[int, List[int]]] = {}
+        # ツモ後の手牌の枚数ベクトル → 打牌ごとの向聴数
+        self._discard_cache: Dict[bytes, List[Tuple[int, int]]] = {}
+
+        if self.table_path is not None and self.table_path.exists():
+            self.load(self.table_path)
+
+    def __len__(self) -> int:
+        """置換表の局面数"""
+        return len(self.table)
+
+    def win_probability(self, hand_counts: Sequence[int], wall_counts: Sequence[int], draws: int) -> float:
+        """ツモ前の局面の和了確率を取得
+
+        Args:
+            hand_counts: ツモ前の手牌の枚数ベクトル（3n+1枚）
+            wall_counts: 山牌に残っている牌の枚数ベクトル
+            draws: 残りツモ回数
+
+        Returns:
+            最適に打牌した場合の和了確率
+        """
+        hand = list(hand_counts[:SUIT_SIZE])
+        wall = list(wall_counts[:SUIT_SIZE])
+        return self._value(hand, wall, sum(wall), draws)
+
+    def solve(
+        self,
+        hand_counts: Sequence[int],
+        wall_counts: Sequence[int],
+        draws: int,
+        candidates: Optional[Sequence[int]] = None,
+    ) -> SolverResult:
+        """打牌前の局面の各打牌の和了確率を取得
+
+        Args:
+            hand_counts: 打牌前の手牌の枚数ベクトル（3n+2枚）
+            wall_counts: 山牌に残っている牌の枚数ベクトル
+            draws: 打牌後に残っているツモ回数
+            candidates: 打牌候補のtile_id（Noneの場合は手牌の全種類）
+
+        Returns:
+            局面の厳密解（手牌が和了形なら和了確率は1）
+        """
+        hand = list(hand_counts[:SUIT_SIZE])
+        wall = list(wall_counts[:SUIT_SIZE])
+        total = sum(wall)
+        if candidates is None:
+            candidates = [tile_id for tile_id in range(SUIT_SIZE) if hand[tile_id]]
+
+        discards: Dict[Tile, float] = {}
+        for tile_id in sorted(candidates):
+            hand[tile_id] -= 1
+            discards[Tile.from_id(tile_id)] = self._value(hand, wall, total, draws)
+            hand[tile_id] += 1
+
+        win_probability = max(discards.values(), default=0.0)
+        if self._is_winning(hand):
+            win_probability = 1.0
+        return SolverResult(win_probability, discards)
+
+    def evaluate(self, engine: GameEngine) -> SolverResult:
+        """ゲームエンジンの現在の局面の厳密解を取得
+
+        ツモ前（3n+1枚）の局面では和了確率のみ、ツモ後（3n+2枚）の局面では
+        各打牌の和了確率も求めます。リーチ中は手牌が変わらないため、
+        ツモ切りのみを候補として待ち牌を引く確率を直接求めます。
+        残りツモ回数は山牌の残り枚数（horizonを指定した場合はその回数まで）とし、
+        置換表に残っている局面は再計算しません。
+
+        Args:
+            engine: 評価するゲームエンジン
+
+        Returns:
+            局面の厳密解
+        """
+        hand = list(engine.current_hand.counts_view()[:SUIT_SIZE])
+        wall = list(engine.wall.counts_view()[:SUIT_SIZE])
+        draws = engine.wall.remaining_count
+        if self.horizon is not None:
+            draws = min(draws, self.horizon)
+        locked = engine.is_riichi
+
+        if sum(hand) % 3 == 1:
+            if locked:
+                return SolverResult(self._locked_probability(hand, wall, sum(wall), draws))
+            return SolverResult(self._value(hand, wall, sum(wall), draws))
+
+        if locked and engine.last_drawn_tile is not None:
+            tile_id = engine.last_drawn_tile.tile_id
+            hand[tile_id] -= 1
+            probability = self._locked_probability(hand, wall, sum(wall), draws)
+            hand[tile_id] += 1
+            win_probability = 1.0 if self._is_winning(hand) else probability
+            return SolverResult(win_probability, {engine.last_drawn_tile: probability})
+
+        return self.solve(hand, wall, draws)
+
+    def best_discard(self, engine: GameEngine) -> Optional[Tile]:
+        """和了確率が最も高い打牌を取得
+
+        Args:
+            engine: ツモ後（打牌前）のゲームエンジン
+
+        Returns:
+            打牌する牌（ツモ前の局面ではNone）
+        """
+        return self.evaluate(engine).best_discard
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+        """置換表をファイルに保存
+
+        Args:
+            path: 保存するファイル（Noneの場合はtable_path）
+
+        Raises:
+            ValueError: 保存先が指定されていない場合
+        """
+        path = Path(path) if path is not None else self.table_path
+        if path is None:
+            raise ValueError("置換表の保存先が指定されていません")
+
+        pack = _RECORD.pack
+        with open(path, "wb") as file:
+            file.write(TABLE_HEADER)
+            file.write(b"".join(pack(key, value) for key, value in self.table.items()))
+
+    def load(self, path: Union[str, Path]) -> None:
+        """ファイルの置換表を読み込んで現在の置換表に追加
+
+        Args:
+            path: 読み込むファイル
+
+        Raises:
+            ValueError: 置換表ファイルでない場合、または非対応のバージョンの場合
+        """
+        data = Path(path).read_bytes()
+        if not data.startswith(TABLE_MAGIC):
+            raise ValueError(f"置換表ファイルではありません: {path}")
+        if data[: len(TABLE_HEADER)] != TABLE_HEADER:
+            raise ValueError(f"非対応の置換表ファイルのバージョンです: {data[len(TABLE_MAGIC) : len(TABLE_HEADER)]!r}")
+
+        body = memoryview(data)[len(TABLE_HEADER) :]
+        if len(body) % _RECORD.size:
+            raise ValueError(f"置換表ファイルが壊れています: {path}")
+        self.table.update(_RECORD.iter_unpack(body))
+
+    def clear(self) -> None:
+        """置換表を空にする"""
+        self.table.clear()
+
+    def _value(self, hand: List[int], wall: List[int], total: int, draws: int) -> float:
+        """ツモ前の局面の和了確率（メモ化再帰）
+
+        Args:
+            hand: ツモ前の手牌の枚数ベクトル（探索中に変更し、元に戻す）
+            wall: 山牌の枚数ベクトル（探索中に変更し、元に戻す）
+            total: 山牌の合計枚数
+            draws: 残りツモ回数
+
+        Returns:
+            和了確率
+        """
+        draws = min(draws, total)
+        shanten, draw_table = self._draw_entry(hand)
+        # 向聴数nの手牌は和了までにn+1回のツモが必要
+        if shanten >= draws:
+            return 0.0
+
+        key = self._canonical_key(hand, wall, draws)
+        value = self.table.get(key)
+        if value is not None:
+            return value
+
+        # 打牌後に残るツモ回数で和了まで届く向聴数の上限
+        reachable = draws - 2
+        weighted = 0.0
+        for drawn in range(SUIT_SIZE):
+            count = wall[drawn]
+            if not count:
+                continue
+            drawn_shanten = draw_table[drawn]
+            if drawn_shanten == -1:
+                weighted += count
+                continue
+            # 牌を加えても向聴数は増えないため、ツモ後の向聴数が上限を超えればどの打牌も届かない
+            if drawn_shanten > reachable:
+                continue
+
+            hand[drawn] += 1
+            wall[drawn] -= 1
+            best = 0.0
+            for discard, discard_shanten in self._discard_entry(hand):
+                if discard_shanten > reachable:
+                    continue
+                hand[discard] -= 1
+                best = max(best, self._value(hand, wall, total - 1, draws - 1))
+                hand[discard] += 1
+                if best == 1.0:
+                    break
+            hand[drawn] -= 1
+            wall[drawn] += 1
+            weighted += count * best
+
+        value = weighted / total
+        self.table[key] = value
+        return value
+
+    def _locked_probability(self, hand: Sequence[int], wall: Sequence[int], total: int, draws: int) -> float:
+        """手牌を変えずにツモ切りを続けた場合の和了確率
+
+        残りツモ回数のうちに和了牌を1枚でも引く確率（超幾何分布）です。
+        """
+        draws = min(draws, total)
+        _, draw_table = self._draw_entry(hand)
+        outs = sum(wall[tile_id] for tile_id in range(SUIT_SIZE) if draw_table[tile_id] == -1)
+        if draws <= 0 or not outs:
+            return 0.0
+        return 1.0 - comb(total - outs, draws) / comb(total, draws)
+
+    def _draw_entry(self, hand: Sequence[int]) -> Tuple[int, List[int]]:
+        """ツモ前の手牌の向聴数とツモ後の向聴数表を取得（キャッシュ付き）"""
+        key = bytes(hand)
+        entry = self._draw_cache.get(key)
+        if entry is None:
+            calculator = self.shanten_calculator
+            size = sum(hand)
+            kan_count = kan_count_for_size(size)
+            shanten = calculator.calculate_shanten(Hand.from_counts(hand), kan_count)
+            draw_table = calculator.draw_shanten_from_counts(hand, size, kan_count=kan_count)
+            entry = (shanten, [draw_table[tile_id] for tile_id in range(SUIT_SIZE)])
+            self._draw_cache[key] = entry
+        return entry
+
+    def _discard_entry(self, hand: Sequence[int]) -> List[Tuple[int, int]]:
+        """ツモ後の手牌の (打牌するtile_id, 打牌後の向聴数) のリストを取得（キャッシュ付き）"""
+        key = bytes(hand)
+        entry = self._discard_cache.get(key)
+        if entry is None:
+            drawn_hand = Hand.from_counts(hand)
+            discard_table = self.shanten_calculator.shanten_after_each_discard(
+                drawn_hand, kan_count_for_size(drawn_hand.size)
+            )
+            entry = sorted(discard_table.items())
+            self._discard_cache[key] = entry
+        return entry
+
+    def _is_winning(self, hand: Sequence[int]) -> bool:
+        """打牌前の手牌が和了形かどうか"""
+        drawn_hand = Hand.from_counts(hand)
+        return self.shanten_calculator.calculate_shanten(drawn_hand, kan_count_for_size(drawn_hand.size)) == -1
+
+    @staticmethod
+    def _canonical_key(hand: Sequence[int], wall: Sequence[int], draws: int) -> bytes:
+        """局面の正規化キー（索子の並びの反転の小さい方）"""
+        key = bytes(hand) + bytes(wall) + bytes((draws,))
+        mirrored = bytes(hand[::-1]) + bytes(wall[::-1]) + bytes((draws,))
+        return min(key, mirrored)
@@ -1,5 +1,5 @@
 """ユーティリティモジュール"""
 
-from .logger import get_logger, log_action, log_error, log_game_state, log_ui_action
+from .logger import configure_logging, enable_async_logging, get_game_logger, get_logger, log_action, log_error, log_game_state, log_ui_action, set_performance_mode
 
-__all__ = ['get_logger', 'log_action', 'log_error', 'log_game_state', 'log_ui_action']
\ No newline at end of file
+__all__ = ['configure_logging', 'enable_async_logging', 'get_game_logger', 'get_logger', 'log_action', 'log_error', 'log_game_state', 'log_ui_action', 'set_performance_mode']
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""非同期ログ出力モジュール - キュー経由でファイルへまとめて書き込む"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Optional, Union
+
+# キューが満杯の時の方針
+OVERFLOW_DROP = "drop"  # 新しいレコードを捨てる（ERROR以上は待つ）
+OVERFLOW_BLOCK = "block"  # 空きができるまで待つ
+
+# キューの最大レコード数の既定値
+DEFAULT_MAX_QUEUE_SIZE = 10000
+
+# まとめて書き込むレコード数の既定値
+DEFAULT_BATCH_SIZE = 256
+
+
+class BatchingFileHandler(logging.FileHandler):
+    """複数レコードをまとめてからフラッシュするファイルハンドラー
+
+    logging.FileHandler はレコードごとにフラッシュしますが、このハンドラーは
+    batch_size件ごと、または flush() の呼び出し時にだけフラッシュします。
+    """
+
+    def __init__(self, filename: Union[str, Path], batch_size: int = DEFAULT_BATCH_SIZE, encoding: str = "utf-8") -> None:
+        """ハンドラーを初期化
+
+        Args:
+            filename: 書き込むログファイル（追記）
+            batch_size: フラッシュするまでに溜めるレコード数
+            encoding: ファイルの文字コード
+        """
+        super().__init__(filename, encoding=encoding)
+        self.batch_size = batch_size
+        self._pending = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """レコードを書き込み、溜まった件数がbatch_sizeに達したらフラッシュ
+
+        Args:
+            record: 書き込むログレコード
+        """
+        try:
+            message = self.format(record)
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(message + self.terminator)
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """溜まっているレコードをファイルに書き出す"""
+        super().flush()
+        self._pending = 0
+
+
+class BoundedQueueHandler(QueueHandler):
+    """上限付きキューにレコードを積むハンドラー
+
+    呼び出し側のスレッドではメッセージ本文の確定だけを行い、日時などの整形や
+    例外のトレースバック整形は出力側のスレッドに任せます。
+
+    Attributes:
+        overflow: キューが満杯の時の方針（OVERFLOW_DROP / OVERFLOW_BLOCK）
+        dropped: 捨てたレコード数
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]", overflow: str = OVERFLOW_DROP) -> None:
+        """ハンドラーを初期化
+
+        Args:
+            log_queue: レコードを積むキュー
+            overflow: キューが満杯の時の方針
+
+        Raises:
+            ValueError: 未知の方針の場合
+        """
+        if overflow not in (OVERFLOW_DROP, OVERFLOW_BLOCK):
+            raise ValueError(f"未知のキュー満杯時の方針です: {overflow}")
+
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """キューに積むレコードを用意
+
+        引数の遅延評価（ゲーム状態など）は記録時点の値にする必要があるため、
+        メッセージ本文だけはここで確定します。確定後も getMessage() の結果は
+        変わらないので、複製せずにレコードをそのまま書き換えます。
+
+        Args:
+            record: 元のログレコード
+
+        Returns:
+            メッセージ本文を確定したレコード
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """方針に従ってレコードをキューに積む
+
+        Args:
+            record: 積むログレコード
+        """
+        if self.overflow == OVERFLOW_BLOCK or record.levelno >= logging.ERROR:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BatchingQueueListener(QueueListener):
+    """キューが空になった時点でハンドラーをフラッシュするリスナー
+
+    負荷が高い間はレコードがまとめて書き込まれ、キューが空になれば
+    すぐにファイルへ反映されます。
+    """
+
+    def enqueue_sentinel(self) -> None:
+        """停止用の番兵を積む（キューが満杯でも空きを待って確実に積む）"""
+        self.queue.put(self._sentinel)
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """キューからレコードを取り出す（空ならフラッシュしてから待つ）
+
+        Args:
+            block: 空の場合に待つかどうか
+
+        Returns:
+            取り出したログレコード
+        """
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+
+class AsyncLogBackend:
+    """QueueHandler/QueueListenerによる非同期ファイル出力
+
+    ロガーには queue_handler を追加します。レコードは上限付きキューを経由して
+    出力用スレッドの BatchingFileHandler に渡されます。
+
+    Attributes:
+        queue_handler: ロガーに追加するハンドラー
+        file_handler: 出力用スレッドで書き込むハンドラー
+        listener: 出力用スレッド
+    """
+
+    def __init__(
+        self,
+        log_file: Union[str, Path],
+        formatter: Optional[logging.Formatter] = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow: str = OVERFLOW_DROP,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        level: int = logging.DEBUG,
+    ) -> None:
+        """非同期出力を構築（start()で開始）
+
+        Args:
+            log_file: 書き込むログファイル（追記）
+            formatter: ファイル出力のフォーマッター
+            max_queue_size: キューの最大レコード数
+            overflow: キューが満杯の時の方針
+            batch_size: フラッシュするまでに溜めるレコード数
+            level: ファイルに書き込む最低レベル
+        """
+        self.queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=max_queue_size)
+
+        self.file_handler = BatchingFileHandler(log_file, batch_size=batch_size)
+        self.file_handler.setLevel(level)
+        if formatter is not None:
+            self.file_handler.setFormatter(formatter)
+
+        self.queue_handler = BoundedQueueHandler(self.queue, overflow)
+        self.queue_handler.setLevel(level)
+        self.listener = BatchingQueueListener(self.queue, self.file_handler, respect_handler_level=True)
+        self._running = False
+
+    @property
+    def dropped(self) -> int:
+        """キューが満杯で捨てたレコード数"""
+        return self.queue_handler.dropped
+
+    @property
+    def running(self) -> bool:
+        """出力用スレッドが動作中かどうか"""
+        return self._running
+
+    def start(self) -> None:
+        """出力用スレッドを開始"""
+        if not self._running:
+            self.listener.start()
+            self._running = True
+
+    def flush(self) -> None:
+        """キューに積まれたレコードを全て書き出すまで待つ"""
+        if not self._running:
+            return
+        # 出力用スレッドを止めて再開すると、停止前のレコードは全て処理済みになる
+        self.listener.stop()
+        self.file_handler.flush()
+        self.listener.start()
+
+    def stop(self) -> None:
+        """残りのレコードを書き出して出力用スレッドを停止（プロセス終了時にも呼ばれる）"""
+        if not self._running:
+            return
+        self.listener.stop()
+        self._running = False
+
+        if self.dropped:
+            record = logging.LogRecord(
+                "MahjongGame", logging.WARNING, __file__, 0, "キュー満杯のため%d件のログを破棄しました", (self.dropped,), None
+            )
+            self.file_handler.handle(record)
+        self.file_handler.close()
@@ -1,10 +1,94 @@
-"""ログ設定モジュール - デバッグ用ログシステム"""
+"""ログ設定モジュール - デバッグ用ログシステム
 
+ロガー（ログディレクトリの作成・ログファイルのオープン）は最初に使用された時点で
+生成されます。モジュールのimportだけではファイルシステムに触れません。
+"""
+
+import atexit
 import datetime
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, Union
+
+from .async_logging import DEFAULT_BATCH_SIZE, DEFAULT_MAX_QUEUE_SIZE, OVERFLOW_DROP, AsyncLogBackend
+
+
+# 性能モードを有効にする環境変数（"1"などの空でない値で有効）
+PERFORMANCE_MODE_ENV = "MAHJONG_AI_PERFORMANCE_MODE"
+
+# ログファイルの出力先ディレクトリを指定する環境変数
+LOG_DIR_ENV = "MAHJONG_AI_LOG_DIR"
+
+# ログファイルへの出力を無効にする環境変数（"1"などの空でない値で無効）
+LOG_DISABLED_ENV = "MAHJONG_AI_LOG_DISABLED"
+
+# 既定のログファイルの出力先ディレクトリ
+DEFAULT_LOG_DIR = Path("logs")
+
+
+class GameStateSnapshot:
+    """ゲーム状態ログのメッセージ
+
+    ログレコードの引数として渡し、ハンドラーが文字列化する時に初めて
+    エンジンの状態を収集して整形します。複数のハンドラーが文字列化しても
+    収集は1回だけです。
+    """
+
+    __slots__ = ("engine", "_text")
+
+    def __init__(self, engine) -> None:
+        """状態を記録するエンジンを保持
+
+        Args:
+            engine: 状態を記録するGameEngine
+        """
+        self.engine = engine
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        """ゲーム状態の詳細を複数行の文字列に整形"""
+        if self._text is not None:
+            return self._text
+
+        engine = self.engine
+        lines = [
+            "=" * 50,
+            "ゲーム状態詳細:",
+            f"  状態: {engine.game_state}",
+            f"  ターン数: {engine.turn_count}",
+            f"  リーチフラグ: {engine.is_riichi}",
+            f"  手牌枚数: {engine.current_hand.size}",
+            f"  手牌内容: {engine.current_hand}",
+            f"  山牌残り: {engine.wall.remaining_count}",
+            f"  捨て牌: {[str(t) for t in engine.discarded_tiles]}",
+            f"  向聴数: {engine.calculate_shanten()}",
+            f"  can_draw(): {engine.can_draw()}",
+            f"  can_discard(): {engine.can_discard()}",
+            f"  can_riichi(): {engine.can_riichi()}",
+            "=" * 50,
+        ]
+        self._text = "\n".join(lines)
+        return self._text
+
+
+def _resolve_log_config(
+    log_dir: Optional[Union[str, Path]], file_output: Optional[bool]
+) -> Tuple[Path, bool]:
+    """未指定のログ設定を環境変数・既定値で補う
+
+    Args:
+        log_dir: ログファイルの出力先
+        file_output: ログファイルに出力するかどうか
+
+    Returns:
+        (ログファイルの出力先, ログファイルに出力するかどうか) のタプル
+    """
+    if log_dir is None:
+        log_dir = os.environ.get(LOG_DIR_ENV) or DEFAULT_LOG_DIR
+    if file_output is None:
+        file_output = os.environ.get(LOG_DISABLED_ENV, "") in ("", "0")
+    return Path(log_dir), file_output
 
 
 class GameLogger:
@@ -12,25 +96,25 @@ class GameLogger:
     
     _instance: Optional['GameLogger'] = None
     
-    def __new__(cls) -> 'GameLogger':
+    def __new__(cls, *args, **kwargs) -> 'GameLogger':
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
     
-    def __init__(self) -> None:
-        """ログ設定を初期化"""
+    def __init__(self, log_dir: Optional[Union[str, Path]] = None, file_output: Optional[bool] = None) -> None:
+        """ログ設定を初期化
+
+        Args:
+            log_dir: ログファイルの出力先（Noneの場合は環境変数 MAHJONG_AI_LOG_DIR、未設定なら logs）
+            file_output: ログファイルに出力するかどうか（Noneの場合は環境変数 MAHJONG_AI_LOG_DISABLED で判定）
+        """
         if hasattr(self, '_initialized'):
             return
         
         self._initialized = True
         
-        # ログディレクトリの作成
-        self.log_dir = Path("logs")
-        self.log_dir.mkdir(exist_ok=True)
-        
-        # タイムスタンプベースのファイル名
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.log_file = self.log_dir / f"mahjong_game_{timestamp}.log"
+        # 性能モード（状態ログ・アクションログを出力しない）
+        self.performance_mode = os.environ.get(PERFORMANCE_MODE_ENV, "") not in ("", "0")
         
         # ロガーの設定
         self.logger = logging.getLogger("MahjongGame")
@@ -39,97 +123,309 @@ class GameLogger:
         # 既存のハンドラーをクリア
         self.logger.handlers.clear()
         
-        # ファイルハンドラーの設定
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
+        # フォーマッターの設定
+        self.formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+        )
+        
+        # ファイルハンドラーはconfigure()で設定（enable_async()で非同期出力に切り替え可能）
+        self.log_dir: Optional[Path] = None
+        self.log_file: Optional[Path] = None
+        self.file_handler: Optional[logging.Handler] = None
+        self.async_backend: Optional[AsyncLogBackend] = None
         
         # コンソールハンドラーの設定
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.WARNING)
+        console_handler.setFormatter(self.formatter)
+        self.logger.addHandler(console_handler)
         
-        # フォーマッターの設定
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-        )
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        self.configure(log_dir, file_output)
+    
+    def configure(self, log_dir: Optional[Union[str, Path]] = None, file_output: Optional[bool] = None) -> None:
+        """ログファイルの出力先を設定
+
+        非同期出力中の場合は同期書き込みに戻してから切り替えます。
+        ファイル出力を有効にすると、ログディレクトリを作成して新しいログファイルを開きます。
+
+        Args:
+            log_dir: ログファイルの出力先（Noneの場合は環境変数 MAHJONG_AI_LOG_DIR、未設定なら logs）
+            file_output: ログファイルに出力するかどうか（Noneの場合は環境変数 MAHJONG_AI_LOG_DISABLED で判定）
+        """
+        self.disable_async()
+        if self.file_handler is not None:
+            self.logger.removeHandler(self.file_handler)
+            self.file_handler.close()
+            self.file_handler = None
         
-        # ハンドラーを追加
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        log_dir, file_output = _resolve_log_config(log_dir, file_output)
+        self.log_dir = log_dir
+        if not file_output:
+            self.log_file = None
+            return
+        
+        # ログディレクトリの作成
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        
+        # タイムスタンプベースのファイル名
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.log_file = self.log_dir / f"mahjong_game_{timestamp}.log"
         
-        self.logger.info(f"ログシステム初期化完了: {self.log_file}")
+        self.file_handler = self._create_file_handler()
+        self.logger.addHandler(self.file_handler)
+        
+        self.logger.info("ログシステム初期化完了: %s", self.log_file)
     
     def get_logger(self) -> logging.Logger:
         """ロガーインスタンスを取得"""
         return self.logger
     
-    def log_game_state(self, engine) -> None:
-        """ゲーム状態の詳細ログ"""
-        logger = self.get_logger()
-        logger.info("=" * 50)
-        logger.info("ゲーム状態詳細:")
-        logger.info(f"  状態: {engine.game_state}")
-        logger.info(f"  ターン数: {engine.turn_count}")
-        logger.info(f"  リーチフラグ: {engine.is_riichi}")
-        logger.info(f"  手牌枚数: {engine.current_hand.size}")
-        logger.info(f"  手牌内容: {engine.current_hand}")
-        logger.info(f"  山牌残り: {engine.wall.remaining_count}")
-        logger.info(f"  捨て牌: {[str(t) for t in engine.discarded_tiles]}")
-        logger.info(f"  向聴数: {engine.calculate_shanten()}")
-        logger.info(f"  can_draw(): {engine.can_draw()}")
-        logger.info(f"  can_discard(): {engine.can_discard()}")
-        logger.info(f"  can_riichi(): {engine.can_riichi()}")
-        logger.info("=" * 50)
-    
-    def log_action(self, action: str, details: str = "") -> None:
-        """アクション実行ログ"""
+    def _create_file_handler(self) -> logging.Handler:
+        """同期書き込みのファイルハンドラーを作成"""
+        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(self.formatter)
+        return file_handler
+    
+    def enable_async(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow: str = OVERFLOW_DROP,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> AsyncLogBackend:
+        """ファイル出力を非同期（キュー経由のまとめ書き）に切り替え
+
+        同じログファイルへの追記を出力用スレッドで行い、ゲーム側のスレッドは
+        キューに積むだけになります。残りのレコードはプロセス終了時に書き出されます。
+
+        Args:
+            max_queue_size: キューの最大レコード数
+            overflow: キューが満杯の時の方針（"drop": 捨てる、"block": 待つ）
+            batch_size: フラッシュするまでに溜めるレコード数
+
+        Returns:
+            開始した非同期出力
+
+        Raises:
+            ValueError: ログファイルへの出力が無効な場合
+        """
+        if self.log_file is None:
+            raise ValueError("ログファイルへの出力が無効です")
+        
+        self.disable_async()
+        
+        if self.file_handler is not None:
+            self.logger.removeHandler(self.file_handler)
+            self.file_handler.close()
+            self.file_handler = None
+        
+        backend = AsyncLogBackend(
+            self.log_file,
+            formatter=self.formatter,
+            max_queue_size=max_queue_size,
+            overflow=overflow,
+            batch_size=batch_size,
+        )
+        backend.start()
+        atexit.register(backend.stop)
+        
+        self.async_backend = backend
+        self.logger.addHandler(backend.queue_handler)
+        return backend
+    
+    def disable_async(self) -> None:
+        """非同期出力を停止し、同期書き込みのファイル出力に戻す"""
+        backend = self.async_backend
+        if backend is None:
+            return
+        
+        self.logger.removeHandler(backend.queue_handler)
+        backend.stop()
+        atexit.unregister(backend.stop)
+        self.async_backend = None
+        
+        if self.log_file is None:
+            return
+        self.file_handler = self._create_file_handler()
+        self.logger.addHandler(self.file_handler)
+    
+    def flush(self) -> None:
+        """未書き込みのログを全てファイルに書き出す"""
+        if self.async_backend is not None:
+            self.async_backend.flush()
+        elif self.file_handler is not None:
+            self.file_handler.flush()
+    
+    def set_performance_mode(self, enabled: bool) -> None:
+        """性能モードを設定
+
+        性能モード中は状態ログ・アクションログを一切出力しません（エラーログは出力します）。
+
+        Args:
+            enabled: 性能モードにするかどうか
+        """
+        self.performance_mode = enabled
+    
+    def set_level(self, level: int) -> None:
+        """ロガーの出力レベルを設定
+
+        Args:
+            level: ログレベル（logging.INFOなど）
+        """
+        self.logger.setLevel(level)
+    
+    def is_state_logging_enabled(self, level: int = logging.INFO) -> bool:
+        """状態ログを出力するかどうかを判定
+
+        ロガー自体のレベルは常にDEBUGのため、レコードを受け付けるハンドラーが
+        あるかどうか（親ロガーへの伝播を含む）も確認します。ファイル出力が無効で
+        コンソール（WARNING）だけの場合、INFOの状態ログは出力しません。
+
+        Args:
+            level: 出力するログレベル
+
+        Returns:
+            性能モードでなく、ロガーとハンドラーのいずれかがlevelを出力する設定の場合True
+        """
+        if self.performance_mode or not self.logger.isEnabledFor(level):
+            return False
+        logger: Optional[logging.Logger] = self.logger
+        while logger is not None:
+            if any(level >= handler.level for handler in logger.handlers):
+                return True
+            if not logger.propagate:
+                break
+            logger = logger.parent
+        return False
+    
+    def log_game_state(self, engine, level: int = logging.INFO) -> None:
+        """ゲーム状態の詳細ログ
+
+        性能モード中、またはロガーがlevelを出力しない設定の場合は何もしません。
+        状態の収集（向聴数・リーチ可否の計算など）はログを出力する場合のみ行い、
+        メッセージの組み立てはハンドラーが出力する時点まで遅延します。
+
+        Args:
+            engine: 状態を記録するGameEngine
+            level: 出力するログレベル
+        """
+        if not self.is_state_logging_enabled(level):
+            return
+        self.logger.log(level, "%s", GameStateSnapshot(engine))
+    
+    def log_action(self, action: str, details: str = "", *args: object) -> None:
+        """アクション実行ログ
+
+        Args:
+            action: アクション名
+            details: 詳細（argsを指定した場合は %-形式の書式）
+            *args: detailsの書式に埋め込む値（出力する場合のみ文字列化されます）
+        """
+        if not self.is_state_logging_enabled():
+            return
         logger = self.get_logger()
-        logger.info(f"アクション実行: {action}")
+        logger.info("アクション実行: %s", action)
         if details:
-            logger.info(f"  詳細: {details}")
+            if args:
+                logger.info("  詳細: " + details, *args)
+            else:
+                logger.info("  詳細: %s", details)
     
     def log_error(self, error: Exception, context: str = "") -> None:
         """エラーログ"""
         logger = self.get_logger()
-        logger.error(f"エラー発生: {error}")
+        logger.error("エラー発生: %s", error)
         if context:
-            logger.error(f"  コンテキスト: {context}")
-        logger.error(f"  エラー型: {type(error).__name__}")
-        import traceback
-        logger.error(f"  スタックトレース:\n{traceback.format_exc()}")
+            logger.error("  コンテキスト: %s", context)
+        logger.error("  エラー型: %s", type(error).__name__)
+        # トレースバックの整形はハンドラーに任せる（非同期出力時は出力用スレッドで整形）
+        logger.error("  スタックトレース:", exc_info=(type(error), error, error.__traceback__))
     
     def log_ui_action(self, menu_type: str, choice: int, available_choices: int) -> None:
         """UI操作ログ"""
         logger = self.get_logger()
-        logger.info(f"UI操作: {menu_type}")
-        logger.info(f"  選択: {choice}/{available_choices}")
+        logger.info("UI操作: %s", menu_type)
+        logger.info("  選択: %s/%s", choice, available_choices)
+
+
+# プロセス内で共有するインスタンス（get_game_logger()の初回呼び出しで生成）
+_game_logger: Optional[GameLogger] = None
+
+# 生成前に configure_logging() で指定されたログ設定
+_log_config: Tuple[Optional[Union[str, Path]], Optional[bool]] = (None, None)
 
 
-# グローバルインスタンス
-game_logger = GameLogger()
+def get_game_logger() -> GameLogger:
+    """プロセス内で共有するGameLoggerを取得（初回呼び出し時に生成）"""
+    global _game_logger
+    if _game_logger is None:
+        _game_logger = GameLogger(*_log_config)
+    return _game_logger
+
+
+def configure_logging(log_dir: Optional[Union[str, Path]] = None, file_output: Optional[bool] = None) -> None:
+    """ログファイルの出力先を設定
+
+    ロガーの生成前に呼び出すと、初回使用時にこの設定で生成します。
+    プロセスプールのワーカーで file_output=False を指定すれば、ワーカーごとの
+    ログファイルは作成されません。生成後に呼び出した場合は出力先を切り替えます。
+
+    Args:
+        log_dir: ログファイルの出力先（Noneの場合は環境変数 MAHJONG_AI_LOG_DIR、未設定なら logs）
+        file_output: ログファイルに出力するかどうか（Noneの場合は環境変数 MAHJONG_AI_LOG_DISABLED で判定）
+    """
+    global _log_config
+    _log_config = (log_dir, file_output)
+    if _game_logger is not None:
+        _game_logger.configure(log_dir, file_output)
+
+
+def __getattr__(name: str):
+    """game_logger は参照された時点で生成する（従来のグローバルインスタンスとの互換用）"""
+    if name == "game_logger":
+        return get_game_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_logger() -> logging.Logger:
     """ゲームロガーを取得（簡易アクセス用）"""
-    return game_logger.get_logger()
+    return get_game_logger().get_logger()
 
 
-def log_game_state(engine) -> None:
+def log_game_state(engine, level: int = logging.INFO) -> None:
     """ゲーム状態ログ（簡易アクセス用）"""
-    game_logger.log_game_state(engine)
+    get_game_logger().log_game_state(engine, level)
+
+
+def is_state_logging_enabled(level: int = logging.INFO) -> bool:
+    """状態ログを出力するかどうか（簡易アクセス用）"""
+    return get_game_logger().is_state_logging_enabled(level)
+
+
+def set_performance_mode(enabled: bool) -> None:
+    """性能モードの設定（簡易アクセス用）"""
+    get_game_logger().set_performance_mode(enabled)
+
+
+def enable_async_logging(
+    max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+    overflow: str = OVERFLOW_DROP,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncLogBackend:
+    """ファイル出力の非同期化（簡易アクセス用）"""
+    return get_game_logger().enable_async(max_queue_size, overflow, batch_size)
 
 
-def log_action(action: str, details: str = "") -> None:
+def log_action(action: str, details: str = "", *args: object) -> None:
     """アクションログ（簡易アクセス用）"""
-    game_logger.log_action(action, details)
+    get_game_logger().log_action(action, details, *args)
 
 
 def log_error(error: Exception, context: str = "") -> None:
     """エラーログ（簡易アクセス用）"""
-    game_logger.log_error(error, context)
+    get_game_logger().log_error(error, context)
 
 
 def log_ui_action(menu_type: str, choice: int, available_choices: int) -> None:
     """UI操作ログ（簡易アクセス用）"""
-    game_logger.log_ui_action(menu_type, choice, available_choices)
\ No newline at end of file
+    get_game_logger().log_ui_action(menu_type, choice, available_choices)
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""テスト共通のフィクスチャ"""
+
+import random
+from typing import Callable, List, Sequence
+
+import pytest
+
+from mahjong_ai.game.game_engine import GameEngine, GameState
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import TILES_PER_KIND, Tile
+from mahjong_ai.utils.logger import configure_logging
+
+# テスト実行ではログファイルを作成しない（ファイル出力のテストは個別に出力先を指定する）
+configure_logging(file_output=False)
+
+
+@pytest.fixture
+def make_hand() -> Callable[[Sequence[int]], Hand]:
+    """索子の数字のリストから手牌を作成する関数"""
+
+    def build(values: Sequence[int]) -> Hand:
+        return Hand([Tile(suit="sou", value=value) for value in values])
+
+    return build
+
+
+@pytest.fixture
+def random_counts() -> Callable[..., List[int]]:
+    """各種類copies枚の山から無作為にsize枚選んだ索子の枚数ベクトルを作成する関数"""
+
+    def build(rng: random.Random, size: int, copies: int = TILES_PER_KIND) -> List[int]:
+        pool = [tile_id for tile_id in range(9) for _ in range(copies)]
+        counts = [0] * 9
+        for tile_id in rng.sample(pool, size):
+            counts[tile_id] += 1
+        return counts
+
+    return build
+
+
+@pytest.fixture
+def ankan_engine(make_hand) -> GameEngine:
+    """1索を暗槓し、嶺上牌の5索をツモした後のゲームエンジン
+
+    手牌は 2-3-4, 5-5-6-7, 8-8, 9-9 の11枚で、5索を打牌すると8索・9索待ちの聴牌。
+    山牌には和了牌の8索・9索が2枚ずつだけ残っています。
+    """
+    engine = GameEngine()
+    engine.current_hand = make_hand([1, 1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 8, 9, 9])
+    engine.game_state = GameState.AFTER_DRAW
+    engine.wall.load(bytes([4, 4, 4, 4, 7, 7, 8, 8]), rinshan_count=4)
+    engine.execute_kan(Tile(suit="sou", value=1))
+    return engine
@@ -0,0 +1,158 @@
+"""モンテカルロ打牌評価（DiscardAdvisor）のテスト"""
+
+import contextlib
+import io
+import random
+
+import pytest
+
+from mahjong_ai.game.game_engine import GameEngine, GameState
+from mahjong_ai.game.wall_tiles import WallTiles
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import Tile
+from mahjong_ai.sim.advisor import DiscardAdvisor, DiscardEstimate, RolloutEvaluator
+
+# 1-2-3, 4-5-6, 7-8-9, 1-1 + 2-3 の聴牌形に浮き牌9索（9索を打牌すると1-4索待ち）
+TENPAI_COUNTS = [3, 2, 2, 1, 1, 1, 1, 1, 2]
+
+
+def counts_of(values):
+    """数字のリストから索子の枚数ベクトルを作成"""
+    counts = [0] * 9
+    for value in values:
+        counts[value - 1] += 1
+    return counts
+
+
+class TestDiscardAdvisor:
+    """モンテカルロ打牌評価のテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の準備"""
+        self.advisor = DiscardAdvisor(rollouts=200, batch_size=50, seed=1)
+
+    def test_certain_win(self) -> None:
+        """山牌が和了牌だけの場合は和了率1になることのテスト"""
+        wall_counts = counts_of([1, 4])
+        estimates = self.advisor.evaluate_counts(TENPAI_COUNTS, [8], wall_counts, 1)
+
+        estimate = estimates[Tile(suit="sou", value=9)]
+        assert estimate.win_rate == 1.0
+        assert estimate.rollouts == 200
+
+    def test_no_draws_left(self) -> None:
+        """ツモが残っていない場合は和了率0になることのテスト"""
+        estimates = self.advisor.evaluate_counts(TENPAI_COUNTS, [0, 8], counts_of([1, 4, 7]), 0)
+
+        assert all(estimate.win_rate == 0.0 for estimate in estimates.values())
+
+    def test_better_discard_ranks_higher(self) -> None:
+        """聴牌を崩す打牌より聴牌を保つ打牌の和了率が高いことのテスト"""
+        wall_counts = counts_of([1, 4, 6, 6, 7])
+        estimates = self.advisor.evaluate_counts(TENPAI_COUNTS, [4, 8], wall_counts, 2)
+
+        keep = estimates[Tile(suit="sou", value=9)]
+        broken = estimates[Tile(suit="sou", value=5)]
+        assert keep.win_rate > broken.win_rate
+
+    def test_reproducible_with_seed(self) -> None:
+        """同じシードでは同じ推定値になることのテスト"""
+        wall_counts = counts_of([1, 2, 3, 4, 5, 6, 7, 8, 9] * 2)
+        first = DiscardAdvisor(rollouts=100, batch_size=30, seed=5).evaluate_counts(TENPAI_COUNTS, [0, 8], wall_counts, 6)
+        second = DiscardAdvisor(rollouts=100, batch_size=30, seed=5).evaluate_counts(TENPAI_COUNTS, [0, 8], wall_counts, 6)
+
+        assert first == second
+
+    def test_identical_regardless_of_workers(self) -> None:
+        """ワーカー数に関わらず推定値が一致することのテスト"""
+        wall_counts = counts_of([1, 2, 3, 4, 5, 6, 7, 8, 9] * 2)
+        single = DiscardAdvisor(rollouts=100, batch_size=25, seed=9).evaluate_counts(TENPAI_COUNTS, [0, 8], wall_counts, 6)
+        with DiscardAdvisor(rollouts=100, batch_size=25, workers=2, seed=9) as pooled_advisor:
+            pooled = pooled_advisor.evaluate_counts(TENPAI_COUNTS, [0, 8], wall_counts, 6)
+
+        assert single == pooled
+
+    def test_time_budget(self) -> None:
+        """持ち時間を使い切ると試行を打ち切ることのテスト"""
+        advisor = DiscardAdvisor(rollouts=100000, batch_size=10, time_budget=0.0, seed=1)
+        estimates = advisor.evaluate_counts(TENPAI_COUNTS, [8], counts_of([1, 2, 3, 4, 5, 6]), 6)
+
+        # 最低1バッチは実行する
+        assert estimates[Tile(suit="sou", value=9)].rollouts == 10
+
+    def test_evaluate_engine(self) -> None:
+        """ゲームエンジンの手牌の種類ごとに推定値を返すことのテスト"""
+        engine = GameEngine()
+        engine.wall = WallTiles(seed=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.start_game()
+            engine.draw_tile()
+
+        estimates = self.advisor.evaluate(engine)
+
+        assert list(estimates) == engine.current_hand.get_unique_tiles()
+        assert self.advisor.best_discard(engine) in estimates
+
+    def test_evaluate_riichi_only_tsumogiri(self) -> None:
+        """リーチ中はツモ切りだけを評価することのテスト"""
+        engine = GameEngine()
+        engine.current_hand = Hand([Tile(suit="sou", value=value) for value in [1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9, 5]])
+        engine.game_state = GameState.RIICHI
+        engine.is_riichi = True
+        engine.last_drawn_tile = Tile(suit="sou", value=5)
+
+        estimates = self.advisor.evaluate(engine)
+
+        assert list(estimates) == [Tile(suit="sou", value=5)]
+
+    def test_evaluate_after_ankan(self, ankan_engine) -> None:
+        """暗槓後の11枚の手牌でも聴牌を保つ打牌で和了できることのテスト"""
+        estimates = self.advisor.evaluate(ankan_engine)
+
+        assert ankan_engine.current_hand.size == 11
+        assert estimates[Tile(suit="sou", value=5)].win_rate == 1.0
+        assert estimates[Tile(suit="sou", value=3)].win_rate == 0.0
+
+    def test_evaluate_requires_drawn_hand(self) -> None:
+        """ツモ前の手牌はエラーになることのテスト"""
+        engine = GameEngine()
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.start_game()
+
+        with pytest.raises(ValueError):
+            self.advisor.evaluate(engine)
+
+    def test_invalid_arguments(self) -> None:
+        """不正な引数のエラーテスト"""
+        with pytest.raises(ValueError):
+            DiscardAdvisor(rollouts=0)
+
+    def test_vectorized_matches_scalar(self) -> None:
+        """NumPyでまとめて進めた試行と1つずつ進めた試行の和了数が一致することのテスト"""
+        pytest.importorskip("numpy")
+        evaluator = RolloutEvaluator()
+        rng = random.Random(4)
+        population = [tile_id for tile_id in range(9) for _ in range(3)]
+        starts = []
+        for tile_id in (0, 4, 8):
+            counts = list(TENPAI_COUNTS)
+            counts[tile_id] -= 1
+            starts.append(counts)
+        sequences = [rng.sample(population, 10) for _ in range(200)]
+
+        assert evaluator._count_wins_vectorized(starts, sequences) == evaluator._count_wins(starts, sequences)
+
+    def test_caches_are_bounded(self) -> None:
+        """評価器のキャッシュが最大エントリ数を超えないことのテスト"""
+        evaluator = RolloutEvaluator(cache_size=4)
+        evaluator.run_batch(TENPAI_COUNTS, [0, 4, 8], counts_of([1, 2, 3, 4, 5, 6, 7, 8, 9] * 2), 8, 50, random.Random(2))
+
+        assert len(evaluator._draw_cache) <= 4
+        assert len(evaluator._discard_cache) <= 4
+
+    def test_estimate_stderr(self) -> None:
+        """標準誤差の計算テスト"""
+        estimate = DiscardEstimate(Tile(suit="sou", value=1), wins=50, rollouts=100)
+
+        assert estimate.win_rate == 0.5
+        assert estimate.stderr == pytest.approx(0.05)
@@ -0,0 +1,192 @@
+"""非同期ログ出力（AsyncLogBackend）のテスト"""
+
+import logging
+import queue
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from mahjong_ai.utils.async_logging import (
+    OVERFLOW_BLOCK,
+    OVERFLOW_DROP,
+    AsyncLogBackend,
+    BatchingFileHandler,
+    BoundedQueueHandler,
+)
+from mahjong_ai.utils.logger import configure_logging, game_logger
+
+
+def make_record(message: str, level: int = logging.INFO, args: tuple = ()) -> logging.LogRecord:
+    """テスト用のログレコードを作成"""
+    return logging.LogRecord("test", level, __file__, 0, message, args, None)
+
+
+class TestBoundedQueueHandler:
+    """上限付きキューハンドラーのテスト"""
+
+    def test_drop_when_full(self) -> None:
+        """満杯時に捨てたレコード数を数えることのテスト"""
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue, OVERFLOW_DROP)
+
+        for i in range(5):
+            handler.handle(make_record(f"message {i}"))
+
+        assert log_queue.qsize() == 2
+        assert handler.dropped == 3
+
+    def test_error_records_are_not_dropped(self) -> None:
+        """ERROR以上のレコードは捨てずに待つことのテスト"""
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=1)
+        handler = BoundedQueueHandler(log_queue, OVERFLOW_DROP)
+        handler.handle(make_record("info"))
+
+        # 空きを作ってからERRORを積む
+        log_queue.get_nowait()
+        handler.handle(make_record("error", logging.ERROR))
+
+        assert handler.dropped == 0
+        assert log_queue.get_nowait().msg == "error"
+
+    def test_message_is_rendered_on_enqueue(self) -> None:
+        """引数は積んだ時点の値でメッセージに確定することのテスト"""
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        handler = BoundedQueueHandler(log_queue)
+        state = ["before"]
+
+        class Lazy:
+            def __str__(self) -> str:
+                return state[0]
+
+        handler.handle(make_record("state: %s", args=(Lazy(),)))
+        state[0] = "after"
+
+        record = log_queue.get_nowait()
+        assert record.getMessage() == "state: before"
+        assert record.args is None
+
+    def test_unknown_overflow(self) -> None:
+        """未知の方針はエラーになることのテスト"""
+        with pytest.raises(ValueError):
+            BoundedQueueHandler(queue.Queue(), "unknown")
+
+
+class TestBatchingFileHandler:
+    """まとめ書きファイルハンドラーのテスト"""
+
+    def test_flush_every_batch(self, tmp_path) -> None:
+        """batch_size件ごとにファイルへ反映されることのテスト"""
+        log_file = tmp_path / "batch.log"
+        handler = BatchingFileHandler(log_file, batch_size=3)
+
+        handler.handle(make_record("one"))
+        handler.handle(make_record("two"))
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        handler.handle(make_record("three"))
+        assert log_file.read_text(encoding="utf-8").splitlines() == ["one", "two", "three"]
+        handler.close()
+
+
+class TestAsyncLogBackend:
+    """非同期ファイル出力のテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の準備"""
+        self.logger = logging.getLogger("test_async_logging")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+
+    def teardown_method(self) -> None:
+        """テストメソッド実行後にハンドラーを外す"""
+        self.logger.handlers.clear()
+
+    def test_stop_writes_all_records(self, tmp_path) -> None:
+        """停止時に残りのレコードが全て書き出されることのテスト"""
+        log_file = tmp_path / "async.log"
+        backend = AsyncLogBackend(log_file, overflow=OVERFLOW_BLOCK, max_queue_size=10, batch_size=7)
+        self.logger.addHandler(backend.queue_handler)
+        backend.start()
+
+        for i in range(100):
+            self.logger.info("record %d", i)
+        backend.stop()
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert lines == [f"record {i}" for i in range(100)]
+        assert not backend.running
+
+    def test_flush_keeps_running(self, tmp_path) -> None:
+        """flush()で書き出した後も出力を続けられることのテスト"""
+        log_file = tmp_path / "async.log"
+        backend = AsyncLogBackend(log_file, batch_size=1000)
+        self.logger.addHandler(backend.queue_handler)
+        backend.start()
+
+        self.logger.info("first")
+        backend.flush()
+        assert log_file.read_text(encoding="utf-8").splitlines() == ["first"]
+
+        self.logger.info("second")
+        backend.stop()
+        assert log_file.read_text(encoding="utf-8").splitlines() == ["first", "second"]
+
+    def test_dropped_records_are_reported(self, tmp_path) -> None:
+        """捨てたレコード数が停止時にファイルへ記録されることのテスト"""
+        log_file = tmp_path / "async.log"
+        backend = AsyncLogBackend(log_file, max_queue_size=1)
+        self.logger.addHandler(backend.queue_handler)
+
+        # 出力用スレッドを開始する前に積むので2件目以降は捨てられる
+        for i in range(4):
+            self.logger.info("record %d", i)
+        backend.start()
+        backend.stop()
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert backend.dropped == 3
+        assert lines[0] == "record 0"
+        assert "3" in lines[-1]
+
+    def test_exception_traceback(self, tmp_path) -> None:
+        """例外のトレースバックが出力されることのテスト"""
+        log_file = tmp_path / "async.log"
+        backend = AsyncLogBackend(log_file)
+        self.logger.addHandler(backend.queue_handler)
+        backend.start()
+
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            self.logger.exception("failed")
+        backend.stop()
+
+        text = log_file.read_text(encoding="utf-8")
+        assert "Traceback" in text
+        assert "RuntimeError: boom" in text
+
+
+class TestGameLoggerAsync:
+    """GameLoggerの非同期出力切り替えのテスト"""
+
+    @pytest.fixture(autouse=True)
+    def log_to_tmp_path(self, tmp_path: Path) -> Iterator[None]:
+        """テスト中だけ一時ディレクトリのログファイルに出力"""
+        configure_logging(tmp_path, file_output=True)
+        yield
+        configure_logging(file_output=False)
+
+    def test_enable_and_disable(self) -> None:
+        """非同期出力に切り替えても同じログファイルに書き込まれることのテスト"""
+        backend = game_logger.enable_async()
+        assert backend.running
+        assert backend.queue_handler in game_logger.logger.handlers
+
+        game_logger.get_logger().info("非同期出力のテスト")
+        game_logger.disable_async()
+
+        assert not backend.running
+        assert backend.queue_handler not in game_logger.logger.handlers
+        assert game_logger.file_handler in game_logger.logger.handlers
+        assert "非同期出力のテスト" in game_logger.log_file.read_text(encoding="utf-8")
@@ -0,0 +1,124 @@
+"""NumPyによる一括評価（batch）のテスト"""
+
+import random
+
+import pytest
+
+from mahjong_ai.logic import batch
+from mahjong_ai.logic.batch import BatchEvaluator, evaluate_batch
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.logic.table_file import SuitTableFile, build_table_file
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import TILE_KIND_COUNT, Tile
+
+np = pytest.importorskip("numpy")
+
+# テストでは事前計算する枚数を減らし、表にない形は1行ずつの計算で補う
+MAX_TILES = 11
+
+
+@pytest.fixture(scope="module")
+def table_file(tmp_path_factory):
+    """テスト用のテーブルファイル"""
+    # 評価器の配列がマップを参照し続けるため、閉じずにプロセス終了時に解放する
+    return SuitTableFile(build_table_file(tmp_path_factory.mktemp("tables") / "tables.bin", max_tiles=MAX_TILES))
+
+
+def _row(values):
+    """数字のリストから (34,) の枚数ベクトルを作成"""
+    row = [0] * TILE_KIND_COUNT
+    for value in values:
+        row[value - 1] += 1
+    return row
+
+
+def _to_hand(row) -> Hand:
+    """枚数ベクトルから手牌を作成"""
+    return Hand([Tile.from_id(tile_id) for tile_id, count in enumerate(row) for _ in range(count)])
+
+
+class TestBatchEvaluator:
+    """一括評価のテスト"""
+
+    @pytest.fixture(autouse=True)
+    def setup_evaluator(self, table_file) -> None:
+        """テストメソッド実行前の準備"""
+        self.calculator = ShantenCalculator()
+        self.evaluator = BatchEvaluator(table_file, self.calculator)
+
+    def test_matches_scalar(self) -> None:
+        """無作為な手牌で1枚ずつの計算と一致することのテスト"""
+        rng = random.Random(0)
+        pool = [tile_id for tile_id in range(9) for _ in range(6)]
+        rows = []
+        for _ in range(500):
+            row = [0] * TILE_KIND_COUNT
+            for tile_id in rng.sample(pool, rng.choice([0, 1, 4, 7, 10, 11, 13, 13, 14, 14])):
+                row[tile_id] += 1
+            rows.append(row)
+
+        result = self.evaluator.evaluate(np.array(rows, dtype=np.uint8))
+
+        for index, row in enumerate(rows):
+            hand = _to_hand(row)
+            assert result.shanten[index] == self.calculator.calculate_shanten(hand)
+            assert result.is_winning[index] == self.calculator.winning_checker.is_winning_hand(hand)
+            expected_waits = [False] * TILE_KIND_COUNT
+            if hand.size % 3 == 1:
+                for tile_id, shanten in self.calculator.shanten_after_each_draw(hand).items():
+                    expected_waits[tile_id] = shanten == -1
+            assert list(result.wait_masks[index]) == expected_waits
+
+    def test_known_hands(self) -> None:
+        """代表的な手牌の評価テスト"""
+        counts = np.array(
+            [
+                _row([1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9]),  # 九蓮宝燈（9面待ち）
+                _row([1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9, 5]),  # 和了形
+                _row([1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 8, 8]),  # 七対子
+                _row([1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 7, 7, 9]),  # 七対子の聴牌（9索単騎）
+            ],
+            dtype=np.uint8,
+        )
+
+        result = self.evaluator.evaluate(counts)
+
+        assert list(result.shanten) == [0, -1, -1, 0]
+        assert list(result.is_winning) == [False, True, True, False]
+        assert result.wait_masks[0, :9].all()
+        assert not result.wait_masks[1].any()
+        assert result.wait_masks[3, 8]
+
+    def test_five_of_a_kind(self) -> None:
+        """5枚以上の牌を含む手牌は1行ずつの計算で補うことのテスト"""
+        row = _row([1, 1, 1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+        result = self.evaluator.evaluate(np.array([row], dtype=np.uint8))
+
+        hand = _to_hand(row)
+        assert result.shanten[0] == self.calculator.calculate_shanten(hand)
+
+    def test_single_accessors(self) -> None:
+        """個別の取得メソッドが一括評価と一致することのテスト"""
+        counts = np.array([_row([1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9, 1, 1])], dtype=np.uint8)
+        result = self.evaluator.evaluate(counts)
+
+        assert (self.evaluator.shanten(counts) == result.shanten).all()
+        assert (self.evaluator.is_winning(counts) == result.is_winning).all()
+        assert (self.evaluator.wait_masks(counts) == result.wait_masks).all()
+
+    def test_invalid_shape(self) -> None:
+        """(N, 34) でない行列のエラーテスト"""
+        with pytest.raises(ValueError):
+            self.evaluator.evaluate(np.zeros((3, 9), dtype=np.uint8))
+
+    def test_default_table_file_not_generated(self, tmp_path, monkeypatch) -> None:
+        """テーブルファイルを省略した場合、既定のファイルがなくても生成しないことのテスト"""
+        monkeypatch.setenv("MAHJONG_AI_TABLE_FILE", str(tmp_path / "missing.bin"))
+
+        monkeypatch.setattr(batch, "_default_evaluator", None)
+
+        with pytest.raises(FileNotFoundError):
+            BatchEvaluator()
+        with pytest.raises(FileNotFoundError):
+            evaluate_batch(np.zeros((1, TILE_KIND_COUNT), dtype=np.uint8))
+        assert not (tmp_path / "missing.bin").exists()
@@ -6,7 +6,8 @@ from unittest.mock import patch
 import pytest
 
 from mahjong_ai.game.game_engine import GameEngine, GameState
-from mahjong_ai.interface.cui_interface import CUIInterface
+from mahjong_ai.interface.cui_interface import ConsoleEventSink, CUIInterface
+from mahjong_ai.models.hand import Hand
 from mahjong_ai.models.tile import Tile
 
 
@@ -142,7 +143,7 @@ class TestCUIInterface:
             Tile(suit="sou", value=1),
             Tile(suit="sou", value=2),
         ]
-        self.interface.engine.current_hand._tiles = test_tiles
+        self.interface.engine.current_hand = Hand(test_tiles)
 
         if self.interface.engine.calculate_shanten() == 0:
             with patch("sys.stdout", new=StringIO()):
@@ -267,3 +268,53 @@ class TestCUIInterface:
                 self.interface.process_discard_tile()
             except Exception:
                 pass  # エラーが適切に処理されることを確認
+
+
+class TestConsoleEventSink:
+    """ゲームイベントの画面表示のテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の初期化"""
+        self.interface = CUIInterface()
+        self.engine = self.interface.engine
+
+    def test_registered_on_engine(self) -> None:
+        """CUIInterfaceがエンジンに表示用の出力先を登録することのテスト"""
+        assert any(isinstance(sink, ConsoleEventSink) for sink in self.engine.event_sinks)
+
+    def test_draw_and_discard_output(self) -> None:
+        """ツモ・打牌の結果を表示することのテスト"""
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.engine.start_game()
+            drawn_tile = self.engine.draw_tile()
+            self.engine.discard_tile(drawn_tile)
+            output = fake_out.getvalue()
+
+        assert "ゲーム開始！" in output
+        assert f"ツモ: {drawn_tile}" in output
+        assert f"打牌: {drawn_tile}" in output
+        assert f"現在の手牌: {self.engine.current_hand}" in output
+        assert f"向聴数: {self.engine.shanten}" in output
+
+    def test_win_output(self) -> None:
+        """ツモ和了を表示することのテスト"""
+        self.engine.start_game()
+        self.engine.current_hand = Hand([Tile(suit="sou", value=value) for value in [1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9, 5]])
+        self.engine.game_state = GameState.AFTER_DRAW
+
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.engine.execute_win(Tile(suit="sou", value=5))
+            output = fake_out.getvalue()
+
+        assert "ツモ和了！ 和了牌: 5索" in output
+
+    def test_reset_output(self) -> None:
+        """ゲームリセットを表示することのテスト"""
+        self.engine.start_game()
+
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.interface.process_reset_game()
+            output = fake_out.getvalue()
+
+        assert "ゲームをリセットしました" in output
+        assert self.engine.game_state == GameState.NOT_STARTED
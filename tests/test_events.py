@@ -0,0 +1,128 @@
+"""構造化ゲームイベント（events）のテスト"""
+
+import contextlib
+import io
+
+import pytest
+
+from mahjong_ai.game.events import (
+    BINARY_HEADER,
+    BinaryEventSink,
+    EventSink,
+    EventType,
+    GameEvent,
+    JsonlEventSink,
+    MemoryEventSink,
+    open_event_sink,
+    read_events,
+)
+from mahjong_ai.game.game_engine import GameEngine
+from mahjong_ai.game.wall_tiles import WallTiles
+
+SAMPLE_EVENTS = [
+    GameEvent(EventType.DEAL, 1, tuple(range(9)) + (0, 1, 2, 3)),
+    GameEvent(EventType.DRAW, 1, (4,)),
+    GameEvent(EventType.RIICHI, 1, (8,)),
+    GameEvent(EventType.KAN, 2, (0, 5)),
+    GameEvent(EventType.WIN, 3, (6,)),
+    GameEvent(EventType.RYUUKYOKU, 4, ()),
+]
+
+
+class TestEventFiles:
+    """イベントファイルの書き込み・読み込みのテスト"""
+
+    @pytest.mark.parametrize("sink_class, suffix", [(JsonlEventSink, ".jsonl"), (BinaryEventSink, ".bin")])
+    def test_round_trip(self, tmp_path, sink_class, suffix) -> None:
+        """書き込んだイベントが同じ順で読み込めることのテスト"""
+        path = tmp_path / f"events{suffix}"
+        with sink_class(path) as sink:
+            for event in SAMPLE_EVENTS:
+                sink.write(event)
+
+        assert list(read_events(path)) == SAMPLE_EVENTS
+
+    def test_binary_layout(self, tmp_path) -> None:
+        """バイナリ形式のレコード配置のテスト"""
+        path = tmp_path / "events.bin"
+        with BinaryEventSink(path) as sink:
+            sink.write(GameEvent(EventType.DRAW, 258, (4,)))
+
+        data = path.read_bytes()
+        assert data == BINARY_HEADER + bytes([4, 0, EventType.DRAW, 2, 1, 4])
+
+    def test_jsonl_line(self, tmp_path) -> None:
+        """JSONL形式の1行の内容のテスト"""
+        path = tmp_path / "events.jsonl"
+        with JsonlEventSink(path) as sink:
+            sink.write(GameEvent(EventType.DISCARD, 3, (7,)))
+
+        assert path.read_text(encoding="utf-8") == '{"type":"discard","turn":3,"tiles":[7]}\n'
+
+    def test_truncated_binary(self, tmp_path) -> None:
+        """途中で切れたバイナリファイルはエラーになることのテスト"""
+        path = tmp_path / "events.bin"
+        with BinaryEventSink(path) as sink:
+            sink.write(GameEvent(EventType.DRAW, 1, (4,)))
+        path.write_bytes(path.read_bytes()[:-1])
+
+        with pytest.raises(ValueError):
+            list(read_events(path))
+
+    def test_sink_requires_write(self) -> None:
+        """writeを実装しない出力先は生成できないことのテスト"""
+        with pytest.raises(TypeError):
+            EventSink()
+
+    def test_open_event_sink_by_suffix(self, tmp_path) -> None:
+        """拡張子から形式が選ばれることのテスト"""
+        jsonl_sink = open_event_sink(tmp_path / "events.jsonl")
+        binary_sink = open_event_sink(tmp_path / "events.mjev")
+        jsonl_sink.close()
+        binary_sink.close()
+
+        assert isinstance(jsonl_sink, JsonlEventSink)
+        assert isinstance(binary_sink, BinaryEventSink)
+
+
+class TestEngineEvents:
+    """GameEngineのイベント出力のテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の準備"""
+        self.engine = GameEngine()
+        self.engine.wall = WallTiles(seed=12345)
+        self.sink = MemoryEventSink()
+        self.engine.add_event_sink(self.sink)
+
+    def test_game_events(self) -> None:
+        """配牌からツモ・打牌・流局までのイベントのテスト"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.engine.start_game()
+            drawn_tile = self.engine.draw_tile()
+            self.engine.discard_tile(drawn_tile)
+
+        deal, draw, discard = self.sink.events
+        assert deal.type == EventType.DEAL
+        assert sorted(deal.tiles) == [tile.tile_id for tile in self.engine.current_hand.tiles]
+        assert draw == GameEvent(EventType.DRAW, 1, (drawn_tile.tile_id,))
+        assert discard == GameEvent(EventType.DISCARD, 1, (drawn_tile.tile_id,))
+
+    def test_ryuukyoku_event(self) -> None:
+        """山牌が尽きた時に流局イベントが出力されることのテスト"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.engine.start_game()
+            while self.engine.can_draw():
+                self.engine.discard_tile(self.engine.draw_tile())
+            with pytest.raises(ValueError):
+                self.engine.draw_tile()
+
+        assert self.sink.events[-1].type == EventType.RYUUKYOKU
+
+    def test_remove_event_sink(self) -> None:
+        """登録解除後はイベントが出力されないことのテスト"""
+        self.engine.remove_event_sink(self.sink)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.engine.start_game()
+
+        assert self.sink.events == []
@@ -4,8 +4,17 @@ from typing import List
 
 import pytest
 
+from mahjong_ai.game.events import MemoryEventSink
 from mahjong_ai.game.game_engine import GameEngine, GameState
+from mahjong_ai.game.wall_tiles import WallTiles
+from mahjong_ai.models.hand import Hand
 from mahjong_ai.models.tile import Tile
+from mahjong_ai.utils.logger import get_game_logger
+
+
+def calculate_reference(hand: Hand) -> int:
+    """キャッシュを持たない計算器で向聴数を計算"""
+    return GameEngine().shanten_calculator.calculate_shanten(hand)
 
 
 class TestGameEngine:
@@ -136,7 +145,7 @@ class TestGameEngine:
         for value in range(1, 8):  # 1-7索を各2枚（七対子）
             winning_tiles.extend([Tile(suit="sou", value=value), Tile(suit="sou", value=value)])
 
-        self.engine.current_hand._tiles = winning_tiles
+        self.engine.current_hand = Hand(winning_tiles)
 
         # 和了判定
         assert self.engine.check_winning_hand()
@@ -182,7 +191,7 @@ class TestGameEngine:
         for value in range(1, 8):  # 1-7索を各2枚（七対子）
             winning_tiles.extend([Tile(suit="sou", value=value), Tile(suit="sou", value=value)])
 
-        self.engine.current_hand._tiles = winning_tiles
+        self.engine.current_hand = Hand(winning_tiles)
 
         # ツモを実行（和了形+1枚で和了チェックが動作）
         drawn_tile = self.engine.draw_tile()
@@ -287,3 +296,312 @@ class TestGameEngine:
         except ValueError:
             # 流局処理が実装されている場合
             assert self.engine.game_state == GameState.GAME_OVER
+
+    def test_riichi_helpers_use_discard_table(self) -> None:
+        """リーチ判定が打牌後向聴数表と一致することのテスト"""
+        self.engine.start_game()
+        # 1-2-3, 4-5-6, 7-8-9, 1-1-1, 2 + ツモ5索
+        values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 1, 1, 2, 5]
+        self.engine.current_hand = Hand([Tile(suit="sou", value=value) for value in values])
+        self.engine.game_state = GameState.AFTER_DRAW
+
+        discard_table = self.engine.get_discard_shanten_table()
+
+        assert self.engine.can_riichi()
+        assert self.engine.can_discard_for_riichi(Tile(suit="sou", value=5))
+        assert Tile(suit="sou", value=5) in self.engine.get_riichi_discardable_tiles()
+        assert all(discard_table[tile.tile_id] == 0 for tile in self.engine.get_riichi_discardable_tiles())
+
+        # 手牌が変わらない間は同じ表を再利用する
+        assert self.engine.get_discard_shanten_table() is discard_table
+
+
+class TestEngineSnapshot:
+    """局面のスナップショットと分岐のテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の初期化"""
+        self.engine = GameEngine()
+        self.engine.wall = WallTiles(seed=99)
+        self.engine.start_game()
+        self.engine.draw_tile()
+
+    def test_restore(self) -> None:
+        """進めた局面をスナップショットから復元できることのテスト"""
+        snapshot = self.engine.snapshot()
+        hand_tiles = self.engine.current_hand.tiles
+        remaining = self.engine.wall.remaining_count
+
+        self.engine.discard_tile(hand_tiles[0])
+        self.engine.draw_tile()
+        self.engine.restore(snapshot)
+
+        assert self.engine.current_hand.tiles == hand_tiles
+        assert self.engine.wall.remaining_count == remaining
+        assert self.engine.discarded_tiles == []
+        assert self.engine.game_state == GameState.AFTER_DRAW
+        assert self.engine.snapshot() == snapshot
+
+    def test_restore_after_kan(self) -> None:
+        """暗槓後の嶺上牌の枚数も復元されることのテスト"""
+        self.engine.current_hand = Hand([Tile(suit="sou", value=value) for value in [1, 1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9]])
+        self.engine.execute_kan(Tile(suit="sou", value=1))
+        snapshot = self.engine.snapshot()
+
+        other = GameEngine()
+        other.restore(snapshot)
+
+        assert other.wall.rinshan_count == 3
+        assert other.kan_tiles == [[Tile(suit="sou", value=1)] * 4]
+        assert other.snapshot() == snapshot
+
+    def test_fork_is_independent(self) -> None:
+        """分岐したエンジンの変更が元のエンジンに影響しないことのテスト"""
+        snapshot = self.engine.snapshot()
+        fork = self.engine.fork()
+
+        assert fork.snapshot() == snapshot
+
+        fork.discard_tile(fork.current_hand.tiles[0])
+        fork.draw_tile()
+
+        assert self.engine.snapshot() == snapshot
+        assert fork.wall.remaining_count == self.engine.wall.remaining_count - 1
+
+    def test_fork_does_not_share_event_sinks(self) -> None:
+        """分岐したエンジンはイベントを出力しないことのテスト"""
+        sink = MemoryEventSink()
+        self.engine.add_event_sink(sink)
+
+        fork = self.engine.fork()
+        fork.discard_tile(fork.current_hand.tiles[0])
+
+        assert sink.events == []
+
+
+class TestActionJournal:
+    """操作履歴（元に戻す・やり直す）のテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の初期化"""
+        self.engine = GameEngine()
+        self.engine.wall = WallTiles(seed=7)
+        self.engine.enable_journal()
+
+    def test_undo_redo_round_trip(self) -> None:
+        """全ての操作を元に戻し、やり直すと同じ局面になることのテスト"""
+        snapshots = [self.engine.snapshot()]
+        self.engine.start_game()
+        snapshots.append(self.engine.snapshot())
+        for _ in range(5):
+            self.engine.draw_tile()
+            snapshots.append(self.engine.snapshot())
+            self.engine.discard_tile(self.engine.current_hand.tiles[0])
+            snapshots.append(self.engine.snapshot())
+
+        for expected in reversed(snapshots[:-1]):
+            self.engine.undo()
+            assert self.engine.snapshot() == expected
+
+        for expected in snapshots[1:]:
+            self.engine.redo()
+            assert self.engine.snapshot() == expected
+
+    def test_undo_kan(self) -> None:
+        """暗槓を元に戻すと嶺上牌と手牌が戻ることのテスト"""
+        self.engine.start_game()
+        self.engine.draw_tile()
+        self.engine.current_hand = Hand([Tile(suit="sou", value=value) for value in [1, 1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9]])
+        before = self.engine.snapshot()
+
+        self.engine.execute_kan(Tile(suit="sou", value=1))
+        after = self.engine.snapshot()
+        self.engine.undo()
+
+        assert self.engine.snapshot() == before
+        assert self.engine.wall.rinshan_count == 4
+
+        self.engine.redo()
+        assert self.engine.snapshot() == after
+
+    def test_undo_win(self) -> None:
+        """和了を元に戻すと打牌できる状態に戻ることのテスト"""
+        self.engine.start_game()
+        drawn_tile = self.engine.draw_tile()
+        self.engine.execute_win(drawn_tile)
+
+        self.engine.undo()
+
+        assert not self.engine.is_winner
+        assert self.engine.winning_tile is None
+        assert self.engine.game_state == GameState.AFTER_DRAW
+
+    def test_new_action_clears_redo(self) -> None:
+        """元に戻した後に別の操作をするとやり直せなくなることのテスト"""
+        self.engine.start_game()
+        self.engine.draw_tile()
+        discard_tiles = self.engine.get_possible_discards()
+        self.engine.discard_tile(discard_tiles[0])
+        self.engine.undo()
+
+        self.engine.discard_tile(discard_tiles[-1])
+
+        assert not self.engine.journal.can_redo
+        with pytest.raises(ValueError):
+            self.engine.redo()
+
+    def test_undo_without_journal(self) -> None:
+        """操作履歴が無効な場合は元に戻せないことのテスト"""
+        self.engine.disable_journal()
+
+        with pytest.raises(ValueError):
+            self.engine.undo()
+
+    def test_undo_empty(self) -> None:
+        """元に戻せる操作がない場合のテスト"""
+        with pytest.raises(ValueError):
+            self.engine.undo()
+
+
+class TestShantenTracking:
+    """向聴数・待ち牌のキャッシュのテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の初期化"""
+        self.engine = GameEngine()
+        self.engine.wall = WallTiles(seed=11)
+        self.calls = 0
+        calculate = self.engine.shanten_calculator.calculate_shanten
+
+        def counting_calculate(hand: Hand) -> int:
+            self.calls += 1
+            return calculate(hand)
+
+        self.engine.shanten_calculator.calculate_shanten = counting_calculate
+
+    def test_matches_calculator(self) -> None:
+        """ツモ・打牌のたびに向聴数・待ち牌が計算結果と一致することのテスト"""
+        calculator = GameEngine().shanten_calculator
+        self.engine.start_game()
+        for turn in range(10):
+            assert self.engine.shanten == calculate_reference(self.engine.current_hand)
+            expected_waits = [
+                Tile.from_id(tile_id)
+                for tile_id, shanten in calculator.shanten_after_each_draw(self.engine.current_hand).items()
+                if shanten == -1
+            ]
+            assert self.engine.waits == expected_waits
+            self.engine.draw_tile()
+            assert self.engine.shanten == calculate_reference(self.engine.current_hand)
+            assert self.engine.waits == []
+            discard = min(
+                self.engine.get_discard_shanten_table().items(), key=lambda item: (item[1], (item[0] * 7 + turn) % 9)
+            )[0]
+            self.engine.discard_tile(Tile.from_id(discard))
+
+    def test_shanten_from_tables(self) -> None:
+        """ツモ後・打牌後向聴数表があれば向聴数を再計算しないことのテスト"""
+        self.engine.start_game()
+        self.engine.get_draw_shanten_table()
+        self.calls = 0
+
+        drawn = self.engine.draw_tile()
+        self.engine.get_discard_shanten_table()
+        self.engine.discard_tile(drawn)
+
+        assert self.calls == 0
+        assert self.engine.shanten == calculate_reference(self.engine.current_hand)
+
+    def test_tracked_without_warm_up(self) -> None:
+        """表を事前に用意しなくてもツモ・打牌で向聴数を再計算しないことのテスト"""
+        self.engine.start_game()
+        self.calls = 0
+        for _ in range(10):
+            drawn = self.engine.draw_tile()
+            # ツモ後向聴数表はツモのためには作らない
+            assert self.engine._draw_table is None
+            self.engine.discard_tile(drawn)
+
+        assert self.calls == 0
+        assert self.engine.shanten == calculate_reference(self.engine.current_hand)
+        assert self.calls == 0
+
+    def test_cached_until_hand_changes(self) -> None:
+        """手牌が変わるまで同じ値を返し、手牌を差し替えると計算し直すことのテスト"""
+        self.engine.current_hand = Hand([Tile(suit="sou", value=value) for value in [1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9]])
+        assert self.engine.shanten == 0
+        assert self.engine.shanten == 0
+        assert self.calls == 1
+        assert self.engine.waits == [Tile(suit="sou", value=value) for value in range(1, 10)]
+
+        self.engine.current_hand = Hand([Tile(suit="sou", value=value) for value in [1, 4, 7, 2, 5, 8, 3, 6, 9, 1, 5, 9, 9]])
+        assert self.engine.shanten == calculate_reference(self.engine.current_hand)
+        assert self.calls == 2
+
+    def test_winning_tiles_filtered_by_wall(self) -> None:
+        """和了牌は待ち牌のうち山牌に残っている牌であることのテスト"""
+        self.engine.current_hand = Hand([Tile(suit="sou", value=value) for value in [1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9]])
+        self.engine.wall.load(bytes([0, 1, 2, 2, 2]), rinshan_count=0)
+
+        assert self.engine.get_winning_tiles() == [Tile(suit="sou", value=value) for value in (1, 2, 3)]
+
+    def test_waits_agree_with_kan_win_check(self) -> None:
+        """暗槓後の待ち牌をツモした手牌が和了形と判定されることのテスト"""
+        self.engine.kan_tiles = [[Tile(suit="sou", value=1)] * 4]
+        self.engine.current_hand = Hand([Tile(suit="sou", value=value) for value in [2, 3, 4, 5, 6, 7, 8, 8, 9, 9]])
+        waits = self.engine.waits
+        assert waits
+
+        for tile_id in range(9):
+            hand = self.engine.current_hand
+            self.engine.current_hand = hand.copy()
+            self.engine.current_hand.add_tile(Tile.from_id(tile_id))
+            assert self.engine.check_winning_hand() == (Tile.from_id(tile_id) in waits)
+            self.engine.current_hand = hand
+
+    def test_undo_restores_shanten(self) -> None:
+        """元に戻した局面の向聴数が正しいことのテスト"""
+        self.engine.enable_journal()
+        self.engine.start_game()
+        before = self.engine.shanten
+        self.engine.draw_tile()
+        self.engine.shanten
+
+        self.engine.undo()
+
+        assert self.engine.shanten == before
+
+
+class TestPresentationFree:
+    """ゲームエンジンが画面表示を行わないことのテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の初期化"""
+        self.engine = GameEngine()
+        self.engine.wall = WallTiles(seed=5)
+
+    def play_turns(self, turns: int) -> None:
+        """配牌後、ツモ切りをturns回行う"""
+        self.engine.start_game()
+        for _ in range(turns):
+            self.engine.discard_tile(self.engine.draw_tile())
+
+    def test_no_output(self, capsys: pytest.CaptureFixture) -> None:
+        """配牌・ツモ・打牌・リセットで画面に何も出力しないことのテスト"""
+        self.play_turns(5)
+        self.engine.reset_game()
+
+        assert capsys.readouterr().out == ""
+
+    def test_no_formatting_without_sinks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """出力先がなく状態ログも無効な場合は牌・手牌を文字列化しないことのテスト"""
+        monkeypatch.setattr(get_game_logger(), "performance_mode", True)
+
+        def fail(*args: object) -> str:
+            raise AssertionError("文字列化されました")
+
+        monkeypatch.setattr(Tile, "__str__", fail)
+        monkeypatch.setattr(Hand, "__str__", fail)
+
+        self.play_turns(10)
+        self.engine.execute_win(self.engine.draw_tile())
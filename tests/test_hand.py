@@ -244,3 +244,97 @@ class TestHand:
         assert hand1 == hand2  # 順序に関係なく同じ内容なら等価
         assert hand1 != hand3  # 内容が異なれば非等価
         assert hash(hand1) == hash(hand2)  # 等価なオブジェクトは同じハッシュ
+
+    def test_hand_counts_view(self) -> None:
+        """枚数ベクトルビューのテスト"""
+        tiles = [
+            Tile(suit="sou", value=1),
+            Tile(suit="sou", value=1),
+            Tile(suit="sou", value=9),
+        ]
+        hand = Hand(tiles)
+        counts = hand.counts_view()
+
+        assert len(counts) == 34
+        assert counts[0] == 2
+        assert counts[8] == 1
+        assert sum(counts) == 3
+
+        # ビューは手牌の変更に追従する（コピーではない）
+        hand.remove_tile(Tile(suit="sou", value=1))
+        assert counts[0] == 1
+
+    def test_hand_counts_view_read_only(self) -> None:
+        """枚数ベクトルビューが読み取り専用であることのテスト"""
+        hand = Hand([Tile(suit="sou", value=5)])
+        counts = hand.counts_view()
+
+        with pytest.raises(TypeError):
+            counts[4] = 3  # type: ignore
+
+    def test_hand_creation_over_max_size(self) -> None:
+        """15枚以上の牌で初期化すると例外になることのテスト"""
+        with pytest.raises(ValueError, match="手牌は最大14枚までです"):
+            Hand([Tile(suit="sou", value=(i % 9) + 1) for i in range(15)])
+
+    def test_hand_copy_keeps_sorted_cache(self) -> None:
+        """ソート済み牌列を参照した後のコピーも独立して変更できることのテスト"""
+        original_hand = Hand([Tile(suit="sou", value=value) for value in [5, 1, 3]])
+        original_tiles = original_hand.tiles
+        copied_hand = original_hand.copy()
+
+        copied_hand.remove_tile(Tile(suit="sou", value=1))
+
+        assert original_hand.tiles == original_tiles
+        assert copied_hand.tiles == [Tile(suit="sou", value=3), Tile(suit="sou", value=5)]
+        assert copied_hand.counts_view()[0] == 0
+        assert original_hand.counts_view()[0] == 1
+
+
+class TestHandBulkConstruction:
+    """手牌の一括作成のテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の初期化"""
+        self.values = [1, 1, 1, 2, 3, 4, 5, 5, 6, 7, 8, 9, 9, 9]
+        self.hand = Hand([Tile(suit="sou", value=value) for value in self.values])
+
+    def test_from_counts(self) -> None:
+        """枚数ベクトルから作成した手牌が元の手牌と一致することのテスト"""
+        from_view = Hand.from_counts(self.hand.counts_view())
+        from_suit = Hand.from_counts([3, 1, 1, 1, 2, 1, 1, 1, 3])
+
+        assert from_view == self.hand
+        assert from_suit == self.hand
+        assert from_suit.size == 14
+        assert from_suit.tiles == self.hand.tiles
+
+    def test_from_counts_invalid(self) -> None:
+        """不正な枚数ベクトルの例外テスト"""
+        with pytest.raises(ValueError):
+            Hand.from_counts([5, 5, 5])
+        with pytest.raises(ValueError):
+            Hand.from_counts([1, -1])
+        with pytest.raises(ValueError):
+            Hand.from_counts([0] * 35)
+        with pytest.raises(ValueError):
+            Hand.from_counts([128])
+        with pytest.raises(ValueError):
+            Hand.from_counts([0, -129])
+
+    def test_from_sorted(self) -> None:
+        """ソート済み牌列から作成した手牌が元の手牌と一致することのテスト"""
+        hand = Hand.from_sorted(self.hand.tiles)
+
+        assert hand == self.hand
+        assert hand.size == 14
+        assert hand.tiles == self.hand.tiles
+
+        # 変更するとソート済み牌列は作り直される
+        hand.remove_tile(Tile(suit="sou", value=2))
+        assert hand.tiles == [tile for tile in self.hand.tiles if tile != Tile(suit="sou", value=2)]
+
+    def test_from_sorted_unsorted(self) -> None:
+        """牌順でない牌列は例外になることのテスト"""
+        with pytest.raises(ValueError):
+            Hand.from_sorted([Tile(suit="sou", value=3), Tile(suit="sou", value=1)])
@@ -0,0 +1,198 @@
+"""ログ設定（GameLogger）のテスト"""
+
+import io
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from mahjong_ai.game.game_engine import GameEngine
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import Tile
+from mahjong_ai.utils.logger import LOG_DIR_ENV, LOG_DISABLED_ENV, GameStateSnapshot, game_logger
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def run_python(code: str, cwd: Path, **env_vars: str) -> str:
+    """別プロセスのPythonでcodeを実行し、標準出力を返す"""
+    env = {key: value for key, value in os.environ.items() if key not in (LOG_DIR_ENV, LOG_DISABLED_ENV)}
+    env["PYTHONPATH"] = str(SRC_DIR)
+    env.update(env_vars)
+    result = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+class CountingEngine:
+    """状態の参照回数を数えるエンジンの代用"""
+
+    def __init__(self) -> None:
+        self.shanten_calls = 0
+        self.game_state = "player_turn"
+        self.turn_count = 1
+        self.is_riichi = False
+        self.current_hand = Hand([Tile(suit="sou", value=1), Tile(suit="sou", value=2)])
+        self.discarded_tiles = []
+
+        class Wall:
+            remaining_count = 40
+
+        self.wall = Wall()
+
+    def calculate_shanten(self) -> int:
+        self.shanten_calls += 1
+        return 1
+
+    def can_draw(self) -> bool:
+        return True
+
+    def can_discard(self) -> bool:
+        return False
+
+    def can_riichi(self) -> bool:
+        return False
+
+
+class TestGameLogger:
+    """ログ設定のテスト"""
+
+    def teardown_method(self) -> None:
+        """テストメソッド実行後に設定を戻す"""
+        game_logger.set_level(logging.DEBUG)
+        game_logger.set_performance_mode(False)
+
+    def test_state_logging_in_performance_mode(self) -> None:
+        """性能モード中は状態を収集しないことのテスト"""
+        engine = CountingEngine()
+        game_logger.set_performance_mode(True)
+
+        game_logger.log_game_state(engine)
+
+        assert engine.shanten_calls == 0
+        assert not game_logger.is_state_logging_enabled()
+
+    def test_state_logging_filtered_by_level(self) -> None:
+        """ログレベルで抑制されている場合は状態を収集しないことのテスト"""
+        engine = CountingEngine()
+        game_logger.set_level(logging.WARNING)
+
+        game_logger.log_game_state(engine)
+
+        assert engine.shanten_calls == 0
+
+    def test_state_logging_without_accepting_handler(self, monkeypatch) -> None:
+        """INFOを受け付けるハンドラーがない場合は状態を収集せず、和了判定も行わないことのテスト"""
+        # テストではファイル出力が無効なので、コンソール（WARNING）のハンドラーだけが残る
+        assert game_logger.file_handler is None and game_logger.async_backend is None
+        monkeypatch.setattr(game_logger.logger, "propagate", False)
+        engine = CountingEngine()
+
+        game_logger.log_game_state(engine)
+
+        assert engine.shanten_calls == 0
+        assert not game_logger.is_state_logging_enabled()
+        assert game_logger.is_state_logging_enabled(logging.WARNING)
+
+        game_engine = GameEngine()
+        game_engine.start_game()
+        winning_checks = []
+        monkeypatch.setattr(game_engine, "check_winning_hand", lambda: winning_checks.append(True) or False)
+        game_engine.draw_tile()
+
+        assert winning_checks == []
+
+    def test_state_logging_enabled(self) -> None:
+        """出力する場合は状態を1回だけ収集することのテスト"""
+        engine = CountingEngine()
+        handler = logging.StreamHandler(io.StringIO())
+        game_logger.logger.addHandler(handler)
+        try:
+            game_logger.log_game_state(engine)
+        finally:
+            game_logger.logger.removeHandler(handler)
+
+        assert engine.shanten_calls == 1
+
+    def test_snapshot_is_lazy(self) -> None:
+        """状態ログのメッセージは文字列化するまで状態を収集しないことのテスト"""
+        engine = CountingEngine()
+        snapshot = GameStateSnapshot(engine)
+
+        assert engine.shanten_calls == 0
+        text = str(snapshot)
+        assert engine.shanten_calls == 1
+        assert "向聴数: 1" in text
+        assert "山牌残り: 40" in text
+
+
+class TestLazyInitialization:
+    """ロガーの遅延生成のテスト（プロセスごとの状態を確認するため別プロセスで実行）"""
+
+    def test_import_has_no_side_effects(self, tmp_path: Path) -> None:
+        """importだけではロガーを生成せず、ファイルも作成しないことのテスト"""
+        code = (
+            "import mahjong_ai.game.game_engine, mahjong_ai.interface.cui_interface, mahjong_ai.sim\n"
+            "import mahjong_ai.utils.logger as logger\n"
+            "print(logger._game_logger is None)"
+        )
+
+        assert run_python(code, tmp_path).strip() == "True"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_created_on_first_use(self, tmp_path: Path) -> None:
+        """最初に使用した時点でログファイルを作成することのテスト"""
+        code = "from mahjong_ai.game.game_engine import GameEngine\nGameEngine()"
+
+        run_python(code, tmp_path)
+
+        log_files = list((tmp_path / "logs").glob("mahjong_game_*.log"))
+        assert len(log_files) == 1
+        assert "GameEngine初期化完了" in log_files[0].read_text(encoding="utf-8")
+
+    def test_configure_before_first_use(self, tmp_path: Path) -> None:
+        """生成前の configure_logging() の設定で生成されることのテスト"""
+        code = (
+            "from mahjong_ai.utils.logger import configure_logging, get_game_logger\n"
+            "configure_logging(log_dir='custom')\n"
+            "print(get_game_logger().log_file.parent.name)"
+        )
+
+        assert run_python(code, tmp_path).strip() == "custom"
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["custom"]
+
+    def test_file_output_disabled(self, tmp_path: Path) -> None:
+        """ファイル出力を無効にするとログファイルを作成しないことのテスト"""
+        code = (
+            "from mahjong_ai.game.game_engine import GameEngine\n"
+            "from mahjong_ai.utils.logger import configure_logging, get_game_logger\n"
+            "configure_logging(file_output=False)\n"
+            "GameEngine().start_game()\n"
+            "print(get_game_logger().log_file)"
+        )
+
+        assert run_python(code, tmp_path).strip().endswith("None")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_environment_variables(self, tmp_path: Path) -> None:
+        """環境変数で出力先の指定・ファイル出力の無効化ができることのテスト"""
+        code = "from mahjong_ai.game.game_engine import GameEngine\nGameEngine()"
+
+        run_python(code, tmp_path, **{LOG_DISABLED_ENV: "1"})
+        assert list(tmp_path.iterdir()) == []
+
+        run_python(code, tmp_path, **{LOG_DIR_ENV: str(tmp_path / "env_logs")})
+        assert len(list((tmp_path / "env_logs").glob("mahjong_game_*.log"))) == 1
+
+    def test_enable_async_requires_file_output(self, tmp_path: Path) -> None:
+        """ファイル出力が無効な場合は非同期出力に切り替えられないことのテスト"""
+        code = (
+            "from mahjong_ai.utils.logger import configure_logging, enable_async_logging\n"
+            "configure_logging(file_output=False)\n"
+            "try:\n"
+            "    enable_async_logging()\n"
+            "except ValueError:\n"
+            "    print('ValueError')"
+        )
+
+        assert run_python(code, tmp_path).strip() == "ValueError"
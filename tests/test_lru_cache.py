@@ -0,0 +1,63 @@
+"""LRUキャッシュ（LRUCache）のテスト"""
+
+from mahjong_ai.logic.lru_cache import LRUCache
+
+
+class TestLRUCache:
+    """LRUキャッシュのテスト"""
+
+    def test_hit_and_miss(self) -> None:
+        """2回目以降は計算せずに保存した値を返すことのテスト"""
+        cache: LRUCache[int] = LRUCache(4)
+        calls = []
+
+        def compute() -> int:
+            calls.append(1)
+            return 42
+
+        assert cache.get_or_compute(b"a", compute) == 42
+        assert cache.get_or_compute(b"a", compute) == 42
+        assert len(calls) == 1
+        assert cache.info() == {"hits": 1, "misses": 1, "size": 1, "max_size": 4}
+
+    def test_evicts_least_recently_used(self) -> None:
+        """最も古く参照されたエントリから破棄することのテスト"""
+        cache: LRUCache[str] = LRUCache(2)
+        cache.get_or_compute(b"a", lambda: "a")
+        cache.get_or_compute(b"b", lambda: "b")
+        cache.get_or_compute(b"a", lambda: "a")
+        cache.get_or_compute(b"c", lambda: "c")
+
+        assert len(cache) == 2
+        cache.get_or_compute(b"a", lambda: "a")
+        assert cache.hits == 2
+        cache.get_or_compute(b"b", lambda: "b")
+        assert cache.misses == 4
+
+    def test_cached_falsy_value(self) -> None:
+        """Falseなどの値も保存されることのテスト"""
+        cache: LRUCache[bool] = LRUCache(2)
+        cache.get_or_compute(b"a", lambda: False)
+
+        assert cache.get_or_compute(b"a", lambda: True) is False
+        assert cache.hits == 1
+
+    def test_disabled(self) -> None:
+        """最大エントリ数が0以下の場合は保存しないことのテスト"""
+        cache: LRUCache[int] = LRUCache(0)
+        cache.get_or_compute(b"a", lambda: 1)
+
+        assert cache.info() == {"hits": 0, "misses": 0, "size": 0, "max_size": 0}
+
+    def test_discard_and_clear(self) -> None:
+        """エントリの個別破棄と全破棄のテスト"""
+        cache: LRUCache[int] = LRUCache(4)
+        cache.get_or_compute(b"a", lambda: 1)
+        cache.get_or_compute(b"b", lambda: 2)
+
+        cache.discard(b"a")
+        cache.discard(b"missing")
+        assert len(cache) == 1
+
+        cache.clear()
+        assert cache.info() == {"hits": 0, "misses": 0, "size": 0, "max_size": 4}
@@ -0,0 +1,126 @@
+"""対局記録と再現エンジン（replay）のテスト"""
+
+import contextlib
+import io
+import random
+
+import pytest
+
+from mahjong_ai.game.events import EventType, GameEvent
+from mahjong_ai.game.game_engine import GameEngine, GameState
+from mahjong_ai.game.replay import GameRecord, GameRecorder, ReplayEngine
+from mahjong_ai.game.wall_tiles import WallTiles, shuffled_wall_ids
+
+
+def play_recorded_game(seed: int):
+    """無作為に打牌して1局を記録し、(記録, ターンごとの局面)を返す"""
+    engine = GameEngine()
+    engine.wall = WallTiles(seed=seed)
+    recorder = GameRecorder(engine)
+    rng = random.Random(seed)
+
+    # ターン数 → ツモ前の(手牌, 山牌の残り枚数, 捨て牌)
+    states = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.start_game()
+        while engine.can_draw():
+            states[engine.turn_count] = (engine.current_hand.tiles, engine.wall.remaining_count, list(engine.discarded_tiles))
+            engine.draw_tile()
+            if engine.can_win():
+                engine.execute_win(engine.last_drawn_tile)
+                break
+            engine.discard_tile(rng.choice(engine.current_hand.tiles))
+        else:
+            with pytest.raises(ValueError):
+                engine.draw_tile()
+
+    recorder.close()
+    return recorder.record, states
+
+
+class TestGameRecord:
+    """対局記録のテスト"""
+
+    def test_recorder_restores_initial_wall(self) -> None:
+        """記録の山牌が配牌前の並びと一致することのテスト"""
+        record, _ = play_recorded_game(2024)
+
+        assert record.wall_ids == bytes(shuffled_wall_ids(2024))
+        assert record.seed == 2024
+        assert record.events[0].type == EventType.DEAL
+        assert record.events[-1].type in (EventType.WIN, EventType.RYUUKYOKU)
+
+    def test_save_and_load(self, tmp_path) -> None:
+        """保存した記録を読み込めることのテスト"""
+        record, _ = play_recorded_game(7)
+        path = tmp_path / "record.json"
+
+        record.save(path)
+
+        assert GameRecord.load(path) == record
+
+    def test_unknown_version(self) -> None:
+        """非対応のバージョンはエラーになることのテスト"""
+        with pytest.raises(ValueError):
+            GameRecord.from_dict({"version": 999, "wall": [], "events": []})
+
+
+class TestReplayEngine:
+    """再現エンジンのテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の準備"""
+        self.record, self.states = play_recorded_game(12345)
+        self.replay = ReplayEngine(self.record, snapshot_interval=4)
+
+    def assert_state(self, engine: GameEngine, turn: int) -> None:
+        """局面が記録時の局面と一致することを確認"""
+        hand_tiles, remaining, discarded = self.states[turn]
+        assert engine.current_hand.tiles == hand_tiles
+        assert engine.wall.remaining_count == remaining
+        assert engine.discarded_tiles == discarded
+        assert engine.turn_count == turn
+
+    def test_seek_turn_forward(self) -> None:
+        """先頭から順にターンを移動できることのテスト"""
+        for turn in sorted(self.states):
+            self.assert_state(self.replay.seek_turn(turn), turn)
+
+    def test_seek_turn_backward(self) -> None:
+        """スナップショットを使って前のターンに戻れることのテスト"""
+        turns = sorted(self.states)
+        self.replay.seek(len(self.replay))
+
+        for turn in reversed(turns):
+            self.assert_state(self.replay.seek_turn(turn), turn)
+
+    def test_seek_end(self) -> None:
+        """最後まで再生すると終局することのテスト"""
+        engine = self.replay.seek(len(self.replay))
+
+        assert engine.game_state == GameState.GAME_OVER
+        assert engine.is_winner == (self.record.events[-1].type == EventType.WIN)
+
+    def test_seek_start(self) -> None:
+        """0件目は配牌前の局面になることのテスト"""
+        self.replay.seek(len(self.replay))
+        engine = self.replay.seek(0)
+
+        assert engine.game_state == GameState.NOT_STARTED
+        assert engine.current_hand.size == 0
+        assert engine.wall.wall_ids() == self.record.wall_ids
+
+    def test_seek_out_of_range(self) -> None:
+        """範囲外の移動はエラーになることのテスト"""
+        with pytest.raises(IndexError):
+            self.replay.seek(len(self.replay) + 1)
+
+    def test_mismatched_record(self) -> None:
+        """山牌と一致しない記録はエラーになることのテスト"""
+        events = list(self.record.events)
+        draw_tile_id = events[1].tiles[0]
+        events[1] = GameEvent(EventType.DRAW, events[1].turn, ((draw_tile_id + 1) % 9,))
+        replay = ReplayEngine(GameRecord(self.record.wall_ids, events, self.record.seed))
+
+        with pytest.raises(ValueError):
+            replay.seek(2)
@@ -0,0 +1,73 @@
+"""マルチプロセス自己対局ランナー（ParallelRunner）のテスト"""
+
+import random
+
+import pytest
+
+from mahjong_ai.game.wall_tiles import WallTiles
+from mahjong_ai.sim.runner import ParallelRunner, batch_seeds, run_batch
+
+
+class TestParallelRunner:
+    """マルチプロセス自己対局ランナーのテスト"""
+
+    def test_batch_seeds_deterministic(self) -> None:
+        """マスターシードからのバッチシード生成テスト"""
+        assert batch_seeds(1, 5) == batch_seeds(1, 5)
+        assert batch_seeds(1, 3) == batch_seeds(1, 5)[:3]
+        assert batch_seeds(1, 5) != batch_seeds(2, 5)
+
+    def test_run_batch_reproducible(self) -> None:
+        """同じシードのバッチが同じ結果になることのテスト"""
+        first = run_batch((0, "random", 30, 1234))
+        second = run_batch((0, "random", 30, 1234))
+
+        assert first == second
+        assert first[1].games == 30
+
+    def test_game_count_split(self) -> None:
+        """総対局数がバッチに正しく分割されることのテスト"""
+        runner = ParallelRunner(workers=1, batch_size=7)
+        batches = sorted(runner.iter_batches("tsumogiri", 30, 3), key=lambda item: item[0])
+
+        assert [index for index, _ in batches] == [0, 1, 2, 3, 4]
+        assert [stats.games for _, stats in batches] == [7, 7, 7, 7, 2]
+
+    def test_identical_regardless_of_workers(self) -> None:
+        """ワーカー数に関わらず結果が一致することのテスト"""
+        single = ParallelRunner(workers=1, batch_size=20).run("random", 60, 42)
+        pooled = ParallelRunner(workers=2, batch_size=20).run("random", 60, 42)
+
+        assert single == pooled
+        assert single.games == 60
+
+    def test_progress_callback(self) -> None:
+        """途中経過の通知テスト"""
+        seen = []
+        runner = ParallelRunner(workers=1, batch_size=10)
+        runner.run("tsumogiri", 25, 5, progress=lambda stats: seen.append(stats.games))
+
+        assert seen == [10, 20, 25]
+
+    def test_invalid_arguments(self) -> None:
+        """不正な引数のエラーテスト"""
+        with pytest.raises(ValueError):
+            ParallelRunner(batch_size=0)
+
+        with pytest.raises(ValueError):
+            ParallelRunner(workers=1).run("unknown", 10, 1)
+
+
+class TestWallTilesRng:
+    """山牌への乱数生成器の注入テスト"""
+
+    def test_seeded_wall_is_reproducible(self) -> None:
+        """同じシードの乱数生成器で同じ山牌になることのテスト"""
+        first = WallTiles(rng=random.Random(99))
+        second = WallTiles(rng=random.Random(99))
+
+        assert first.remaining_tiles == second.remaining_tiles
+
+        first.reset()
+        second.reset()
+        assert first.remaining_tiles == second.remaining_tiles
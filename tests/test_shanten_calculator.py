@@ -1,8 +1,12 @@
 """向聴数計算（ShantenCalculator）クラスのテスト"""
 
+import random
+
 import pytest
 
-from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator, kan_count_for_size
+from mahjong_ai.logic.waits import WaitCalculator
+from mahjong_ai.logic.winning_checker import WinningChecker
 from mahjong_ai.models.hand import Hand
 from mahjong_ai.models.tile import Tile
 
@@ -274,3 +278,117 @@ class TestShantenCalculator:
         hand = Hand(tiles)
         shanten = self.calculator.calculate_seven_pairs_shanten(hand)
         assert shanten == 2, "七対子2向聴"
+
+    def test_shanten_after_each_discard(self) -> None:
+        """打牌後向聴数の一括計算テスト"""
+        values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 1, 2, 5, 8]
+        hand = Hand([Tile(suit="sou", value=value) for value in values])
+
+        discard_table = self.calculator.shanten_after_each_discard(hand)
+
+        # 手牌にある種類ごとに1つずつ
+        assert sorted(discard_table) == [tile.tile_id for tile in hand.get_unique_tiles()]
+
+        for tile in hand.get_unique_tiles():
+            temp_hand = hand.copy()
+            temp_hand.remove_tile(tile)
+            assert discard_table[tile.tile_id] == self.calculator.calculate_shanten(temp_hand)
+
+    def test_shanten_after_each_discard_parity(self) -> None:
+        """打牌後向聴数の一括計算と個別計算の一致テスト"""
+        rng = random.Random(5)
+        pool = [value for value in range(1, 10) for _ in range(6)]
+        recursive_calculator = ShantenCalculator(use_table=False)
+
+        for size in (14, 14, 14, 8, 2, 1):
+            hand = Hand([Tile(suit="sou", value=value) for value in rng.sample(pool, size)])
+            for calculator in (self.calculator, recursive_calculator):
+                discard_table = calculator.shanten_after_each_discard(hand)
+                for tile in hand.get_unique_tiles():
+                    temp_hand = hand.copy()
+                    temp_hand.remove_tile(tile)
+                    assert discard_table[tile.tile_id] == calculator.calculate_shanten(temp_hand)
+
+    def test_shanten_after_each_discard_five_of_a_kind(self) -> None:
+        """5枚以上の牌を含む手牌での打牌後向聴数テスト"""
+        values = [3, 3, 3, 3, 3, 4, 5, 6, 7, 8, 9, 9, 1, 2]
+        hand = Hand([Tile(suit="sou", value=value) for value in values])
+
+        discard_table = self.calculator.shanten_after_each_discard(hand)
+        for tile in hand.get_unique_tiles():
+            temp_hand = hand.copy()
+            temp_hand.remove_tile(tile)
+            assert discard_table[tile.tile_id] == self.calculator.calculate_shanten(temp_hand)
+
+    def test_shanten_after_each_draw_parity(self) -> None:
+        """ツモ後向聴数の一括計算と個別計算の一致テスト"""
+        rng = random.Random(6)
+        pool = [value for value in range(1, 10) for _ in range(6)]
+        recursive_calculator = ShantenCalculator(use_table=False)
+
+        for size in (13, 13, 13, 10, 4, 1):
+            hand = Hand([Tile(suit="sou", value=value) for value in rng.sample(pool, size)])
+            for calculator in (self.calculator, recursive_calculator):
+                draw_table = calculator.shanten_after_each_draw(hand)
+                assert sorted(draw_table) == list(range(9))
+                for tile_id, shanten in draw_table.items():
+                    temp_hand = hand.copy()
+                    temp_hand.add_tile(Tile.from_id(tile_id))
+                    assert shanten == calculator.calculate_shanten(temp_hand)
+
+    def test_draw_shanten_for_selected_tiles(self) -> None:
+        """指定した種類だけのツモ後向聴数が一括計算と一致することのテスト"""
+        values = [1, 1, 2, 2, 3, 3, 5, 5, 6, 6, 8, 8, 9]
+        hand = Hand([Tile(suit="sou", value=value) for value in values])
+        full_table = self.calculator.shanten_after_each_draw(hand)
+
+        for tile_id in range(9):
+            table = self.calculator.draw_shanten_from_counts(hand.counts_view(), hand.size, (tile_id,))
+            assert table == {tile_id: full_table[tile_id]}
+
+    def test_shanten_after_each_draw_seven_pairs(self) -> None:
+        """七対子聴牌からのツモ後向聴数テスト"""
+        values = [1, 1, 2, 2, 3, 3, 5, 5, 6, 6, 8, 8, 9]
+        hand = Hand([Tile(suit="sou", value=value) for value in values])
+
+        draw_table = self.calculator.shanten_after_each_draw(hand)
+
+        assert draw_table[Tile(suit="sou", value=9).tile_id] == -1
+        assert draw_table[Tile(suit="sou", value=1).tile_id] >= 0
+
+    def test_kan_count_for_size(self) -> None:
+        """手牌の枚数から暗槓の数を求めるテスト"""
+        assert [kan_count_for_size(size) for size in (14, 13, 11, 10, 8, 7, 2, 1)] == [0, 0, 1, 1, 2, 2, 4, 4]
+
+    def test_shanten_after_ankan(self, make_hand) -> None:
+        """暗槓後の手牌は暗槓を面子に数えて判定することのテスト"""
+        complete_11 = make_hand([1, 1, 1, 2, 2, 2, 3, 3, 3, 5, 5])
+        complete_8 = make_hand([1, 1, 1, 2, 2, 2, 5, 5])
+        tenpai_10 = make_hand([2, 3, 4, 5, 6, 7, 8, 8, 9, 9])
+
+        assert self.calculator.calculate_shanten(complete_11, 1) == -1
+        assert self.calculator.calculate_shanten(complete_8, 2) == -1
+        assert self.calculator.calculate_shanten(tenpai_10, 1) == 0
+        assert self.calculator.shanten_after_each_discard(complete_11, 1)[4] == 0
+
+    def test_ankan_wins_match_complete_hands(self, random_counts) -> None:
+        """暗槓後の和了・待ち牌が和了判定・待ち牌計算と一致することのテスト"""
+        checker = WinningChecker(cache_size=0)
+        waits = WaitCalculator(cache_size=0)
+        rng = random.Random(11)
+        for size in (11, 10, 8, 7, 5, 4):
+            kan_count = kan_count_for_size(size)
+            for _ in range(100):
+                counts = random_counts(rng, size)
+                hand = Hand.from_counts(counts)
+                if size % 3 == 2:
+                    shanten = self.calculator.calculate_shanten(hand, kan_count)
+                    assert (shanten == -1) == checker.is_complete_hand(hand)
+                    discard_table = self.calculator.shanten_after_each_discard(hand, kan_count)
+                    for tile_id, value in discard_table.items():
+                        after = list(counts)
+                        after[tile_id] -= 1
+                        assert value == self.calculator.calculate_shanten(Hand.from_counts(after), kan_count)
+                else:
+                    draw_table = self.calculator.draw_shanten_from_counts(counts, size, kan_count=kan_count)
+                    assert tuple(tile_id for tile_id, value in draw_table.items() if value == -1) == waits.wait_ids(hand)
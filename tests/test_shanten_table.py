@@ -0,0 +1,121 @@
+"""向聴数テーブル（ShantenTable）のテスト"""
+
+import random
+
+import pytest
+
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.logic.shanten_table import (
+    OVERFLOW_MAX_COUNT,
+    ShantenTable,
+    _iter_suit_counts,
+    decode_key,
+    encode_counts,
+    overflow_array_length,
+    rank_counts,
+)
+from mahjong_ai.models.hand import Hand
+
+
+class TestShantenTable:
+    """向聴数テーブルのテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の初期化"""
+        self.table = ShantenTable()
+        self.reference = ShantenCalculator(use_table=False)
+
+    def test_encode_decode_roundtrip(self) -> None:
+        """5進数キーの符号化・復号テスト"""
+        counts = [4, 0, 1, 2, 3, 0, 0, 1, 3]
+        key = encode_counts(counts)
+
+        assert decode_key(key) == counts
+        assert encode_counts([0] * 9) == 0
+        assert encode_counts([0] * 8 + [1]) == 5**8
+
+    def test_empty_counts(self) -> None:
+        """空の枚数ベクトルの向聴数テスト"""
+        assert self.table.normal_shanten([0] * 9) == 8
+
+    def test_known_shapes(self) -> None:
+        """代表的な形の向聴数テスト"""
+        # 1-2-3, 4-5-6, 7-8-9, 1-1-1 + 2索単騎
+        assert self.table.normal_shanten([4, 2, 1, 1, 1, 1, 1, 1, 1]) == 0
+        # 1-2-3, 4-5-6, 7-8-9, 1-1-1, 2-2
+        assert self.table.normal_shanten([4, 3, 1, 1, 1, 1, 1, 1, 1]) == -1
+
+    def test_lookup_is_cached(self) -> None:
+        """同じ形の2回目以降は表引きのみで済むことのテスト"""
+        counts = [1, 1, 1, 2, 0, 3, 1, 1, 3]
+        first = self.table.normal_shanten(counts)
+        size = self.table.size
+
+        assert self.table.normal_shanten(counts) == first
+        assert self.table.size == size
+
+    def test_clear(self) -> None:
+        """テーブル破棄テスト"""
+        self.table.normal_shanten([1, 1, 1, 2, 0, 3, 1, 1, 3])
+        self.table.clear()
+
+        assert self.table.size == 1
+        assert self.table.normal_shanten([1, 1, 1, 2, 0, 3, 1, 1, 3]) >= -1
+
+    @pytest.mark.parametrize("size", [1, 2, 5, 8, 11, 13, 14])
+    def test_parity_with_recursion(self, random_counts, size: int) -> None:
+        """再帰探索との一致テスト"""
+        rng = random.Random(size)
+        for _ in range(8):
+            counts = random_counts(rng, size)
+            hand = Hand.from_counts(counts)
+            expected = self.reference._calculate_normal_shanten_recursive(hand.get_tile_counts())
+
+            assert self.table.normal_shanten(counts) == expected, f"枚数ベクトル: {counts}"
+
+    def test_parity_with_five_or_more_tiles(self) -> None:
+        """5枚以上の牌を含む形での再帰探索との一致テスト"""
+        for counts in ([5, 1, 1, 0, 1, 1, 1, 1, 2], [0, 6, 1, 1, 1, 0, 2, 2, 0], [1, 0, 1, 5, 3, 1, 0, 1, 2]):
+            hand = Hand.from_counts(counts)
+            expected = self.reference._calculate_normal_shanten_recursive(hand.get_tile_counts())
+
+            assert self.table.normal_shanten(counts) == expected, f"枚数ベクトル: {counts}"
+
+    def test_calculator_parity(self, random_counts) -> None:
+        """ShantenCalculatorのテーブル版と再帰版の一致テスト"""
+        calculator = ShantenCalculator(table=self.table)
+        rng = random.Random(2024)
+        for size in (13, 14):
+            for _ in range(6):
+                hand = Hand.from_counts(random_counts(rng, size))
+
+                assert calculator.calculate_shanten(hand) == self.reference.calculate_shanten(hand)
+
+    def test_rank_counts_matches_enumeration(self) -> None:
+        """通し番号が枚数ベクトルの列挙順と一致することのテスト"""
+        for max_tiles in (3, 7):
+            ranks = [rank_counts(counts, max_tiles) for counts in _iter_suit_counts(max_tiles, OVERFLOW_MAX_COUNT)]
+
+            assert ranks == list(range(overflow_array_length(max_tiles)))
+
+    def test_attached_overflow_values(self, random_counts) -> None:
+        """5枚以上を含む形の配列を登録したテーブルが計算結果と同じ値を返すことのテスト"""
+        max_tiles = 9
+        source = ShantenTable()
+        table = ShantenTable()
+        table.attach_values(None, memoryview(source.overflow_values_array(max_tiles)).cast("b"))
+        rng = random.Random(3)
+
+        for counts in ([5, 1, 1, 0, 1, 1, 0, 0, 0], [0, 6, 1, 1, 1, 0, 0, 0, 0], [1, 0, 1, 5, 0, 0, 0, 1, 0]):
+            assert table.normal_shanten(counts) == self.table.normal_shanten(counts)
+        for _ in range(30):
+            counts = random_counts(rng, max_tiles)
+            assert table.normal_shanten(counts) == self.table.normal_shanten(counts)
+
+        # 配列で引いた形は補助テーブルに登録されない
+        assert not table._overflow_records
+
+    def test_invalid_overflow_values_length(self) -> None:
+        """長さの合わない5枚以上を含む形の配列は登録できないことのテスト"""
+        with pytest.raises(ValueError):
+            ShantenTable().attach_values(None, bytes(overflow_array_length(9) + 1))
@@ -0,0 +1,181 @@
+"""ヘッドレス自己対局（Simulator）のテスト"""
+
+import random
+
+import pytest
+
+from mahjong_ai.game.wall_tiles import DealPool, WallTiles
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.logic.ukeire import UkeireCalculator
+from mahjong_ai.logic.winning_checker import WinningChecker
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import Tile
+from mahjong_ai.sim import (
+    DiscardPolicy,
+    RandomDiscardPolicy,
+    ShantenPolicy,
+    SimulationStats,
+    Simulator,
+    TsumogiriPolicy,
+    UkeirePolicy,
+    create_policy,
+)
+from mahjong_ai.sim.simulator import GameResult
+
+
+class RecordingPolicy(TsumogiriPolicy):
+    """打牌前の手牌が和了形でないことを確認しながらツモ切りする方針"""
+
+    def __init__(self) -> None:
+        self.checker = WinningChecker()
+        self.calls = 0
+
+    def choose_discard(self, hand, drawn_tile, wall):
+        self.calls += 1
+        assert hand.size == 14
+        assert hand.has_tile(drawn_tile)
+        assert not self.checker.is_winning_hand(hand)
+        return drawn_tile
+
+
+class TestSimulator:
+    """自己対局シミュレーターのテスト"""
+
+    def test_run_counts(self) -> None:
+        """集計値の整合性テスト"""
+        stats = Simulator().run(50)
+
+        assert stats.games == 50
+        assert stats.wins + stats.ryuukyoku == 50
+        assert 0.0 <= stats.win_rate <= 1.0
+        assert stats.win_rate + stats.ryuukyoku_rate == pytest.approx(1.0)
+
+    @pytest.mark.parametrize("name", ["tsumogiri", "random", "shanten", "ukeire"])
+    def test_policies(self, name: str) -> None:
+        """各打牌方針で対局が最後まで進むことのテスト"""
+        stats = Simulator(policy=create_policy(name)).run(10)
+
+        assert stats.games == 10
+        if stats.wins:
+            assert 1 <= stats.average_turns_to_win <= 50
+
+    def test_deal_pool_walls_used_once(self) -> None:
+        """N局で山牌N個のプールを先頭から1つずつ使い、追加生成しないことのテスト"""
+        pool = DealPool(20, seed=3)
+        simulator = Simulator(wall=WallTiles(deal_pool=pool))
+
+        seeds = [simulator.play_game().seed for _ in range(20)]
+
+        assert seeds == [pool.seed_of(index) for index in range(20)]
+        assert len(pool) == 20
+
+    def test_no_missed_wins(self) -> None:
+        """和了形の手牌で打牌を求められないことのテスト"""
+        policy = RecordingPolicy()
+        simulator = Simulator(policy=policy)
+
+        for _ in range(20):
+            result = simulator.play_game()
+            if result.is_win:
+                # 最後のツモで和了した牌は打牌しない
+                assert simulator.wall.remaining_count == 50 - 13 - result.turns
+            else:
+                assert result.turns == 50 - 13
+
+    def test_ryuukyoku_when_wall_empty(self) -> None:
+        """流局時のツモ回数テスト"""
+        simulator = Simulator(policy=ShantenPolicy())
+
+        for _ in range(10):
+            result = simulator.play_game()
+            if not result.is_win:
+                assert simulator.wall.is_empty()
+                assert result.turns == 50 - 13
+
+    def test_stats_merge(self) -> None:
+        """集計結果の合算テスト"""
+        first = SimulationStats()
+        first.add(GameResult(is_win=True, turns=5, tenpai_turn=2))
+        second = SimulationStats()
+        second.add(GameResult(is_win=False, turns=37, tenpai_turn=None))
+        second.add(GameResult(is_win=True, turns=9, tenpai_turn=0))
+
+        first.merge(second)
+
+        assert first.games == 3
+        assert first.wins == 2
+        assert first.ryuukyoku == 1
+        assert first.average_turns_to_win == 7.0
+        assert first.average_turns_to_tenpai == 1.0
+        assert first.to_dict()["win_rate"] == pytest.approx(2 / 3)
+
+    def test_policy_choices_are_in_hand(self) -> None:
+        """打牌方針が手牌の牌を返すことのテスト"""
+        hand = Hand([Tile(suit="sou", value=value) for value in [1, 1, 2, 3, 4, 4, 5, 6, 7, 8, 9, 9, 9, 2]])
+        drawn_tile = Tile(suit="sou", value=2)
+        simulator = Simulator()
+
+        for policy in (TsumogiriPolicy(), RandomDiscardPolicy(random.Random(1)), ShantenPolicy(), UkeirePolicy()):
+            assert hand.has_tile(policy.choose_discard(hand, drawn_tile, simulator.wall))
+
+    def test_count_policies_match_hand_calculations(self, random_counts) -> None:
+        """枚数ベクトル上の打牌が手牌での計算結果と一致することのテスト"""
+        rng = random.Random(9)
+        calculator = ShantenCalculator()
+        ukeire = UkeireCalculator(calculator)
+        shanten_policy = ShantenPolicy(calculator)
+        ukeire_policy = UkeirePolicy(ukeire)
+        random_policy = RandomDiscardPolicy(random.Random(4))
+        reference_rng = random.Random(4)
+
+        for _ in range(40):
+            counts = random_counts(rng, 14)
+            hand = Hand.from_counts(counts)
+            drawn_id = rng.choice(hand.tiles).tile_id
+            wall = WallTiles(seed=rng.getrandbits(32))
+            wall.draw_multiple_tiles(rng.randrange(40))
+
+            discard_table = calculator.shanten_after_each_discard(hand)
+            best = min(discard_table.values())
+            candidate_ids = [tile_id for tile_id, shanten in discard_table.items() if shanten == best]
+            expected = drawn_id if drawn_id in candidate_ids else candidate_ids[-1]
+            assert shanten_policy.choose_discard_id(counts, drawn_id, wall) == expected
+
+            candidate_ids = [tile.tile_id for tile in ukeire.best_discards(hand, wall.get_tile_distribution())]
+            expected = drawn_id if drawn_id in candidate_ids else candidate_ids[-1]
+            assert ukeire_policy.choose_discard_id(counts, drawn_id, wall) == expected
+
+            # 牌順の手牌から rng.choice で選ぶのと同じ牌を選ぶ
+            assert random_policy.choose_discard_id(counts, drawn_id, wall) == reference_rng.choice(hand.tiles).tile_id
+
+    def test_subclass_choose_discard_is_used(self) -> None:
+        """choose_discardだけを上書きした派生クラスの打牌が使われることのテスト"""
+        policy = RecordingPolicy()
+        Simulator(policy=policy, wall=WallTiles(deal_pool=DealPool(20, seed=1))).run(20)
+
+        assert policy.calls > 0
+
+    def test_invalid_discard(self) -> None:
+        """手牌にない牌を打牌する方針のエラーテスト"""
+
+        class MissingTilePolicy(DiscardPolicy):
+            def choose_discard(self, hand, drawn_tile, wall):
+                raise NotImplementedError
+
+            def choose_discard_id(self, counts, drawn_id, wall):
+                # 索子以外の種類は手牌にない
+                return 9
+
+        simulator = Simulator(policy=MissingTilePolicy(), wall=WallTiles(deal_pool=DealPool(5, seed=1)))
+        with pytest.raises(ValueError):
+            simulator.run(5)
+
+    def test_policy_requires_choose_discard(self) -> None:
+        """choose_discardを実装しない打牌方針は生成できないことのテスト"""
+        with pytest.raises(TypeError):
+            DiscardPolicy()
+
+    def test_unknown_policy(self) -> None:
+        """未知の打牌方針名のエラーテスト"""
+        with pytest.raises(ValueError):
+            create_policy("unknown")
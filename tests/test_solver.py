@@ -0,0 +1,153 @@
+"""和了確率の厳密解（ExactSolver）のテスト"""
+
+import contextlib
+import io
+from math import comb
+
+import pytest
+
+from mahjong_ai.game.game_engine import GameEngine, GameState
+from mahjong_ai.game.wall_tiles import WallTiles
+from mahjong_ai.models.hand import Hand
+from mahjong_ai.models.tile import Tile
+from mahjong_ai.sim.advisor import DiscardAdvisor
+from mahjong_ai.sim.solver import ExactSolver, SolverResult
+
+# 1-1-1, 2-2, 3-3, 4-5-6-7-8-9 + 9 の手牌（9索を打牌すると1-2-3-4-7索待ち）
+TENPAI_COUNTS = [3, 2, 2, 1, 1, 1, 1, 1, 2]
+
+# 山牌の残りの構成
+WALL_COUNTS = [2, 3, 3, 4, 3, 3, 4, 4, 3]
+
+
+class TestExactSolver:
+    """厳密解ソルバーのテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の準備"""
+        self.solver = ExactSolver()
+
+    def test_single_draw(self) -> None:
+        """ツモ1回の和了確率が和了牌の枚数の割合になることのテスト"""
+        result = self.solver.solve(TENPAI_COUNTS, WALL_COUNTS, 1)
+
+        # 1・2・3・4・7索の残り枚数 / 山牌の枚数
+        assert result.discards[Tile(suit="sou", value=9)] == pytest.approx(16 / 29)
+        assert result.best_discard == Tile(suit="sou", value=9)
+        assert result.win_probability == pytest.approx(16 / 29)
+
+    def test_no_draws_left(self) -> None:
+        """ツモが残っていない場合は和了率0になることのテスト"""
+        result = self.solver.solve(TENPAI_COUNTS, WALL_COUNTS, 0)
+
+        assert all(probability == 0.0 for probability in result.discards.values())
+
+    def test_more_draws_never_worse(self) -> None:
+        """ツモ回数が増えても和了確率が下がらないことのテスト"""
+        probabilities = [self.solver.solve(TENPAI_COUNTS, WALL_COUNTS, draws).win_probability for draws in range(4)]
+
+        assert probabilities == sorted(probabilities)
+
+    def test_mirrored_position(self) -> None:
+        """索子の並びを反転した局面が同じ和了確率になることのテスト"""
+        hand = [1, 1, 1, 1, 2, 2, 1, 0, 4]
+        wall = [5, 4, 3, 2, 1, 1, 2, 3, 4]
+
+        forward = self.solver.win_probability(hand[:8] + [3], wall, 3)
+        mirrored = ExactSolver().win_probability((hand[:8] + [3])[::-1], wall[::-1], 3)
+
+        assert forward == pytest.approx(mirrored)
+
+    def test_not_worse_than_heuristic(self) -> None:
+        """最適打牌の和了確率がモンテカルロ推定（ヒューリスティック）を下回らないことのテスト"""
+        exact = self.solver.solve(TENPAI_COUNTS, WALL_COUNTS, 3)
+        advisor = DiscardAdvisor(rollouts=2000, batch_size=500, seed=1)
+        estimates = advisor.evaluate_counts(TENPAI_COUNTS, [0, 8], WALL_COUNTS, 3)
+
+        for tile, estimate in estimates.items():
+            assert estimate.win_rate <= exact.discards[tile] + 4 * estimate.stderr + 1e-9
+
+    def test_table_reused(self) -> None:
+        """同じ局面は置換表から返すことのテスト"""
+        self.solver.solve(TENPAI_COUNTS, WALL_COUNTS, 3)
+        size = len(self.solver)
+
+        self.solver.solve(TENPAI_COUNTS, WALL_COUNTS, 3)
+
+        assert size > 0
+        assert len(self.solver) == size
+
+    def test_save_and_load(self, tmp_path) -> None:
+        """保存した置換表を読み込むと同じ値が得られることのテスト"""
+        path = tmp_path / "solver.tt"
+        expected = self.solver.solve(TENPAI_COUNTS, WALL_COUNTS, 3)
+        self.solver.save(path)
+
+        loaded = ExactSolver(table_path=path)
+
+        assert len(loaded) == len(self.solver)
+        assert loaded.table == self.solver.table
+        assert loaded.solve(TENPAI_COUNTS, WALL_COUNTS, 3) == expected
+
+    def test_load_invalid_file(self, tmp_path) -> None:
+        """置換表ファイルでない場合のエラーテスト"""
+        path = tmp_path / "broken.tt"
+        path.write_bytes(b"not a table")
+
+        with pytest.raises(ValueError):
+            ExactSolver(table_path=path)
+
+    def test_save_without_path(self) -> None:
+        """保存先がない場合のエラーテスト"""
+        with pytest.raises(ValueError):
+            self.solver.save()
+
+    def test_evaluate_engine(self) -> None:
+        """ゲームエンジンの局面を先読み回数を制限して評価できることのテスト"""
+        engine = GameEngine()
+        engine.wall = WallTiles(seed=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.start_game()
+
+        solver = ExactSolver(horizon=2)
+        before_draw = solver.evaluate(engine)
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.draw_tile()
+        after_draw = solver.evaluate(engine)
+
+        assert before_draw.best_discard is None
+        assert list(after_draw.discards) == engine.current_hand.get_unique_tiles()
+        assert solver.best_discard(engine) == after_draw.best_discard
+
+    def test_evaluate_riichi(self) -> None:
+        """リーチ中はツモ切りのみで待ち牌を引く確率になることのテスト"""
+        engine = GameEngine()
+        engine.current_hand = Hand([Tile.from_id(tile_id) for tile_id, count in enumerate(TENPAI_COUNTS) for _ in range(count)])
+        engine.current_hand.remove_tile(Tile(suit="sou", value=9))
+        engine.game_state = GameState.RIICHI
+        engine.is_riichi = True
+        engine.wall.load(bytes(tile_id for tile_id, count in enumerate(WALL_COUNTS) for _ in range(count)), rinshan_count=0)
+
+        result = ExactSolver(horizon=3).evaluate(engine)
+
+        # 29枚中16枚の和了牌を3回のツモで1枚以上引く確率
+        assert result.win_probability == pytest.approx(1 - comb(13, 3) / comb(29, 3))
+
+    def test_evaluate_after_ankan(self, ankan_engine) -> None:
+        """暗槓後の局面でも和了に届く打牌の和了確率を求められることのテスト"""
+        result = self.solver.evaluate(ankan_engine)
+
+        assert result.discards[Tile(suit="sou", value=5)] == 1.0
+        assert result.win_probability == 1.0
+
+        ankan_engine.discard_tile(Tile(suit="sou", value=5))
+        assert self.solver.evaluate(ankan_engine).win_probability == 1.0
+
+    def test_invalid_horizon(self) -> None:
+        """不正な先読み回数のエラーテスト"""
+        with pytest.raises(ValueError):
+            ExactSolver(horizon=-1)
+
+    def test_result_without_discards(self) -> None:
+        """ツモ前の局面の結果は打牌を持たないことのテスト"""
+        assert SolverResult(0.5).best_discard is None
@@ -0,0 +1,158 @@
+"""スート分解テーブルのファイル（table_file）のテスト"""
+
+import random
+
+import pytest
+
+from mahjong_ai.logic import shanten_table, table_file as table_file_module
+from mahjong_ai.logic.shanten_table import (
+    KEY_BASE,
+    UNCOMPUTED,
+    ShantenTable,
+    encode_counts,
+    get_shanten_table,
+    overflow_array_length,
+    rank_counts,
+)
+from mahjong_ai.logic.table_file import SuitTableFile, build_table_file, load_table_file, open_table_file
+from mahjong_ai.logic.winning_checker import get_complete_suits, set_complete_suits
+
+# テストでは事前計算する枚数を減らして生成時間を短くする
+MAX_TILES = 8
+
+
+class TestSuitTableFile:
+    """テーブルファイルのテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の準備"""
+        self.reference = ShantenTable()
+
+    def test_values_match_table(self, tmp_path, random_counts) -> None:
+        """ファイルの向聴数が計算結果と一致することのテスト"""
+        path = build_table_file(tmp_path / "tables.bin", max_tiles=MAX_TILES)
+        table_file = SuitTableFile(path)
+        rng = random.Random(0)
+
+        for size in range(1, MAX_TILES + 1):
+            for _ in range(50):
+                counts = random_counts(rng, size, KEY_BASE - 1)
+                assert table_file.shanten_values[encode_counts(counts)] == self.reference.normal_shanten(counts)
+
+        assert table_file.max_tiles == MAX_TILES
+        assert table_file.complete_suits() == get_complete_suits()
+        table_file.close()
+
+    def test_overflow_values_match_table(self, tmp_path, random_counts) -> None:
+        """ファイルの5枚以上を含む形の向聴数が計算結果と一致することのテスト"""
+        table_file = SuitTableFile(build_table_file(tmp_path / "tables.bin", max_tiles=MAX_TILES))
+        rng = random.Random(2)
+
+        assert len(table_file.overflow_values) == overflow_array_length(MAX_TILES)
+        for size in range(5, MAX_TILES + 1):
+            for _ in range(50):
+                counts = random_counts(rng, size)
+                expected = self.reference.normal_shanten(counts)
+                assert table_file.overflow_values[rank_counts(counts, MAX_TILES)] == expected
+        table_file.close()
+
+    def test_attached_table(self, tmp_path, random_counts) -> None:
+        """ファイルを登録したテーブルが計算結果と同じ値を返すことのテスト"""
+        table_file = SuitTableFile(build_table_file(tmp_path / "tables.bin", max_tiles=MAX_TILES))
+        table = ShantenTable()
+        table.attach_values(table_file.shanten_values, table_file.overflow_values)
+        rng = random.Random(1)
+
+        # ファイルの対象外（MAX_TILES枚超）の形は計算にフォールバックする
+        for size in (4, MAX_TILES, 11, 14):
+            counts = random_counts(rng, size, KEY_BASE - 1)
+            assert table.normal_shanten(counts) == self.reference.normal_shanten(counts)
+            assert table.normal_shanten_by_key(encode_counts(counts)) == self.reference.normal_shanten(counts)
+        for counts in ([5, 1, 1, 0, 0, 0, 0, 0, 0], [6, 1, 1, 1, 1, 1, 1, 1, 1]):
+            assert table.normal_shanten(counts) == self.reference.normal_shanten(counts)
+
+        over = random_counts(rng, MAX_TILES + 1, KEY_BASE - 1)
+        assert table_file.shanten_values[encode_counts(over)] == UNCOMPUTED
+        table.attach_values(None)
+        table_file.close()
+
+    def test_regenerate_missing(self, tmp_path) -> None:
+        """ファイルがない場合は生成されることのテスト"""
+        path = tmp_path / "cache" / "tables.bin"
+
+        table_file = open_table_file(path, regenerate=True, max_tiles=MAX_TILES)
+
+        assert path.exists()
+        assert table_file.max_tiles == MAX_TILES
+        table_file.close()
+
+    def test_regenerate_corrupted(self, tmp_path) -> None:
+        """チェックサムが一致しない場合は生成し直すことのテスト"""
+        path = build_table_file(tmp_path / "tables.bin", max_tiles=MAX_TILES)
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(ValueError):
+            SuitTableFile(path)
+
+        table_file = open_table_file(path, regenerate=True, max_tiles=MAX_TILES)
+        assert table_file.complete_suits() == get_complete_suits()
+        table_file.close()
+
+    def test_no_regenerate(self, tmp_path) -> None:
+        """生成し直さない指定（既定）ではエラーになり、ファイルも作成しないことのテスト"""
+        with pytest.raises(FileNotFoundError):
+            open_table_file(tmp_path / "missing.bin")
+        assert not (tmp_path / "missing.bin").exists()
+
+        path = tmp_path / "broken.bin"
+        path.write_bytes(b"not a table file")
+        with pytest.raises(ValueError):
+            open_table_file(path, regenerate=False)
+
+    def test_invalid_values_length(self) -> None:
+        """長さの合わない配列は登録できないことのテスト"""
+        with pytest.raises(ValueError):
+            ShantenTable().attach_values(bytes(10))
+
+    def test_load_registers_shared_tables(self, tmp_path, monkeypatch) -> None:
+        """読み込んだファイルがプロセス共有のテーブルに登録されることのテスト"""
+        monkeypatch.setenv("MAHJONG_AI_TABLE_FILE", str(tmp_path / "env.bin"))
+        shared = get_shanten_table()
+        try:
+            table_file = load_table_file(regenerate=True, max_tiles=MAX_TILES)
+            assert table_file.path == tmp_path / "env.bin"
+            assert shared.normal_shanten([1, 1, 1, 2, 0, 0, 0, 0, 0]) == self.reference.normal_shanten([1, 1, 1, 2, 0, 0, 0, 0, 0])
+            assert get_complete_suits() == table_file.complete_suits()
+        finally:
+            shared.attach_values(None)
+            set_complete_suits(None)
+        table_file.close()
+
+    def test_shared_table_loads_default_file(self, tmp_path, monkeypatch) -> None:
+        """共有のテーブルを作成するときに既定のファイルを読み込むことのテスト"""
+        path = build_table_file(tmp_path / "env.bin", max_tiles=MAX_TILES)
+        monkeypatch.setenv("MAHJONG_AI_TABLE_FILE", str(path))
+        monkeypatch.setattr(shanten_table, "_default_table", None)
+        monkeypatch.setattr(table_file_module, "_default_table_file", None)
+        try:
+            shared = get_shanten_table()
+            table_file = table_file_module._default_table_file
+            assert table_file is not None and table_file.path == path
+            assert shared.normal_shanten([1, 1, 1, 2, 0, 0, 0, 0, 0]) == self.reference.normal_shanten([1, 1, 1, 2, 0, 0, 0, 0, 0])
+            assert get_complete_suits() == table_file.complete_suits()
+        finally:
+            shared.attach_values(None)
+            set_complete_suits(None)
+        table_file.close()
+
+    def test_shared_table_without_default_file(self, tmp_path, monkeypatch) -> None:
+        """既定のファイルがない場合は生成せずに共有のテーブルを作成することのテスト"""
+        monkeypatch.setenv("MAHJONG_AI_TABLE_FILE", str(tmp_path / "missing.bin"))
+        monkeypatch.setattr(shanten_table, "_default_table", None)
+        monkeypatch.setattr(table_file_module, "_default_table_file", None)
+
+        assert get_shanten_table().normal_shanten([1, 2, 3, 0, 0, 0, 0, 0, 0]) == self.reference.normal_shanten([1, 2, 3, 0, 0, 0, 0, 0, 0])
+        assert table_file_module._default_table_file is None
+        assert not (tmp_path / "missing.bin").exists()
@@ -1,5 +1,7 @@
 """牌（Tile）クラスのテスト"""
 
+import copy
+import pickle
 from dataclasses import FrozenInstanceError
 
 import pytest
@@ -133,3 +135,42 @@ class TestTile:
         assert not tile_1.is_middle
         assert tile_5.is_middle
         assert not tile_9.is_middle
+
+    def test_tile_interned(self) -> None:
+        """同じ牌が同一インスタンスになることのテスト"""
+        tile1 = Tile(suit="sou", value=5)
+        tile2 = Tile.of("sou", 5)
+        tile3 = Tile.from_id(4)
+
+        assert tile1 is tile2
+        assert tile1 is tile3
+
+    def test_tile_from_id_invalid(self) -> None:
+        """未対応のtile_idでの取得テスト"""
+        with pytest.raises(ValueError):
+            Tile.from_id(9)
+
+        with pytest.raises(ValueError):
+            Tile.from_id(-1)
+
+    def test_tile_of_invalid(self) -> None:
+        """Tile.ofでの不正な牌の取得テスト"""
+        with pytest.raises(ValueError, match="Phase 1では索子のみサポート"):
+            Tile.of("man", 5)
+
+        with pytest.raises(ValueError, match="索子の値は1-9である必要があります"):
+            Tile.of("sou", 10)
+
+    def test_tile_pickle_and_copy(self) -> None:
+        """pickle・コピー後も同一インスタンスであることのテスト"""
+        tile = Tile.of("sou", 7)
+
+        assert pickle.loads(pickle.dumps(tile)) is tile
+        assert copy.copy(tile) is tile
+        assert copy.deepcopy(tile) is tile
+
+    def test_tile_sort_key(self) -> None:
+        """並び順キーのテスト"""
+        tiles = [Tile.of("sou", value) for value in range(1, 10)]
+
+        assert [tile.sort_key for tile in tiles] == sorted(tile.sort_key for tile in tiles)
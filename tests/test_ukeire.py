@@ -0,0 +1,102 @@
+"""受け入れ計算（UkeireCalculator）のテスト"""
+
+import random
+
+import pytest
+
+from mahjong_ai.game.wall_tiles import WallTiles
+from mahjong_ai.logic.shanten_calculator import ShantenCalculator
+from mahjong_ai.logic.ukeire import UkeireCalculator
+from mahjong_ai.models.tile import TILES_PER_KIND, Tile
+
+
+class TestUkeireCalculator:
+    """受け入れ計算クラスのテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の初期化"""
+        self.calculator = UkeireCalculator()
+        self.shanten_calculator = ShantenCalculator()
+
+    def test_tenpai_waits(self, make_hand) -> None:
+        """聴牌形の受け入れテスト（和了牌と残り枚数）"""
+        # 1-2-3, 4-5-6, 7-8-9, 1-1-1 + 5索単騎
+        hand = make_hand([1, 1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 5])
+
+        result = self.calculator.calculate(hand)
+
+        assert result.shanten == 0
+        for tile, count in result.tiles.items():
+            assert count == TILES_PER_KIND - hand.count_tile(tile)
+        assert Tile(suit="sou", value=5) in result.tiles
+        assert result.total == sum(result.tiles.values())
+
+    def test_matches_brute_force(self, make_hand) -> None:
+        """受け入れが1枚ずつ試した結果と一致するテスト"""
+        rng = random.Random(11)
+        pool = [value for value in range(1, 10) for _ in range(6)]
+        for _ in range(10):
+            hand = make_hand(rng.sample(pool, 13))
+            shanten = self.shanten_calculator.calculate_shanten(hand)
+
+            expected = []
+            for value in range(1, 10):
+                tile = Tile(suit="sou", value=value)
+                temp_hand = hand.copy()
+                temp_hand.add_tile(tile)
+                if self.shanten_calculator.calculate_shanten(temp_hand) < shanten:
+                    expected.append(tile)
+
+            result = self.calculator.calculate(hand)
+            assert result.shanten == shanten
+            assert list(result.tiles) == expected
+
+    def test_uses_wall_distribution(self, make_hand) -> None:
+        """山牌の残り枚数を使うテスト"""
+        wall = WallTiles()
+        hand = make_hand([1, 1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 5])
+        distribution = wall.get_tile_distribution()
+
+        result = self.calculator.calculate(hand, distribution)
+
+        for tile, count in result.tiles.items():
+            assert count == distribution.get(tile, 0)
+
+    def test_discard_tables(self, make_hand) -> None:
+        """打牌ごとの受け入れ表のテスト"""
+        rng = random.Random(12)
+        pool = [value for value in range(1, 10) for _ in range(6)]
+        hand = make_hand(rng.sample(pool, 14))
+
+        tables = self.calculator.calculate_discards(hand)
+
+        assert list(tables) == hand.get_unique_tiles()
+        for tile, result in tables.items():
+            temp_hand = hand.copy()
+            temp_hand.remove_tile(tile)
+            expected = self.calculator.calculate(temp_hand)
+            assert result.shanten == expected.shanten
+            assert list(result.tiles) == list(expected.tiles)
+
+    def test_best_discards(self, make_hand) -> None:
+        """最善打牌のテスト"""
+        # 9索を切れば1-1-1-1, 2-3-4, 5-6-7, 8の形が残る
+        hand = make_hand([1, 1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 5, 9])
+
+        best = self.calculator.best_discards(hand)
+        tables = self.calculator.calculate_discards(hand)
+
+        assert best
+        best_shanten = min(result.shanten for result in tables.values())
+        best_total = max(result.total for result in tables.values() if result.shanten == best_shanten)
+        for tile in best:
+            assert tables[tile].shanten == best_shanten
+            assert tables[tile].total == best_total
+
+    def test_invalid_size(self, make_hand) -> None:
+        """枚数が不正な手牌でのエラーテスト"""
+        with pytest.raises(ValueError):
+            self.calculator.calculate(make_hand([1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 2, 3, 4, 5]))
+
+        with pytest.raises(ValueError):
+            self.calculator.calculate_discards(make_hand([1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 2, 3, 4]))
@@ -0,0 +1,96 @@
+"""待ち牌計算（WaitCalculator）のテスト"""
+
+import random
+
+from mahjong_ai.game.wall_tiles import WallTiles
+from mahjong_ai.logic.waits import WaitCalculator
+from mahjong_ai.logic.winning_checker import WinningChecker
+from mahjong_ai.models.tile import TILES_PER_KIND, Tile
+
+
+class TestWaitCalculator:
+    """待ち牌計算クラスのテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の初期化"""
+        self.calculator = WaitCalculator()
+
+    def test_nine_sided_wait(self, make_hand) -> None:
+        """九蓮宝燈の形は9種類すべてが待ちになることのテスト"""
+        hand = make_hand([1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9])
+
+        assert self.calculator.wait_ids(hand) == tuple(range(9))
+
+    def test_seven_pairs_wait(self, make_hand) -> None:
+        """七対子の単騎待ちのテスト"""
+        hand = make_hand([1, 1, 3, 3, 4, 4, 6, 6, 7, 7, 9, 9, 5])
+
+        assert self.calculator.wait_ids(hand) == (4,)
+
+    def test_not_tenpai(self, make_hand) -> None:
+        """聴牌していない手牌・3n+1枚でない手牌は待ちがないことのテスト"""
+        assert self.calculator.wait_ids(make_hand([1, 1, 5, 5, 9, 9, 2, 4, 6, 8, 3, 7, 7])) == ()
+        assert self.calculator.wait_ids(make_hand([1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 1, 2, 3, 5])) == ()
+
+    def test_matches_brute_force(self, make_hand) -> None:
+        """1枚加えて和了判定する方法と待ち牌が一致することのテスト"""
+        checker = WinningChecker(cache_size=0)
+        rng = random.Random(7)
+        pool = [value for value in range(1, 10) for _ in range(TILES_PER_KIND)]
+        for _ in range(300):
+            hand = make_hand(rng.sample(pool, 13))
+            expected = []
+            for tile_id in range(9):
+                after = make_hand([tile.value for tile in hand.tiles] + [tile_id + 1])
+                if checker.is_winning_hand(after):
+                    expected.append(tile_id)
+
+            assert self.calculator.wait_ids(hand) == tuple(expected)
+
+    def test_live_counts(self, make_hand) -> None:
+        """待ち牌ごとに山牌の残り枚数を返すことのテスト"""
+        hand = make_hand([1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9])
+        wall = WallTiles()
+        wall.load(bytes([0, 1, 2, 2, 2]), rinshan_count=0)
+
+        result = self.calculator.calculate(hand, wall.get_tile_distribution())
+
+        assert list(result.tiles) == [Tile(suit="sou", value=value) for value in range(1, 10)]
+        assert result.tiles[Tile(suit="sou", value=3)] == 3
+        assert result.total == 5
+        assert result.live_tiles == [Tile(suit="sou", value=value) for value in (1, 2, 3)]
+
+    def test_unseen_counts(self, make_hand) -> None:
+        """残り枚数を省略すると見えていない枚数になることのテスト"""
+        hand = make_hand([1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9])
+
+        result = self.calculator.calculate(hand)
+
+        for tile, count in result.tiles.items():
+            assert count == TILES_PER_KIND - hand.count_tile(tile)
+
+    def test_cached_per_signature(self, make_hand) -> None:
+        """同じ枚数ベクトルの手牌は2回目以降キャッシュを参照することのテスト"""
+        values = [1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9]
+        first = self.calculator.wait_ids(make_hand(values))
+        second = self.calculator.wait_ids(make_hand(list(reversed(values))))
+
+        assert first == second
+        assert self.calculator.cache_info()["misses"] == 1
+        assert self.calculator.cache_info()["hits"] == 1
+
+        self.calculator.invalidate_cache()
+        assert self.calculator.cache_info()["size"] == 0
+
+    def test_invalidate_single_hand(self, make_hand) -> None:
+        """指定した手牌のエントリだけを無効化することのテスト"""
+        hand = make_hand([1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9])
+        other = make_hand([1, 1, 3, 3, 4, 4, 6, 6, 7, 7, 9, 9, 5])
+        self.calculator.wait_ids(hand)
+        self.calculator.wait_ids(other)
+
+        self.calculator.invalidate_cache(hand)
+
+        info = self.calculator.cache_info()
+        assert info["size"] == 1
+        assert info["misses"] == 2
@@ -1,10 +1,12 @@
 """山牌管理（WallTiles）クラスのテスト"""
 
+import random
 from typing import Set
 
 import pytest
 
-from mahjong_ai.game.wall_tiles import WallTiles
+from mahjong_ai.game.game_engine import GameEngine
+from mahjong_ai.game.wall_tiles import CANONICAL_TILES, DealPool, WallTiles, shuffled_wall_ids
 from mahjong_ai.models.tile import Tile
 
 
@@ -227,3 +229,172 @@ class TestWallTiles:
         except AttributeError:
             # draw_specific_tileメソッドが実装されていない場合はスキップ
             pass
+
+
+class TestWallSeeding:
+    """山牌のシード・乱数生成器・山牌プールのテスト"""
+
+    def test_canonical_tiles(self) -> None:
+        """シャッフル前の山牌の内容テスト"""
+        assert len(CANONICAL_TILES) == 54
+        for value in range(1, 10):
+            assert CANONICAL_TILES.count(Tile(suit="sou", value=value)) == 6
+
+    def test_replay_by_seed(self) -> None:
+        """同じシードで同じ山牌になることのテスト"""
+        first = WallTiles(seed=2024)
+        second = WallTiles()
+        second.reset(seed=2024)
+
+        assert first.seed == 2024
+        assert first.remaining_tiles == second.remaining_tiles
+        assert first.draw_rinshan_tile() == second.draw_rinshan_tile()
+        assert WallTiles(seed=2025).remaining_tiles != first.remaining_tiles
+
+    def test_seed_matches_random_shuffle(self) -> None:
+        """シードからの並びがrandom.Random(seed)のシャッフルと一致することのテスト"""
+        tiles = list(CANONICAL_TILES)
+        random.Random(7).shuffle(tiles)
+
+        assert [tile.tile_id for tile in tiles] == list(shuffled_wall_ids(7))
+        assert WallTiles(seed=7).remaining_tiles == tiles[4:]
+
+    def test_injected_rng(self) -> None:
+        """注入した乱数生成器でシャッフルするテスト"""
+        wall = WallTiles(rng=random.Random(3))
+        expected = list(CANONICAL_TILES)
+        random.Random(3).shuffle(expected)
+
+        assert wall.seed is None
+        assert wall.remaining_tiles == expected[4:]
+
+    def test_deal_pool_wall_used_by_engine(self) -> None:
+        """プールの山牌でそのままゲームを開始でき、ツモ後のreset()では次の山牌になることのテスト"""
+        pool = DealPool(2, seed=5)
+        engine = GameEngine()
+        engine.wall = WallTiles(deal_pool=pool)
+
+        engine.start_game()
+        assert engine.current_hand.size == 13
+
+        engine.reset_game()
+        assert engine.wall.seed == pool.seed_of(1)
+
+    def test_deal_pool(self) -> None:
+        """山牌プールの生成と再現テスト"""
+        pool = DealPool(4, seed=11)
+
+        assert len(pool) == 4
+        for index in range(4):
+            replayed = WallTiles(seed=pool.seed_of(index))
+            assert [tile.tile_id for tile in replayed.remaining_tiles] == list(pool.wall_ids(index)[4:])
+
+        assert DealPool(4, seed=11).wall_ids(2) == pool.wall_ids(2)
+
+    def test_wall_from_deal_pool(self) -> None:
+        """山牌プールから順に山牌を取り出すテスト"""
+        pool = DealPool(2, seed=5)
+        wall = WallTiles(deal_pool=pool)
+
+        # コンストラクタで最初の山牌を取り出し、reset()のたびに次の山牌を取り出す
+        assert wall.seed == pool.seed_of(0)
+        assert wall.remaining_count == 50
+        assert wall.is_untouched()
+        wall.reset()
+        assert wall.seed == pool.seed_of(1)
+
+        # 使い切ると続きを生成する
+        wall.reset()
+        assert len(pool) == 4
+        assert wall.seed == pool.seed_of(2)
+        assert wall.remaining_count == 50
+
+        pool.rewind()
+        wall.reset()
+        assert wall.seed == pool.seed_of(0)
+
+    def test_deal_pool_sequence_is_deterministic(self) -> None:
+        """ツモの有無や複製に関係なく、reset()の回数だけで山牌の並びが決まることのテスト"""
+        untouched = WallTiles(deal_pool=DealPool(4, seed=9))
+        drawn = WallTiles(deal_pool=DealPool(4, seed=9))
+        drawn.draw_tile()
+        copied = drawn.copy()
+        assert not copied.is_untouched()
+
+        for _ in range(3):
+            untouched.reset()
+            drawn.reset()
+            assert untouched.seed == drawn.seed
+            assert untouched.remaining_tiles == drawn.remaining_tiles
+            assert untouched.is_untouched()
+
+    def test_deal_pool_invalid_size(self) -> None:
+        """不正なサイズの山牌プールのエラーテスト"""
+        with pytest.raises(ValueError):
+            DealPool(0)
+
+        with pytest.raises(IndexError):
+            DealPool(1, seed=1).wall_ids(1)
+
+
+class TestWallCounts:
+    """山牌の種類ごとの残り枚数のテスト"""
+
+    def setup_method(self) -> None:
+        """テストメソッド実行前の初期化"""
+        self.wall = WallTiles(seed=21)
+
+    def assert_counts_match(self, wall: WallTiles) -> None:
+        """残り枚数が残り牌のリストを数えた結果と一致することを確認"""
+        remaining = wall.remaining_tiles
+        for tile, count in wall.get_tile_distribution().items():
+            assert count == remaining.count(tile)
+            assert wall.count_tile(tile) == count
+            assert wall.has_tile(tile) == (count > 0)
+            assert wall.counts_view()[tile.tile_id] == count
+
+    def test_counts_follow_operations(self) -> None:
+        """ツモ・指定ツモ・戻す操作の後も残り枚数が一致することのテスト"""
+        self.assert_counts_match(self.wall)
+
+        drawn = self.wall.draw_tile()
+        self.wall.draw_specific_tile(self.wall.remaining_tiles[0])
+        self.assert_counts_match(self.wall)
+
+        self.wall.put_back_tile(drawn)
+        self.assert_counts_match(self.wall)
+
+        self.wall.draw_rinshan_tile()
+        self.assert_counts_match(self.wall)
+
+    def test_bulk_draw_matches_single_draws(self) -> None:
+        """まとめてツモした結果が1枚ずつツモした結果と一致することのテスト"""
+        other = WallTiles(seed=21)
+
+        bulk = self.wall.draw_multiple_tiles(13)
+        single = [other.draw_tile() for _ in range(13)]
+
+        assert bulk == single
+        assert self.wall.wall_ids() == other.wall_ids()
+        assert self.wall.draw_multiple_tiles(0) == []
+        self.assert_counts_match(self.wall)
+
+        rest = self.wall.draw_multiple_tiles(self.wall.remaining_count)
+        assert len(rest) == 37
+        assert self.wall.is_empty()
+        self.assert_counts_match(self.wall)
+
+    def test_load_and_copy(self) -> None:
+        """読み込み・複製した山牌の残り枚数が独立して一致することのテスト"""
+        self.wall.draw_multiple_tiles(5)
+        loaded = WallTiles()
+        loaded.load(self.wall.wall_ids(), rinshan_count=self.wall.rinshan_count)
+        copied = self.wall.copy()
+
+        self.assert_counts_match(loaded)
+        assert loaded.get_tile_distribution() == self.wall.get_tile_distribution()
+
+        copied.draw_tile()
+        self.assert_counts_match(copied)
+        self.assert_counts_match(self.wall)
+        assert copied.remaining_count == self.wall.remaining_count - 1
@@ -312,3 +312,85 @@ class TestWinningChecker:
         ]
         hand = Hand(tiles)
         assert not self.checker.check_normal_winning_form(hand)
+
+    def _make_winning_hand(self) -> Hand:
+        """和了形の手牌を作成（1-2-3, 4-5-6, 7-8-9, 1-1-1, 2-2）"""
+        values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 1, 1, 2, 2]
+        return Hand([Tile(suit="sou", value=value) for value in values])
+
+    def test_is_complete_hand_any_size(self) -> None:
+        """暗槓を除いた枚数の手牌でもn面子1雀頭を判定できることのテスト"""
+        eleven = Hand([Tile(suit="sou", value=value) for value in [2, 3, 4, 5, 6, 7, 8, 8, 8, 9, 9]])
+        broken = Hand([Tile(suit="sou", value=value) for value in [2, 3, 4, 5, 6, 7, 8, 8, 9, 9, 1]])
+        pair = Hand([Tile(suit="sou", value=5), Tile(suit="sou", value=5)])
+
+        assert self.checker.is_complete_hand(eleven)
+        assert not self.checker.is_complete_hand(broken)
+        assert self.checker.is_complete_hand(pair)
+        assert not self.checker.is_complete_hand(Hand(eleven.tiles[:10]))
+
+    def test_winning_cache_hit_and_miss(self) -> None:
+        """和了判定キャッシュのヒット・ミス計測テスト"""
+        hand = self._make_winning_hand()
+
+        assert self.checker.is_winning_hand(hand)
+        assert self.checker.is_winning_hand(hand.copy())
+
+        info = self.checker.cache_info()
+        assert info["misses"] == 1
+        assert info["hits"] == 1
+        assert info["size"] == 1
+
+    def test_winning_cache_max_size(self) -> None:
+        """和了判定キャッシュの最大サイズテスト"""
+        checker = WinningChecker(cache_size=1)
+        winning_hand = self._make_winning_hand()
+        other_hand = Hand([Tile(suit="sou", value=(i % 9) + 1) for i in range(14)])
+
+        checker.is_winning_hand(winning_hand)
+        checker.is_winning_hand(other_hand)
+        assert checker.cache_info()["size"] == 1
+
+        # 古いエントリは追い出されている
+        checker.is_winning_hand(winning_hand)
+        assert checker.cache_info()["misses"] == 3
+
+    def test_winning_cache_invalidate(self) -> None:
+        """和了判定キャッシュの無効化テスト"""
+        hand = self._make_winning_hand()
+        self.checker.is_winning_hand(hand)
+
+        self.checker.invalidate_cache(hand)
+        assert self.checker.cache_info()["size"] == 0
+
+        self.checker.is_winning_hand(hand)
+        self.checker.invalidate_cache()
+        assert self.checker.cache_info() == {"hits": 0, "misses": 0, "size": 0, "max_size": WinningChecker.DEFAULT_CACHE_SIZE}
+
+    def test_winning_cache_disabled(self) -> None:
+        """キャッシュ無効時の和了判定テスト"""
+        checker = WinningChecker(cache_size=0)
+        hand = self._make_winning_hand()
+
+        assert checker.is_winning_hand(hand)
+        assert checker.is_winning_hand(hand)
+        assert checker.cache_info()["size"] == 0
+
+    def test_melds_only_beyond_complete_set(self) -> None:
+        """完全形集合の範囲を超える枚数での面子判定テスト"""
+        # 5面子（15枚）: 1-1-1, 2-3-4, 5-6-7, 8-8-8, 9-9-9
+        tile_counts = {
+            Tile(suit="sou", value=1): 3,
+            Tile(suit="sou", value=2): 1,
+            Tile(suit="sou", value=3): 1,
+            Tile(suit="sou", value=4): 1,
+            Tile(suit="sou", value=5): 1,
+            Tile(suit="sou", value=6): 1,
+            Tile(suit="sou", value=7): 1,
+            Tile(suit="sou", value=8): 3,
+            Tile(suit="sou", value=9): 3,
+        }
+        assert self.checker._check_melds_only(tile_counts)
+
+        tile_counts[Tile(suit="sou", value=5)] = 3
+        assert self.checker._check_winning_form_recursive(tile_counts)